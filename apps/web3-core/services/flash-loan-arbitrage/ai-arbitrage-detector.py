@@ -4,9 +4,11 @@ from typing import List, Dict, Optional
 from dataclasses import dataclass
 import torch
 import torch.nn as nn
-from scipy.optimize import minimize
 from collections import defaultdict
 
+from .cycle_detector import NegativeCycleDetector
+from .optimal_sizing import maximize_profit
+
 @dataclass
 class ArbitrageOpportunity:
     path: List[Dict]
@@ -61,6 +63,9 @@ class ArbitrageOpportunityDetector:
         self.pool_monitor = PoolStateMonitor()
         self.mempool_monitor = MempoolMonitor()
 
+        # Pool graph kept across ticks; only edge weights change while the pool set is stable
+        self.cycle_detector = NegativeCycleDetector(max_length=4)
+
     async def detect_opportunities(
         self,
         prices: Dict[str, float],
@@ -145,30 +150,28 @@ class ArbitrageOpportunityDetector:
         """Find profitable trading paths using graph algorithms"""
         paths = []
         
-        # Build adjacency matrix from pools
-        graph = self._build_graph(pools)
+        # Refresh edge weights (structure is reused when the pool set is unchanged)
+        self.cycle_detector.update(pools)
         
         # Get potential starting tokens
         start_tokens = self._get_high_volume_tokens(pools)
         
-        for start_token in start_tokens:
-            # Use Bellman-Ford to find negative weight cycles
-            cycles = self._find_negative_cycles(
-                graph=graph,
-                start=start_token,
-                prices=prices
+        # Negative weight cycles through any start token, searched in one pass
+        cycles = [
+            cycle.tokens
+            for cycle in self.cycle_detector.find_cycles(sources=start_tokens)
+        ]
+        
+        for cycle in cycles:
+            path_info = self._build_path_info(cycle, pools)
+            
+            # Check mempool for competing transactions
+            competing_txs = await self.mempool_monitor.get_competing_txs(
+                path_info
             )
             
-            for cycle in cycles:
-                path_info = self._build_path_info(cycle, pools)
-                
-                # Check mempool for competing transactions
-                competing_txs = await self.mempool_monitor.get_competing_txs(
-                    path_info
-                )
-                
-                if not competing_txs:
-                    paths.append(path_info)
+            if not competing_txs:
+                paths.append(path_info)
 
         return paths
 
@@ -180,10 +183,9 @@ class ArbitrageOpportunityDetector:
     ) -> float:
         """Calculate optimal trade amount using convex optimization"""
         
-        def objective(amount):
-            """Objective function to maximize profit"""
-            current_amount = amount
-            total_impact = 0
+        def objective(amounts: np.ndarray) -> np.ndarray:
+            """Profit for every candidate amount at once"""
+            current_amount = amounts
             
             for i, step in enumerate(path):
                 pool = pools[i]
@@ -191,24 +193,15 @@ class ArbitrageOpportunityDetector:
                 
                 # Calculate output with slippage
                 slippage = impact_ratio * (current_amount / pool['liquidity'])
-                output = current_amount * (1 - slippage)
-                
-                current_amount = output
-                total_impact += slippage
+                current_amount = current_amount * (1 - slippage)
 
-            # Return negative profit (for minimization)
-            return -(current_amount - amount)
+            return current_amount - amounts
 
-        # Find optimal amount using scipy
-        result = minimize(
-            objective,
-            x0=[1000.0],  # Initial guess
-            bounds=[(100.0, 1000000.0)],  # Min/max amounts
-            method='SLSQP'
-        )
+        # Vectorized bracket-and-refine search over the min/max amounts
+        amount, profit = maximize_profit(objective, low=100.0, high=1000000.0)
 
-        if result.success:
-            return float(result.x[0])
+        if np.isfinite(profit[0]):
+            return float(amount[0])
         else:
             return 0.0
 
@@ -245,64 +238,6 @@ class ArbitrageOpportunityDetector:
                 logger.error(f"Error in opportunity monitor: {str(e)}")
                 await asyncio.sleep(1)
 
-    def _build_graph(self, pools: List[Dict]) -> nx.DiGraph:
-        """Build weighted directed graph from pool data"""
-        G = nx.DiGraph()
-        
-        for pool in pools:
-            token0, token1 = pool['token0'], pool['token1']
-            reserve0, reserve1 = pool['reserve0'], pool['reserve1']
-            
-            # Add forward and reverse edges with weights
-            weight_forward = -np.log(reserve1 / reserve0)
-            weight_reverse = -np.log(reserve0 / reserve1)
-            
-            G.add_edge(token0, token1, 
-                      weight=weight_forward,
-                      pool=pool['address'])
-            G.add_edge(token1, token0, 
-                      weight=weight_reverse,
-                      pool=pool['address'])
-            
-        return G
-
-    def _find_negative_cycles(
-        self,
-        graph: nx.DiGraph,
-        start: str,
-        prices: Dict[str, float]
-    ) -> List[List[str]]:
-        """Find negative cycles using Bellman-Ford"""
-        cycles = []
-        distances = defaultdict(lambda: float('inf'))
-        distances[start] = 0
-        predecessors = {start: None}
-        
-        # Run V-1 iterations
-        for _ in range(len(graph) - 1):
-            for u, v in graph.edges():
-                weight = graph[u][v]['weight']
-                if distances[u] + weight < distances[v]:
-                    distances[v] = distances[u] + weight
-                    predecessors[v] = u
-        
-        # Check for negative cycles
-        for u, v in graph.edges():
-            weight = graph[u][v]['weight']
-            if distances[u] + weight < distances[v]:
-                # Negative cycle found
-                cycle = []
-                current = v
-                for _ in range(len(graph)):
-                    cycle.append(current)
-                    current = predecessors[current]
-                    if current in cycle:
-                        idx = cycle.index(current)
-                        cycles.append(cycle[idx:])
-                        break
-        
-        return cycles
-
     @torch.no_grad()
     def _create_feature_matrix(
         self,
@@ -13,10 +13,15 @@ from .contracts import (
 from .price_feeds import PriceFeedAggregator
 from .gas_oracle import GasOptimizer
 from .defi_pools import LiquidityAggregator
+from .cycle_detector import NegativeCycleDetector
+from .optimal_sizing import DEFAULT_POOL_FEE, constant_product_optimum, maximize_profit
 from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Protocols whose pools follow x * y = k, so trades along them can be sized in closed form
+CONSTANT_PRODUCT_PROTOCOLS = {'uniswap_v2', 'sushiswap', 'pancakeswap', 'quickswap'}
+
 class ArbitrageExecutor:
     def __init__(self, web3: AsyncWeb3):
         self.w3 = web3
@@ -24,6 +29,9 @@ class ArbitrageExecutor:
         self.gas_optimizer = GasOptimizer()
         self.liquidity_agg = LiquidityAggregator()
         
+        # Pool graph kept across polls; only pools whose reserves changed are re-checked
+        self.cycle_detector = NegativeCycleDetector(max_length=4)
+        
         # Load contract ABIs
         self.contracts = get_network_contracts(self.w3.eth.chain_id)
         self.flash_loan_abi = load_contract_abi('FlashLoanArbitrage')
@@ -165,53 +173,133 @@ class ArbitrageExecutor:
                 logger.error(f"Error in opportunity monitor: {str(e)}")
                 await asyncio.sleep(5)  # Back off on error
 
+    def _find_arbitrage_paths(
+        self,
+        tokens: List[str],
+        prices: Dict[str, float],
+        pools: List[Dict]
+    ) -> List[Dict]:
+        """Profitable cycles through the monitored tokens as executable paths"""
+        self.cycle_detector.update(pools)
+        
+        pools_by_address = {pool['address']: pool for pool in pools}
+        opportunities = []
+        for cycle in self.cycle_detector.find_cycles(sources=tokens):
+            hop_pools = [pools_by_address[address] for address in cycle.pools]
+            path = [
+                {
+                    'protocol': pool.get('protocol'),
+                    'pool': pool['address'],
+                    'token_in': token_in,
+                    'token_out': token_out
+                }
+                for pool, token_in, token_out in zip(
+                    hop_pools, cycle.tokens, cycle.tokens[1:] + cycle.tokens[:1]
+                )
+            ]
+            opportunities.append({
+                'path': path,
+                'pools': hop_pools,
+                'rate': cycle.rate
+            })
+        return opportunities
+
     async def _simulate_arbitrage(self, opportunity: Dict) -> Dict:
         """Simulate arbitrage execution to find optimal amounts"""
         pools = opportunity['pools']
         path = opportunity['path']
         
-        # Use binary search to find optimal amount
         min_amount = Decimal('0.1')  # 0.1 token minimum
         max_amount = min(
             Decimal(str(pool['liquidity'])) * Decimal('0.3')  
             for pool in pools
         )  # Max 30% of pool liquidity
         
-        best_profit = Decimal('0')
-        optimal_amount = Decimal('0')
+        if max_amount < min_amount:
+            return {
+                'optimal_amount': Decimal('0'),
+                'profit': Decimal('0')
+            }
         
-        while min_amount <= max_amount:
-            amount = (min_amount + max_amount) / 2
-            
-            # Simulate each swap
-            current_amount = amount
-            for i, hop in enumerate(path):
-                pool = pools[i]
-                output = await self._simulate_swap(
-                    pool=pool,
-                    token_in=hop['token_in'],
-                    token_out=hop['token_out'],
-                    amount_in=current_amount
-                )
-                current_amount = output['amount_out']
-            
-            profit = current_amount - amount
-            
-            if profit > best_profit:
-                best_profit = profit
-                optimal_amount = amount
-                if profit <= 0:
-                    max_amount = amount - Decimal('0.1')
-                else:
-                    min_amount = amount + Decimal('0.1')
-            else:
-                max_amount = amount - Decimal('0.1')
+        if all(pool.get('protocol') in CONSTANT_PRODUCT_PROTOCOLS for pool in pools):
+            # Closed-form optimum of the constant-product chain instead of a binary search
+            token0_in = [hop['token_in'] == pool['token0'] for hop, pool in zip(path, pools)]
+            reserve_in = np.array([[
+                pool['reserve0'] if is_token0 else pool['reserve1']
+                for pool, is_token0 in zip(pools, token0_in)
+            ]], dtype=float)
+            reserve_out = np.array([[
+                pool['reserve1'] if is_token0 else pool['reserve0']
+                for pool, is_token0 in zip(pools, token0_in)
+            ]], dtype=float)
+            fee = np.array([[pool.get('fee', DEFAULT_POOL_FEE) for pool in pools]])
+            amount, _ = constant_product_optimum(
+                reserve_in, reserve_out, fee, max_amount=float(max_amount)
+            )
+            optimal_amount = Decimal(str(float(amount[0])))
+        else:
+            # Curve, Balancer, ... have no closed form: search their own swap simulation
+            optimal_amount = await self._search_optimal_amount(
+                path, pools, float(min_amount), float(max_amount)
+            )
+        
+        if optimal_amount < min_amount:
+            return {
+                'optimal_amount': Decimal('0'),
+                'profit': Decimal('0')
+            }
+        
+        # One pass through the pools' own swap simulation confirms the profit
+        profit = await self._simulate_path(path, pools, optimal_amount) - optimal_amount
+        if profit <= 0:
+            return {
+                'optimal_amount': Decimal('0'),
+                'profit': Decimal('0')
+            }
                 
         return {
             'optimal_amount': optimal_amount,
-            'profit': best_profit
+            'profit': profit
         }
 
+    async def _search_optimal_amount(
+        self,
+        path: List[Dict],
+        pools: List[Dict],
+        min_amount: float,
+        max_amount: float
+    ) -> Decimal:
+        """Vectorized profit search over _simulate_swap, for pools without a closed form"""
+        loop = asyncio.get_running_loop()
+        
+        async def simulate(amounts: np.ndarray) -> List[Decimal]:
+            return await asyncio.gather(*(
+                self._simulate_path(path, pools, Decimal(str(amount))) for amount in amounts
+            ))
+        
+        def profit(amounts: np.ndarray) -> np.ndarray:
+            # Runs in a worker thread; each batch of amounts is simulated concurrently on the loop
+            outputs = asyncio.run_coroutine_threadsafe(simulate(amounts.ravel()), loop).result()
+            return np.array(outputs, dtype=float).reshape(amounts.shape) - amounts
+        
+        amount, _ = await asyncio.to_thread(
+            maximize_profit, profit, min_amount, max_amount, grid=16, iterations=30
+        )
+        return Decimal(str(float(amount[0])))
+
+    async def _simulate_path(self, path: List[Dict], pools: List[Dict], amount: Decimal) -> Decimal:
+        """Output of swapping `amount` through every hop of the path"""
+        current_amount = amount
+        for hop, pool in zip(path, pools):
+            output = await self._simulate_swap(
+                pool=pool,
+                token_in=hop['token_in'],
+                token_out=hop['token_out'],
+                amount_in=current_amount
+            )
+            current_amount = output['amount_out']
+        return current_amount
+
     async def _estimate_gas_cost(self, opportunity: Dict) -> Decimal:
         """Estimate gas cost for arbitrage execution"""
         gas_price = await self.gas_optimizer.get_optimal_gas_price()
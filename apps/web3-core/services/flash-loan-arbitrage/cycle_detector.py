@@ -0,0 +1,342 @@
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .optimal_sizing import DEFAULT_POOL_FEE
+
+@dataclass
+class Cycle:
+    tokens: List[str]  # trade order; the first token is also where the cycle closes
+    pools: List[str]  # pool address used for each hop
+    weight: float  # sum of -log(rate) over the hops; negative means profitable
+    edges: List[int] = field(default_factory=list, repr=False)  # detector edge ids, for rescoring
+
+    @property
+    def rate(self) -> float:
+        """Output per unit of input after one pass around the cycle"""
+        return float(np.exp(-self.weight))
+
+    def key(self) -> Tuple[str, ...]:
+        """Rotation-independent identity of the token cycle"""
+        first = self.tokens.index(min(self.tokens))
+        return tuple(self.tokens[first:] + self.tokens[:first])
+
+    def pool_key(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Rotation-independent identity of the cycle through these exact pools"""
+        first = self.tokens.index(min(self.tokens))
+        return self.key(), tuple(self.pools[first:] + self.pools[:first])
+
+    def rotated(self, start: str) -> 'Cycle':
+        """Same cycle entered at `start`"""
+        i = self.tokens.index(start)
+        return Cycle(
+            tokens=self.tokens[i:] + self.tokens[:i],
+            pools=self.pools[i:] + self.pools[:i],
+            weight=self.weight,
+            edges=self.edges[i:] + self.edges[:i]
+        )
+
+class NegativeCycleDetector:
+    """
+    Bounded-length negative cycle search over pool graphs held as NumPy arrays.
+
+    Each pool contributes two edges weighted -log(rate), so a cycle whose rates
+    multiply to more than 1 has negative total weight. The token index and edge
+    arrays are rebuilt only when the set of pools changes; a tick with the same
+    pools only refreshes edge weights. Parallel pools between the same pair are
+    collapsed to the best-priced one in a dense V x V weight matrix.
+
+    Detection enumerates every simple cycle of up to max_length hops with a
+    vectorized walk expansion over the token adjacency: all partial walks are
+    extended one hop per round as arrays, and a walk closes into a cycle when
+    the edge back to its first token makes the total weight negative. A full
+    scan only extends walks to tokens above their first one, so each cycle is
+    found once. Frontiers larger than max_elements keep only their lightest
+    partial walks; below that bound no profitable cycle is missed.
+
+    Every cycle found is kept as a candidate, indexed by pool, whether or not
+    it is still profitable. When only some pools change reserves (update() with
+    the same pool set, or apply_updates() from swap events), only the
+    candidates through those pools are rescored, and every cycle through the
+    touched edges is enumerated. A block with a few swaps costs a few small
+    updates; a periodic full rescan drops stale candidates.
+    """
+
+    def __init__(
+        self,
+        max_length: int = 4,
+        min_profit: float = 0.0,
+        max_elements: int = 1 << 22,
+        rescan_every: int = 100
+    ):
+        """
+        Args:
+            max_length: Longest cycle searched, in hops.
+            min_profit: Minimum gross return of a cycle (0.001 = 0.1%), before gas.
+            max_elements: Most partial walks kept per expansion round.
+            rescan_every: Incremental updates between full searches (0 never rescans).
+        """
+        self.max_length = max_length
+        self.threshold = -np.log1p(min_profit)
+        self.max_elements = max_elements
+        self.rescan_every = rescan_every
+        self.updates_since_rescan = 0
+
+        self.addresses: List[str] = []
+        self.pool_index: Dict[str, int] = {}
+        self.tokens: List[str] = []
+        self.token_index: Dict[str, int] = {}
+        self.edge_src = np.empty(0, dtype=np.int64)
+        self.edge_dst = np.empty(0, dtype=np.int64)
+        self.edge_pool = np.empty(0, dtype=np.int64)
+        self.edge_pair = np.empty(0, dtype=np.int64)
+        self.pair_order = np.empty(0, dtype=np.int64)
+        self.pair_keys = np.empty(0, dtype=np.int64)
+        self.pair_start = np.empty(0, dtype=np.int64)
+        self.pair_end = np.empty(0, dtype=np.int64)
+        self.adjacency = np.empty(0, dtype=np.int64)
+        self.adjacency_ptr = np.zeros(1, dtype=np.int64)
+        self.edge_weight = np.empty(0)
+        self.reserve0 = np.empty(0)
+        self.reserve1 = np.empty(0)
+        self.fee = np.empty(0)
+        self.weights = np.empty((0, 0))
+        self.best_edge = np.empty((0, 0), dtype=np.int64)
+
+        # Candidate cycles by pool key, the profitable ones, and the candidates using each pool
+        self.candidates: Dict[Tuple, Cycle] = {}
+        self.profitable: Set[Tuple] = set()
+        self.pool_cycles: Dict[str, Set[Tuple]] = {}
+
+    def update(self, pools: List[Dict]) -> bool:
+        """
+        Load the latest state of every pool; returns True if the graph structure was rebuilt.
+        With the same pool set, only the pools whose reserves or fee changed are re-checked.
+        """
+        count = len(pools)
+        reserve0 = np.fromiter((pool['reserve0'] for pool in pools), dtype=float, count=count)
+        reserve1 = np.fromiter((pool['reserve1'] for pool in pools), dtype=float, count=count)
+        fee = np.fromiter((pool.get('fee', DEFAULT_POOL_FEE) for pool in pools), dtype=float, count=count)
+
+        if count != len(self.addresses) or any(
+            pool['address'] != address for pool, address in zip(pools, self.addresses)
+        ):
+            self._build_structure(pools)
+            self._set_reserves(np.arange(count), reserve0, reserve1, fee)
+            self._collapse_edges()
+            self.candidates, self.profitable = {}, set()
+            self.rescan()
+            return True
+
+        changed = np.flatnonzero(
+            (reserve0 != self.reserve0) | (reserve1 != self.reserve1) | (fee != self.fee)
+        )
+        self._apply(changed, reserve0[changed], reserve1[changed], fee[changed])
+        return False
+
+    def apply_updates(self, updates: List[Dict]) -> List[Cycle]:
+        """
+        Apply reserve changes for known pools (e.g. from Sync events) without a full reload.
+        Each update has 'address', 'reserve0', 'reserve1' and optionally 'fee'.
+        Returns the profitable cycles through the updated pools.
+        """
+        unknown = [update['address'] for update in updates if update['address'] not in self.pool_index]
+        if unknown:
+            raise KeyError(f"Unknown pools, reload with update(): {unknown}")
+        idx = np.array([self.pool_index[update['address']] for update in updates], dtype=np.int64)
+        reserve0 = np.array([update['reserve0'] for update in updates], dtype=float)
+        reserve1 = np.array([update['reserve1'] for update in updates], dtype=float)
+        fee = np.array([update.get('fee', self.fee[i]) for update, i in zip(updates, idx)], dtype=float)
+        return self._apply(idx, reserve0, reserve1, fee)
+
+    def find_cycles(self, sources: Optional[Iterable[str]] = None) -> List[Cycle]:
+        """
+        Profitable cycles through the given tokens (all tokens by default), best first.
+        Each token cycle is reported once, through its best pools, entered at the first
+        source it passes through.
+        """
+        best = {}
+        for cycle in sorted((self.candidates[key] for key in self.profitable), key=lambda cycle: cycle.weight):
+            best.setdefault(cycle.key(), cycle)
+        if sources is None:
+            return list(best.values())
+        cycles = {}
+        for source in dict.fromkeys(sources):
+            for key, cycle in best.items():
+                if key not in cycles and source in cycle.tokens:
+                    cycles[key] = cycle.rotated(source)
+        return sorted(cycles.values(), key=lambda cycle: cycle.weight)
+
+    def cycles_for_pool(self, address: str, profitable_only: bool = True) -> List[Cycle]:
+        keys = self.pool_cycles.get(address, ())
+        return [self.candidates[key] for key in keys if not profitable_only or key in self.profitable]
+
+    def _apply(self, idx: np.ndarray, reserve0: np.ndarray, reserve1: np.ndarray, fee: np.ndarray) -> List[Cycle]:
+        if not len(idx):
+            return []
+        self._set_reserves(idx, reserve0, reserve1, fee)
+        edges = np.concatenate([idx, idx + len(self.addresses)])
+        self._collapse_pairs(np.unique(self.edge_pair[edges]))
+
+        touched = {self.addresses[i] for i in idx}
+        # Rescore the candidates through the touched pools, with their own pools
+        for key in set().union(*(self.pool_cycles.get(address, set()) for address in touched)):
+            cycle = self.candidates[key]
+            cycle.weight = float(self.edge_weight[cycle.edges].sum())
+            if cycle.weight < self.threshold:
+                self.profitable.add(key)
+            else:
+                self.profitable.discard(key)
+
+        self.updates_since_rescan += 1
+        if self.rescan_every and self.updates_since_rescan >= self.rescan_every:
+            self.rescan()
+        else:
+            # Any new profitable cycle uses a touched edge (no other weight changed);
+            # a collapsed pair whose best pool moved to another pool counts as touched
+            touched_pairs = np.unique(self.edge_pair[edges])
+            self._enumerate_and_store(touched_pairs[np.isfinite(self.weights.flat[touched_pairs])])
+        keys = set().union(*(self.pool_cycles.get(address, set()) for address in touched)) & self.profitable
+        return sorted((self.candidates[key] for key in keys), key=lambda cycle: cycle.weight)
+
+    def _build_structure(self, pools: List[Dict]):
+        self.addresses = [pool['address'] for pool in pools]
+        self.pool_index = {address: i for i, address in enumerate(self.addresses)}
+        self.token_index = {}
+        for pool in pools:
+            for token in (pool['token0'], pool['token1']):
+                self.token_index.setdefault(token, len(self.token_index))
+        self.tokens = list(self.token_index)
+
+        token0 = np.array([self.token_index[pool['token0']] for pool in pools], dtype=np.int64)
+        token1 = np.array([self.token_index[pool['token1']] for pool in pools], dtype=np.int64)
+        pool_idx = np.arange(len(pools), dtype=np.int64)
+        # Edges 0..P-1 trade token0 -> token1, edges P..2P-1 the reverse
+        self.edge_src = np.concatenate([token0, token1])
+        self.edge_dst = np.concatenate([token1, token0])
+        self.edge_pool = np.concatenate([pool_idx, pool_idx])
+
+        num_tokens = len(self.tokens)
+        self.edge_pair = self.edge_src * num_tokens + self.edge_dst
+        # Edges grouped by (src, dst) pair, so one pair's parallel pools are a contiguous slice
+        self.pair_order = np.argsort(self.edge_pair, kind='stable')
+        self.pair_keys, self.pair_start = np.unique(self.edge_pair[self.pair_order], return_index=True)
+        self.pair_end = np.r_[self.pair_start[1:], len(self.pair_order)]
+        # Token adjacency (CSR over the collapsed pairs) for enumerating cycles through an edge
+        self.adjacency = self.pair_keys % num_tokens
+        self.adjacency_ptr = np.searchsorted(self.pair_keys // num_tokens, np.arange(num_tokens + 1))
+
+        self.reserve0 = np.zeros(len(pools))
+        self.reserve1 = np.zeros(len(pools))
+        self.fee = np.zeros(len(pools))
+        self.edge_weight = np.full(2 * len(pools), np.inf)
+        self.weights = np.full((num_tokens, num_tokens), np.inf)
+        self.best_edge = np.full((num_tokens, num_tokens), -1, dtype=np.int64)
+
+    def _set_reserves(self, idx: np.ndarray, reserve0: np.ndarray, reserve1: np.ndarray, fee: np.ndarray):
+        self.reserve0[idx] = reserve0
+        self.reserve1[idx] = reserve1
+        self.fee[idx] = fee
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_ratio = np.log(reserve1) - np.log(reserve0)
+            fee_cost = -np.log1p(-fee)
+        valid = (reserve0 > 0) & (reserve1 > 0)
+        self.edge_weight[idx] = np.where(valid, -log_ratio + fee_cost, np.inf)
+        self.edge_weight[idx + len(self.addresses)] = np.where(valid, log_ratio + fee_cost, np.inf)
+
+    def _collapse_edges(self):
+        """Keep the lightest edge per (src, dst) pair in the dense matrices"""
+        pair = self.edge_pair
+        usable = (self.edge_src != self.edge_dst) & np.isfinite(self.edge_weight)
+        edges = np.flatnonzero(usable)
+        order = edges[np.lexsort((self.edge_weight[edges], pair[edges]))]
+        first = order[np.r_[True, pair[order][1:] != pair[order][:-1]]] if len(order) else order
+
+        self.weights.fill(np.inf)
+        self.best_edge.fill(-1)
+        self.weights.flat[pair[first]] = self.edge_weight[first]
+        self.best_edge.flat[pair[first]] = first
+
+    def _collapse_pairs(self, pairs: np.ndarray):
+        """Re-pick the lightest edge for the given (src, dst) pairs only"""
+        positions = np.searchsorted(self.pair_keys, pairs)
+        for pair, position in zip(pairs, positions):
+            edges = self.pair_order[self.pair_start[position]:self.pair_end[position]]
+            best = edges[np.argmin(self.edge_weight[edges])]
+            usable = np.isfinite(self.edge_weight[best]) and self.edge_src[best] != self.edge_dst[best]
+            self.weights.flat[pair] = self.edge_weight[best] if usable else np.inf
+            self.best_edge.flat[pair] = best if usable else -1
+
+    def rescan(self):
+        """Full search over every edge; drops candidates that are no longer profitable"""
+        self.candidates = {key: self.candidates[key] for key in self.profitable}
+        self.pool_cycles = {}
+        for key, cycle in self.candidates.items():
+            for address in cycle.pools:
+                self.pool_cycles.setdefault(address, set()).add(key)
+        self.updates_since_rescan = 0
+        self._enumerate_and_store(np.flatnonzero(np.isfinite(self.weights.ravel())), lowest_first=True)
+
+    def _enumerate_and_store(self, pairs: np.ndarray, lowest_first: bool = False):
+        """
+        Keep every profitable simple cycle that starts with one of the given (src, dst) pairs.
+        With lowest_first, walks only visit tokens above their first one, so a pass over every
+        pair finds each cycle exactly once (from its lowest token) instead of once per edge.
+        """
+        num_tokens = len(self.tokens)
+        if not len(pairs) or num_tokens < 2:
+            return
+        pairs = np.asarray(pairs, dtype=np.int64)
+        tails, heads = pairs // num_tokens, pairs % num_tokens
+        if lowest_first:
+            pairs, tails, heads = pairs[heads > tails], tails[heads > tails], heads[heads > tails]
+        walks = np.column_stack([tails, heads])  # every walk closes back to its first token
+        walk_weight = self.weights.flat[pairs]
+        found = []
+        for hops in range(2, self.max_length + 1):
+            closing = walk_weight + self.weights[walks[:, -1], walks[:, 0]]
+            for i in np.flatnonzero(closing < self.threshold):
+                found.append(self._make_cycle(walks[i].tolist(), closing[i]))
+            if hops == self.max_length:
+                break
+
+            # Extend every walk by one hop to a token it has not visited
+            last = walks[:, -1]
+            counts = self.adjacency_ptr[last + 1] - self.adjacency_ptr[last]
+            parent = np.repeat(np.arange(len(walks)), counts)
+            offset = np.arange(len(parent)) - np.repeat(np.cumsum(counts) - counts, counts)
+            nxt = self.adjacency[self.adjacency_ptr[last][parent] + offset]
+            step = walk_weight[parent] + self.weights[walks[parent, -1], nxt]
+            keep = ~(walks[parent] == nxt[:, None]).any(axis=1) & np.isfinite(step)
+            if lowest_first:
+                keep &= nxt > walks[parent, 0]
+            parent, nxt, step = parent[keep], nxt[keep], step[keep]
+            if len(step) > self.max_elements:
+                # Bound the frontier to the lightest partial walks
+                lightest = np.argpartition(step, self.max_elements)[:self.max_elements]
+                parent, nxt, step = parent[lightest], nxt[lightest], step[lightest]
+            walks = np.column_stack([walks[parent], nxt])
+            walk_weight = step
+            if not len(walks):
+                break
+        self._store(found)
+
+    def _store(self, cycles: List[Cycle]):
+        for cycle in cycles:
+            key = cycle.pool_key()
+            if key not in self.candidates:
+                self.candidates[key] = cycle
+                for address in cycle.pools:
+                    self.pool_cycles.setdefault(address, set()).add(key)
+            self.profitable.add(key)
+
+    def _make_cycle(self, tokens: List[int], weight: float) -> Cycle:
+        """Cycle over token ids through the best pool of each hop"""
+        edges = [int(self.best_edge[a, b]) for a, b in zip(tokens, tokens[1:] + tokens[:1])]
+        return Cycle(
+            tokens=[self.tokens[t] for t in tokens],
+            pools=[self.addresses[self.edge_pool[e]] for e in edges],
+            weight=float(weight),
+            edges=edges
+        )
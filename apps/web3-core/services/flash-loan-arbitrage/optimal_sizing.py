@@ -0,0 +1,127 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+# Pool fee assumed when a pool does not report one (Uniswap v2)
+DEFAULT_POOL_FEE = 0.003
+
+# Golden-section step
+INV_PHI = (np.sqrt(5.0) - 1.0) / 2.0
+
+def constant_product_chain(
+    reserve_in: np.ndarray,
+    reserve_out: np.ndarray,
+    fee: np.ndarray,
+    mask: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collapse padded (paths x hops) constant-product hops into one virtual pool per path.
+
+    A hop maps x to g*R_out*x / (R_in + g*x) with g = 1 - fee, and composing two such
+    maps gives another of the same form, so every path reduces to
+    out(x) = rate * x / (1 + slope * x). Padded hops (mask False) are skipped.
+    Returns (rate, slope) arrays of shape (paths,).
+    """
+    reserve_in = np.asarray(reserve_in, dtype=float)
+    reserve_out = np.asarray(reserve_out, dtype=float)
+    gamma = 1.0 - np.broadcast_to(np.asarray(fee, dtype=float), reserve_in.shape)
+    if mask is None:
+        mask = np.ones(reserve_in.shape, dtype=bool)
+
+    paths, hops = reserve_in.shape
+    rate = np.ones(paths)
+    slope = np.zeros(paths)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for hop in range(hops):
+            hop_rate = gamma[:, hop] * reserve_out[:, hop] / reserve_in[:, hop]
+            hop_slope = gamma[:, hop] / reserve_in[:, hop]
+            active = mask[:, hop]
+            # (rate1, slope1) then (rate2, slope2) -> (rate1 * rate2, slope1 + rate1 * slope2)
+            slope = np.where(active, slope + rate * hop_slope, slope)
+            rate = np.where(active, rate * hop_rate, rate)
+    return rate, slope
+
+def constant_product_optimum(
+    reserve_in: np.ndarray,
+    reserve_out: np.ndarray,
+    fee: np.ndarray,
+    mask: Optional[np.ndarray] = None,
+    max_amount: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Profit-maximizing input for each constant-product path, in closed form.
+
+    With out(x) = rate * x / (1 + slope * x), profit out(x) - x peaks at
+    x* = (sqrt(rate) - 1) / slope, and is positive only when rate > 1.
+    Profit is concave, so an optimum above max_amount is clipped to it.
+    Returns (amount_in, profit) arrays; unprofitable paths get zeros.
+    """
+    rate, slope = constant_product_chain(reserve_in, reserve_out, fee, mask)
+    profitable = (rate > 1.0) & np.isfinite(rate) & (slope > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        amount = np.where(profitable, (np.sqrt(rate) - 1.0) / slope, 0.0)
+    if max_amount is not None:
+        amount = np.minimum(amount, max_amount)
+    with np.errstate(invalid='ignore'):
+        profit = np.where(profitable, rate * amount / (1.0 + slope * amount) - amount, 0.0)
+    return amount, profit
+
+def maximize_profit(
+    profit_fn: Callable[[np.ndarray], np.ndarray],
+    low: np.ndarray,
+    high: np.ndarray,
+    grid: int = 32,
+    iterations: int = 40
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized fallback for curves without a closed form.
+
+    profit_fn maps an (paths, n) array of input amounts to profits of the same shape.
+    A log-spaced grid over [low, high] brackets the best amount of every path at once,
+    then golden-section search refines all brackets together (profit is assumed
+    unimodal within the bracket). Returns (amount_in, profit) arrays of shape (paths,).
+    """
+    low = np.atleast_1d(np.asarray(low, dtype=float))
+    high = np.atleast_1d(np.asarray(high, dtype=float))
+    low, high = np.broadcast_arrays(low, high)
+    paths = len(low)
+
+    # Log spacing covers amounts spanning several orders of magnitude; a zero low end uses linear
+    positive = low > 0
+    fraction = np.linspace(0.0, 1.0, grid)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_grid = low[:, None] * (high / np.where(positive, low, 1.0))[:, None] ** fraction
+    lin_grid = low[:, None] + (high - low)[:, None] * fraction
+    candidates = np.where(positive[:, None], log_grid, lin_grid)
+
+    profits = profit_fn(candidates)
+    best = np.argmax(np.where(np.isfinite(profits), profits, -np.inf), axis=1)
+    rows = np.arange(paths)
+    left = candidates[rows, np.maximum(best - 1, 0)]
+    right = candidates[rows, np.minimum(best + 1, grid - 1)]
+
+    inner_left = right - INV_PHI * (right - left)
+    inner_right = left + INV_PHI * (right - left)
+    profit_left = profit_fn(inner_left[:, None])[:, 0]
+    profit_right = profit_fn(inner_right[:, None])[:, 0]
+    for _ in range(iterations):
+        go_left = profit_left > profit_right
+        right = np.where(go_left, inner_right, right)
+        left = np.where(go_left, left, inner_left)
+        # The surviving inner point is reused; only one new evaluation per path per step
+        new_point = np.where(go_left, right - INV_PHI * (right - left), left + INV_PHI * (right - left))
+        new_profit = profit_fn(new_point[:, None])[:, 0]
+        inner_left, inner_right, profit_left, profit_right = (
+            np.where(go_left, new_point, inner_right),
+            np.where(go_left, inner_left, new_point),
+            np.where(go_left, new_profit, profit_right),
+            np.where(go_left, profit_left, new_profit)
+        )
+
+    amount = (left + right) / 2.0
+    profit = profit_fn(amount[:, None])[:, 0]
+    # Keep the grid point if refinement did not improve on it (e.g. optimum at a bound)
+    grid_profit = profits[rows, best]
+    use_grid = ~(profit >= grid_profit)
+    amount = np.where(use_grid, candidates[rows, best], amount)
+    profit = np.where(use_grid, grid_profit, profit)
+    return amount, profit
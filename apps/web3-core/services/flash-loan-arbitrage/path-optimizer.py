@@ -1,6 +1,10 @@
 import numpy as np
-from scipy.optimize import minimize
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
+
+from .optimal_sizing import maximize_profit
+
+class OptimizationError(Exception):
+    """Raised when no flash loan amount can be optimized for a path"""
 
 class ArbitragePathOptimizer:
     def __init__(self):
@@ -13,45 +17,98 @@ class ArbitragePathOptimizer:
         pool_liquidities: List[float]
     ) -> float:
         """Calculate optimal flash loan amount for maximum profit"""
+        fees = np.array([[step['fee'] for step in steps]], dtype=float)
+        liquidities = np.array([pool_liquidities], dtype=float)
+        if not liquidities.min() > 0:
+            raise OptimizationError("No liquidity on path")
         
-        def objective(amount: float) -> float:
-            """Objective function to maximize profit"""
-            current_amount = amount
-            total_fees = 0
-            
-            # Simulate each swap in path
-            for i, step in enumerate(steps):
-                # Calculate price impact
-                price_impact = self.price_impact_model.calculate_impact(
-                    amount=current_amount,
-                    liquidity=pool_liquidities[i]
-                )
-                
-                # Calculate output amount after fees and slippage
-                output = current_amount * (1 - step['fee']) * (1 - price_impact)
-                current_amount = output
-                
-                total_fees += step['fee'] * current_amount
-            
-            # Calculate profit (final amount - initial amount - fees - gas)
-            estimated_gas = self.gas_optimizer.estimate_gas_cost(len(steps))
-            profit = current_amount - amount - total_fees - estimated_gas
+        return float(self.calculate_optimal_amounts(fees, liquidities)[0])
+
+    def calculate_optimal_amounts(
+        self,
+        fees: np.ndarray,
+        liquidities: np.ndarray,
+        mask: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Optimal flash loan amount for every padded (paths x hops) path at once"""
+        if mask is None:
+            mask = np.ones(fees.shape, dtype=bool)
+        # Can't use more than pool liquidity
+        max_amount = np.where(mask, liquidities, np.inf).min(axis=1)
+        
+        # Gas depends only on the hop count
+        hop_counts = mask.sum(axis=1)
+        gas_by_hops = {
+            int(hops): self.gas_optimizer.estimate_gas_cost(int(hops))
+            for hops in np.unique(hop_counts)
+        }
+        estimated_gas = np.array([gas_by_hops[int(hops)] for hops in hop_counts], dtype=float)
+        
+        def profit(amounts: np.ndarray) -> np.ndarray:
+            """Profit (final amount - initial amount - fees - gas) for every candidate amount"""
+            simulation = self.simulate_paths(fees, liquidities, amounts, mask)
+            total_fees = (fees[:, None, :] * simulation['amount_out']).sum(axis=-1)
+            return simulation['profit'] - total_fees - estimated_gas[:, None]
+        
+        # Grid bracket plus golden-section refinement over all paths together
+        amounts, _ = maximize_profit(profit, low=max_amount * 1e-9, high=max_amount)
+        return amounts
+
+    def simulate_paths(
+        self,
+        fees: np.ndarray,
+        liquidities: np.ndarray,
+        amounts: np.ndarray,
+        mask: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Simulate many paths and amounts in one call.
+        
+        fees and liquidities are padded (paths x hops) arrays, with mask marking the
+        real hops; amounts is (paths,) or (paths, n) candidate inputs per path.
+        Returns arrays: per-hop amount_in, amount_out and price_impact with a trailing
+        hops axis, and final_amount, total_fees and profit shaped like amounts.
+        """
+        fees = np.asarray(fees, dtype=float)
+        liquidities = np.asarray(liquidities, dtype=float)
+        amounts = np.asarray(amounts, dtype=float)
+        if mask is None:
+            mask = np.ones(fees.shape, dtype=bool)
+        single = amounts.ndim == 1
+        if single:
+            amounts = amounts[:, None]
+        
+        hops = fees.shape[1]
+        amount_in = np.zeros(amounts.shape + (hops,))
+        amount_out = np.zeros(amounts.shape + (hops,))
+        price_impact = np.zeros(amounts.shape + (hops,))
+        current_amount = amounts
+        for hop in range(hops):
+            active = mask[:, hop, None]
+            # Padded hops see a dummy liquidity of 1; their results are masked out
+            liquidity = np.where(mask[:, hop], liquidities[:, hop], 1.0)[:, None]
+            impact = self.price_impact_model.calculate_impact(
+                amount=current_amount,
+                liquidity=liquidity
+            )
+            output = current_amount * (1 - fees[:, hop, None]) * (1 - impact)
             
-            # Return negative profit for minimization
-            return -profit
-        
-        # Find optimal amount using scipy
-        result = minimize(
-            objective,
-            x0=[pool_liquidities[0] * 0.1],  # Initial guess: 10% of first pool
-            bounds=[(0, min(pool_liquidities))],  # Can't use more than pool liquidity
-            method='SLSQP'
-        )
+            amount_in[..., hop] = np.where(active, current_amount, 0.0)
+            amount_out[..., hop] = np.where(active, output, 0.0)
+            price_impact[..., hop] = np.where(active, impact, 0.0)
+            current_amount = np.where(active, output, current_amount)
         
-        if result.success:
-            return float(result.x[0])
-        else:
-            raise OptimizationError("Failed to find optimal amount")
+        result = {
+            'amount_in': amount_in,
+            'amount_out': amount_out,
+            'price_impact': price_impact,
+            'final_amount': current_amount,
+            'total_fees': (fees[:, None, :] * amount_in).sum(axis=-1),
+            'profit': current_amount - amounts
+        }
+        if single:
+            result = {key: value[:, 0] for key, value in result.items()}
+        return result
 
     def find_optimal_path(
         self,
@@ -67,104 +124,104 @@ class ArbitragePathOptimizer:
             end_token=end_token,
             max_hops=max_hops
         )
+        if not paths:
+            return None
+        
+        # Size and score every candidate in one pass
+        fees, liquidities, mask = self._pad_paths(paths)
+        usable = np.where(mask, liquidities, np.inf).min(axis=1) > 0
+        optimal_amounts = np.zeros(len(paths))
+        if usable.any():
+            optimal_amounts[usable] = self.calculate_optimal_amounts(
+                fees[usable], liquidities[usable], mask[usable]
+            )
         
-        best_path = None
-        best_profit = 0
-        
-        # Evaluate each path
-        for path in paths:
-            try:
-                # Calculate optimal amount for this path
-                optimal_amount = self.calculate_optimal_amount(
-                    steps=path['steps'],
-                    pool_liquidities=[p['liquidity'] for p in path['pools']]
-                )
-                
-                # Simulate execution with optimal amount
-                simulation = self.simulate_path(
-                    path=path,
-                    amount=optimal_amount
-                )
-                
-                if simulation['expected_profit'] > best_profit:
-                    best_profit = simulation['expected_profit']
-                    best_path = path
-                    
-            except OptimizationError:
-                continue
-                
-        return best_path
+        # Simulate execution with optimal amounts
+        simulation = self.simulate_paths(fees, liquidities, optimal_amounts, mask)
+        profits = np.where(usable, simulation['profit'], -np.inf)
+        
+        best = int(np.argmax(profits))
+        return paths[best] if profits[best] > 0 else None
 
     def simulate_path(self, path: Dict, amount: float) -> Dict:
         """Simulate execution of a specific path"""
-        current_amount = amount
-        steps_data = []
+        fees, liquidities, mask = self._pad_paths([path])
+        simulation = self.simulate_paths(fees, liquidities, np.array([amount], dtype=float), mask)
         
-        for i, step in enumerate(path['steps']):
-            # Get pool data
-            pool = path['pools'][i]
-            
-            # Calculate expected output
-            price_impact = self.price_impact_model.calculate_impact(
-                amount=current_amount,
-                liquidity=pool['liquidity']
-            )
-            
-            output_amount = current_amount * (1 - step['fee']) * (1 - price_impact)
-            
-            steps_data.append({
+        steps_data = [
+            {
                 'pool': step['protocol'],
                 'token_in': step['token_in'],
                 'token_out': step['token_out'],
-                'amount_in': current_amount,
-                'amount_out': output_amount,
-                'price_impact': price_impact,
+                'amount_in': float(simulation['amount_in'][0, i]),
+                'amount_out': float(simulation['amount_out'][0, i]),
+                'price_impact': float(simulation['price_impact'][0, i]),
                 'fee': step['fee']
-            })
-            
-            current_amount = output_amount
+            }
+            for i, step in enumerate(path['steps'])
+        ]
             
         return {
             'path': path,
             'steps': steps_data,
             'initial_amount': amount,
-            'final_amount': current_amount,
-            'expected_profit': current_amount - amount,
-            'total_price_impact': sum(s['price_impact'] for s in steps_data),
-            'total_fees': sum(s['fee'] * s['amount_in'] for s in steps_data)
+            'final_amount': float(simulation['final_amount'][0]),
+            'expected_profit': float(simulation['profit'][0]),
+            'total_price_impact': float(simulation['price_impact'][0].sum()),
+            'total_fees': float(simulation['total_fees'][0])
         }
 
+    def _pad_paths(self, paths: List[Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Fees, liquidities and real-hop mask of the paths as (paths x max hops) arrays"""
+        hops = max(len(path['steps']) for path in paths)
+        fees = np.zeros((len(paths), hops))
+        liquidities = np.ones((len(paths), hops))
+        mask = np.zeros((len(paths), hops), dtype=bool)
+        for i, path in enumerate(paths):
+            count = len(path['steps'])
+            fees[i, :count] = [step['fee'] for step in path['steps']]
+            liquidities[i, :count] = [pool['liquidity'] for pool in path['pools'][:count]]
+            mask[i, :count] = True
+        return fees, liquidities, mask
+
 class PriceImpactModel:
     """ML model to predict price impact of trades"""
     
-    def calculate_impact(self, amount: float, liquidity: float) -> float:
-        """Calculate expected price impact"""
+    def calculate_impact(
+        self,
+        amount: Union[float, np.ndarray],
+        liquidity: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """Calculate expected price impact (amount may be an array)"""
         # Use square root formula as baseline
         baseline_impact = np.sqrt(amount / liquidity)
         
         # Apply ML adjustments based on historical data
         adjusted_impact = self.apply_ml_adjustments(baseline_impact, amount, liquidity)
         
-        return min(adjusted_impact, 0.99)  # Cap at 99% impact
+        return np.minimum(adjusted_impact, 0.99)  # Cap at 99% impact
         
     def apply_ml_adjustments(
         self, 
-        baseline_impact: float, 
-        amount: float, 
-        liquidity: float
-    ) -> float:
+        baseline_impact: Union[float, np.ndarray], 
+        amount: Union[float, np.ndarray], 
+        liquidity: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         # Apply ML model predictions
         # This would use our trained model to adjust the baseline
         return baseline_impact * self.get_ml_multiplier(amount, liquidity)
         
-    def get_ml_multiplier(self, amount: float, liquidity: float) -> float:
+    def get_ml_multiplier(
+        self,
+        amount: Union[float, np.ndarray],
+        liquidity: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
         """Get ML-based adjustment multiplier"""
         # In practice, this would use our trained model
         # For now, using a simplified heuristic
-        utilization = amount / liquidity
-        if utilization < 0.1:
-            return 0.9  # Lower impact for small trades
-        elif utilization < 0.3:
-            return 1.0  # Baseline impact
-        else:
-            return 1.2  # Higher impact for large trades
+        utilization = np.asarray(amount / liquidity)
+        return np.select(
+            [utilization < 0.1, utilization < 0.3],
+            [0.9, 1.0],  # Lower impact for small trades, baseline impact
+            default=1.2  # Higher impact for large trades
+        )[()]
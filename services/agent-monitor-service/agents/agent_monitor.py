@@ -1,4 +1,4 @@
-import requests
+from services.common.http_client import http_client
 import threading
 import time
 
@@ -12,7 +12,7 @@ class AgentMonitor:
 
     def get_agent_status(self, agent_endpoint):
         try:
-            response = requests.get(f"{agent_endpoint}/status")
+            response = http_client.get(f"{agent_endpoint}/status")
             if response.status_code == 200:
                 return response.json()
             else:
@@ -4,6 +4,8 @@ import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 from services.common.agent_client import AgentClient
+from services.common.indicator_cache import indicator_cache
+from services.common.ohlcv_store import ohlcv_store
 from services.indicators.indicator_library import (
     calculate_macd, calculate_rsi, calculate_bollinger_bands,
     identify_support_resistance, calculate_volume_profile
@@ -49,11 +51,17 @@ class TechnicalPatternAgent:
     async def handle_pattern_scan(self, data: Dict) -> Dict:
         """Handle pattern scanning requests"""
         try:
-            df = pd.DataFrame(data['market_data'])
             timeframe = data.get('timeframe', '1h')
+            symbol = data.get('symbol')
+            venue = data.get('venue')
+            if 'market_data' in data or venue is None:
+                df = pd.DataFrame(data['market_data'])
+            else:
+                # Read candles synced by crypto-data-service from the shared store
+                df = ohlcv_store.frame(venue, symbol, timeframe, limit=data.get('limit', 500))
             
             # Parallel pattern detection
-            patterns = await self._detect_patterns(df, timeframe)
+            patterns = await self._detect_patterns(df, timeframe, symbol)
             
             # Filter and rank patterns
             valid_patterns = self._validate_patterns(patterns, df)
@@ -75,17 +83,20 @@ class TechnicalPatternAgent:
             })
             raise
 
-    async def _detect_patterns(self, df: pd.DataFrame, timeframe: str) -> List[PatternResult]:
+    async def _detect_patterns(self, df: pd.DataFrame, timeframe: str, symbol: str = None) -> List[PatternResult]:
         """Detect multiple technical patterns in parallel"""
         patterns = []
         
-        # Calculate key indicators
+        # Calculate key indicators (memoized per symbol/timeframe in the shared cache)
+        def cached(name, compute):
+            return indicator_cache.get(df, name, compute, symbol=symbol, timeframe=timeframe)
+
         indicators = {
-            'macd': calculate_macd(df['close']),
-            'rsi': calculate_rsi(df['close']),
-            'bbands': calculate_bollinger_bands(df['close']),
-            'sup_res': identify_support_resistance(df['high'], df['low']),
-            'volume_profile': calculate_volume_profile(df['close'], df['volume'])
+            'macd': cached('macd', lambda d: calculate_macd(d['close'])),
+            'rsi': cached('rsi', lambda d: calculate_rsi(d['close'])),
+            'bbands': cached('bbands', lambda d: calculate_bollinger_bands(d['close'])),
+            'sup_res': cached('sup_res', lambda d: identify_support_resistance(d['high'], d['low'])),
+            'volume_profile': cached('volume_profile', lambda d: calculate_volume_profile(d['close'], d['volume']))
         }
         
         # Pattern detection logic
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_cross_market_dynamic_leverage_optimizer.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Cross-Market Dynamic Leverage Optimizer
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_cross_market_liquidity_risk_monitor.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Cross-Market Liquidity Risk Monitor
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_dynamic_position_scaling_engine.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Dynamic Position Scaling Engine
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_dynamic_risk_exposure_calculator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Dynamic Risk Exposure Calculator
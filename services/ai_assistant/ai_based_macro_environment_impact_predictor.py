@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_macro_environment_impact_predictor.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Macro Environment Impact Predictor
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_market_impact_forecasting_engine.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Market Impact Forecasting Engine
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_multi_asset_correlation_monitor.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Multi-Asset Correlation Monitor
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_multi_asset_smart_portfolio_risk_monitor.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Multi-Asset Smart Portfolio Risk Monitor
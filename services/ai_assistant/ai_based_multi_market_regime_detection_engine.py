@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_multi_market_regime_detection_engine.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Multi-Market Regime Detection Engine
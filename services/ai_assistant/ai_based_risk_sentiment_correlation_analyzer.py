@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_risk_sentiment_correlation_analyzer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Risk Sentiment Correlation Analyzer
@@ -1,4 +1,4 @@
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 class AIBasedSentimentAnalysisEngine:
     def __init__(self):
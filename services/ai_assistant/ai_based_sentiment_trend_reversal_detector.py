@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_sentiment_trend_reversal_detector.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Sentiment Trend Reversal Detector
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_smart_leverage_allocation_engine.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Smart Leverage Allocation Engine
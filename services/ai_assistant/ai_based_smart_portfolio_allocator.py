@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_smart_portfolio_allocator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Smart Portfolio Allocator
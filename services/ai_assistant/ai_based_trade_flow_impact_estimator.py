@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_trade_flow_impact_estimator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Trade Flow Impact Estimator
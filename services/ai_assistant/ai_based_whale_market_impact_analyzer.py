@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_whale_market_impact_analyzer.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Whale Market Impact Analyzer
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_whale_sentiment_divergence_tracker.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Whale Sentiment Divergence Tracker
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_based_whale_wallet_movement_predictor.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Whale Wallet Movement Predictor
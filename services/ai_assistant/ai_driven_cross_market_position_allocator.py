@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_cross_market_position_allocator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Driven Cross-Market Position Allocator
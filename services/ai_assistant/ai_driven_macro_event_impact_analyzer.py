@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_macro_event_impact_analyzer.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Driven Macro Event Impact Analyzer
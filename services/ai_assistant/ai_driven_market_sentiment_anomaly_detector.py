@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_market_sentiment_anomaly_detector.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Driven Market Sentiment Anomaly Detector
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_market_trend_reversal_detector.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Driven Market Trend Reversal Detector
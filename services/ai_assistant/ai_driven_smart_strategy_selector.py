@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_smart_strategy_selector.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Driven Smart Strategy Selector
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_driven_social_sentiment_divergence_analyzer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Driven Social Sentiment Divergence Analyzer
@@ -1,4 +1,4 @@
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 class AIDrivenSystemicRiskEvaluationEngine:
     def __init__(self):
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_powered_dynamic_trade_route_optimizer.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Powered Dynamic Trade Route Optimizer
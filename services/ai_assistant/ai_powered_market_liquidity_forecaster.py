@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_powered_market_liquidity_forecaster.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Powered Market Liquidity Forecaster
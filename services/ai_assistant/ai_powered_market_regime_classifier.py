@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_powered_market_regime_classifier.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Powered Market Regime Classifier
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_powered_smart_entry_point_generator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 class AISmartEntryPointGenerator:
     def __init__(self):
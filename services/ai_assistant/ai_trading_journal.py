@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_trading_journal.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Powered Trading Journal
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/ai_trading_pattern_risk_analyzer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Trading Pattern Risk Analyzer
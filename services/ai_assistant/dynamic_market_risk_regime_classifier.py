@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/dynamic_market_risk_regime_classifier.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 Dynamic Market Risk Regime Classifier
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/market_condition_predictor.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Market Condition Predictor
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/market_forecasting_agent.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Driven Market Forecasting Agent
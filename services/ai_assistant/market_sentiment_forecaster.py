@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/market_sentiment_forecaster.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 AI-Based Market Sentiment Forecaste
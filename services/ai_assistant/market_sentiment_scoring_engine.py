@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/market_sentiment_scoring_engine.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 Market Sentiment Scoring Engine
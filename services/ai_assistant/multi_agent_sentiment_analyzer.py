@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/multi_agent_sentiment_analyzer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 Multi-Agent Market Sentiment Analyzer
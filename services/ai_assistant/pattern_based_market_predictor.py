@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/pattern_based_market_predictor.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 Pattern-Based Market Predictor
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/smart_alpha_generator.py
 
-from transformers import pipeline
+from services.common.inference_client import pipeline
 
 """
 Smart Alpha Generator for Crypto Assets
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/ai_assistant/trading_pattern_classifier.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Trading Pattern Classifier
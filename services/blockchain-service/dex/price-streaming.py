@@ -1,11 +1,13 @@
-from fastapi import FastAPI, WebSocket
-from typing import Dict, List
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
+from typing import Dict, List, Optional, Set
 import asyncio
 import aiohttp
 import json
 from web3 import Web3
 from gql import gql, Client
 from gql.transport.aiohttp import AIOHTTPTransport
+from services.common.head_tracker import get_head_tracker
 
 app = FastAPI()
 
@@ -19,51 +21,97 @@ UNISWAP_QUERY = gql("""
     }
 """)
 
+# Uniswap pool 24h volume
+POOL_DAY_DATA_QUERY = gql("""
+    query GetPoolDayData($poolId: ID!) {
+        poolDayData(id: $poolId) {
+            volumeUSD
+        }
+    }
+""")
+
 class DEXPriceStreamer:
-    def __init__(self):
+    """
+    One producer loop fetches every source once per interval and broadcasts the
+    result to all connected clients, so upstream load does not grow with the
+    number of clients. The producer runs only while at least one client is
+    subscribed; its GraphQL and HTTP sessions stay open between fetches. Each
+    client has a one-slot queue: a slow client skips to the latest update
+    instead of holding back the others.
+    """
+
+    def __init__(self, interval: float = 5):
         # WETH-USDC pools
         self.uniswap_pool_id = "0x8ad599c3a0ff1de082011efddc58f1908eb6e6d8"
         self.curve_pool_addr = "0xD51a44d3FaE010294C616388b506AcdA1bfAAE46"
         self.balancer_pool_id = "0x5c6ee304399dbdb9c8ef030ab642b10820db8f56"
+        self.interval = interval
         
         # Initialize web3 and contract connections
         self.w3 = Web3(Web3.HTTPProvider('http://localhost:8545'))
+        # Shared head poller: block timestamps come from memory
+        self.head = get_head_tracker(self.w3)
         
-        # Initialize GraphQL client for Uniswap
-        self.uni_transport = AIOHTTPTransport(
-            url='https://api.thegraph.com/subgraphs/name/uniswap/uniswap-v3'
+        # Initialize GraphQL client for Uniswap; the schema is fetched on the first
+        # connect and kept on the client, and the session stays open between fetches
+        self.uni_client = Client(
+            transport=AIOHTTPTransport(
+                url='https://api.thegraph.com/subgraphs/name/uniswap/uniswap-v3'
+            ),
+            fetch_schema_from_transport=True,
         )
+        self.uni_session = None
+        self.http_session: Optional[aiohttp.ClientSession] = None
+
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.producer: Optional[asyncio.Task] = None
+        self.latest: Optional[str] = None
+        self.stats = {'fetches': 0, 'errors': 0, 'broadcasts': 0, 'dropped': 0}
+
+    async def _connect(self):
+        if self.http_session is None or self.http_session.closed:
+            self.http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=15),
+            )
+        if self.uni_session is None:
+            self.uni_session = await self.uni_client.connect_async()
+
+    async def close(self):
+        if self.producer is not None:
+            self.producer.cancel()
+            self.producer = None
+        if self.uni_session is not None:
+            self.uni_session = None
+            await self.uni_client.close_async()
+        if self.http_session is not None:
+            await self.http_session.close()
+            self.http_session = None
         
     async def get_uniswap_price(self) -> float:
-        async with Client(
-            transport=self.uni_transport,
-            fetch_schema_from_transport=True,
-        ) as session:
-            result = await session.execute(
-                UNISWAP_QUERY,
-                variable_values={"poolId": self.uniswap_pool_id}
-            )
-            return float(result["pool"]["token0Price"])
+        result = await self.uni_session.execute(
+            UNISWAP_QUERY,
+            variable_values={"poolId": self.uniswap_pool_id}
+        )
+        return float(result["pool"]["token0Price"])
 
     async def get_curve_price(self) -> float:
         # Using Curve's price oracle
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.curve.fi/api/getPools/ethereum"
-            ) as response:
-                data = await response.json()
-                for pool in data["data"]["poolData"]:
-                    if pool["address"].lower() == self.curve_pool_addr.lower():
-                        return float(pool["usdPrice"])
+        async with self.http_session.get(
+            f"https://api.curve.fi/api/getPools/ethereum"
+        ) as response:
+            data = await response.json()
+            for pool in data["data"]["poolData"]:
+                if pool["address"].lower() == self.curve_pool_addr.lower():
+                    return float(pool["usdPrice"])
         return 0
 
     async def get_balancer_price(self) -> float:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                f"https://api.balancer.fi/pools/{self.balancer_pool_id}"
-            ) as response:
-                data = await response.json()
-                return float(data["price"])
+        async with self.http_session.get(
+            f"https://api.balancer.fi/pools/{self.balancer_pool_id}"
+        ) as response:
+            data = await response.json()
+            return float(data["price"])
 
     async def get_volume_data(self) -> Dict[str, float]:
         # Aggregate 24h volume from all DEXes
@@ -75,18 +123,11 @@ class DEXPriceStreamer:
         
         try:
             # Get Uniswap volume
-            async with Client(
-                transport=self.uni_transport,
-                fetch_schema_from_transport=True,
-            ) as session:
-                result = await session.execute(gql("""
-                    query GetPoolDayData($poolId: ID!) {
-                        poolDayData(id: $poolId) {
-                            volumeUSD
-                        }
-                    }
-                """), variable_values={"poolId": self.uniswap_pool_id})
-                volumes["uniswap"] = float(result["poolDayData"]["volumeUSD"])
+            result = await self.uni_session.execute(
+                POOL_DAY_DATA_QUERY,
+                variable_values={"poolId": self.uniswap_pool_id}
+            )
+            volumes["uniswap"] = float(result["poolDayData"]["volumeUSD"])
                 
             # Get other volumes...
             # (Similar implementation for Curve and Balancer)
@@ -96,45 +137,125 @@ class DEXPriceStreamer:
             
         return volumes
 
+    async def get_block_timestamp(self) -> int:
+        block = self.head.head()
+        if block is None:
+            # First poll goes through web3's blocking HTTP provider; keep it off the event loop
+            block = await asyncio.get_running_loop().run_in_executor(None, self.head.latest)
+        return block['timestamp']
+
+    async def fetch_prices(self) -> Dict:
+        # Gather all price and volume data concurrently
+        uniswap_price, curve_price, balancer_price, volumes, timestamp = await asyncio.gather(
+            self.get_uniswap_price(),
+            self.get_curve_price(),
+            self.get_balancer_price(),
+            self.get_volume_data(),
+            self.get_block_timestamp()
+        )
+        
+        # Calculate aggregate volume
+        total_volume = sum(volumes.values())
+        
+        return {
+            "timestamp": timestamp,
+            "uniswap": uniswap_price,
+            "curve": curve_price,
+            "balancer": balancer_price,
+            "volume": total_volume,
+            "volumes": volumes
+        }
+
+    def subscribe(self) -> asyncio.Queue:
+        """
+        Register a client and start the producer if it is the first one.
+        The queue yields JSON messages, starting with the latest one if any.
+        """
+        queue = asyncio.Queue(maxsize=1)
+        if self.latest is not None:
+            queue.put_nowait(self.latest)
+        self.subscribers.add(queue)
+        if self.producer is None or self.producer.done():
+            self.producer = asyncio.create_task(self._produce())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers and self.producer is not None:
+            self.producer.cancel()
+            self.producer = None
+
+    def broadcast(self, message: str):
+        self.latest = message
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()  # slow client: replace its pending update with the newest
+                self.stats['dropped'] += 1
+            queue.put_nowait(message)
+        self.stats['broadcasts'] += 1
+
+    async def _produce(self):
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        try:
+            while self.subscribers:
+                try:
+                    await self._connect()
+                    data = await self.fetch_prices()
+                    self.stats['fetches'] += 1
+                    self.broadcast(json.dumps(data))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    print(f"Error in price stream: {e}")
+
+                # Stream every interval, measured from the previous tick
+                next_tick = max(next_tick + self.interval, loop.time())
+                await asyncio.sleep(next_tick - loop.time())
+        finally:
+            self.latest = None
+
     async def stream_prices(self, websocket: WebSocket):
         await websocket.accept()
-        
-        while True:
-            try:
-                # Gather all price and volume data concurrently
-                uniswap_price, curve_price, balancer_price, volumes = await asyncio.gather(
-                    self.get_uniswap_price(),
-                    self.get_curve_price(),
-                    self.get_balancer_price(),
-                    self.get_volume_data()
-                )
-                
-                # Calculate aggregate volume
-                total_volume = sum(volumes.values())
-                
-                data = {
-                    "timestamp": self.w3.eth.get_block('latest').timestamp,
-                    "uniswap": uniswap_price,
-                    "curve": curve_price,
-                    "balancer": balancer_price,
-                    "volume": total_volume,
-                    "volumes": volumes
-                }
-                
-                await websocket.send_text(json.dumps(data))
-                
-                # Stream every 5 seconds
-                await asyncio.sleep(5)
-                
-            except Exception as e:
-                print(f"Error in price stream: {e}")
-                break
+        queue = self.subscribe()
+        # Watch the socket while waiting for updates, so a client that leaves while
+        # fetches are failing is dropped without waiting for the next send
+        closed = asyncio.create_task(self._wait_disconnect(websocket))
+        update = None
+        try:
+            while True:
+                update = asyncio.create_task(queue.get())
+                done, _ = await asyncio.wait({update, closed}, return_when=asyncio.FIRST_COMPLETED)
+                if closed in done:
+                    closed.result()  # re-raise a receive error, if any
+                    break
+                await websocket.send_text(update.result())
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            print(f"Error in price stream: {e}")
+        finally:
+            closed.cancel()
+            if update is not None:
+                update.cancel()
+            self.unsubscribe(queue)
                 
-        await websocket.close()
+        if websocket.client_state == WebSocketState.CONNECTED:
+            await websocket.close()
+
+    @staticmethod
+    async def _wait_disconnect(websocket: WebSocket):
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass  # clients only listen; ignore anything they send
 
 # Initialize the streamer
 price_streamer = DEXPriceStreamer()
 
+@app.on_event("shutdown")
+async def close_price_streamer():
+    await price_streamer.close()
+
 @app.websocket("/dex-stream")
 async def websocket_endpoint(websocket: WebSocket):
     await price_streamer.stream_prices(websocket)
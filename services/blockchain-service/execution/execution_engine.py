@@ -14,6 +14,7 @@ from ..ml.arbitrage.training.impact_trainer import ImpactModelTrainer
 from ..utils.gas import GasOptimizer
 from ..utils.logger import get_logger
 from ..monitoring import AlertSystem
+from services.common.head_tracker import HeadTracker, get_head_tracker
 
 logger = get_logger(__name__)
 
@@ -27,9 +28,12 @@ class SmartExecutionEngine:
         alert_system: AlertSystem,
         min_profit_threshold: float = 100.0,  # $100 minimum profit
         max_slippage: float = 0.02,  # 2% max slippage
-        confidence_threshold: float = 0.8  # 80% confidence minimum
+        confidence_threshold: float = 0.8,  # 80% confidence minimum
+        head_tracker: Optional[HeadTracker] = None
     ):
         self.w3 = web3
+        # Latest block lookups are served from the shared head tracker
+        self.head_tracker = head_tracker or get_head_tracker(web3)
         self.impact_predictor = impact_predictor
         self.trainer = trainer
         self.gas_optimizer = gas_optimizer
@@ -126,8 +130,8 @@ class SmartExecutionEngine:
     ) -> float:
         """Find optimal timing for trade execution"""
         # Get current block timing
-        block_time = await self.w3.eth.get_block('latest')
-        next_block_time = block_time['timestamp'] + 12  # Assume 12s block time
+        block_time = await self.head_tracker.alatest()
+        next_block_time = block_time['timestamp'] + self.head_tracker.block_time()  # ~12s block time
         
         # Check mempool congestion
         mempool_density = await self._analyze_mempool(opportunity['path'])
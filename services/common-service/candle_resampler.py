@@ -0,0 +1,102 @@
+# services/common/candle_resampler.py
+# Derives higher-timeframe candles from a stored 1m base series, incrementally.
+
+import re
+from typing import Dict, Iterable
+
+import numpy as np
+
+from services.common.ohlcv_store import BAR_DTYPE, OHLCVStore, ohlcv_store
+
+BASE_TIMEFRAME = '1m'
+DERIVED_TIMEFRAMES = ('5m', '15m', '1h', '4h', '1d')
+
+_UNITS = {'m': 60_000, 'h': 3_600_000, 'd': 86_400_000}
+
+
+def timeframe_ms(timeframe: str) -> int:
+    """
+    Length of a timeframe such as '15m', '4h' or '1d' in milliseconds.
+    """
+    match = re.fullmatch(r'(\d+)([mhd])', timeframe)
+    if not match:
+        raise ValueError(f"Unsupported timeframe for resampling: {timeframe}")
+    return int(match.group(1)) * _UNITS[match.group(2)]
+
+
+def resample(bars: np.ndarray, timeframe: str, drop_partial_head: bool = False) -> np.ndarray:
+    """
+    Aggregate base bars (BAR_DTYPE, oldest first) into `timeframe` candles aligned to UTC epoch boundaries.
+    Args:
+        drop_partial_head: Drop the first candle if the base series starts after its boundary.
+    """
+    if not len(bars):
+        return np.empty(0, dtype=BAR_DTYPE)
+    step = timeframe_ms(timeframe)
+    buckets = bars['timestamp'] // step * step
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(bars)] - 1
+
+    candles = np.empty(len(starts), dtype=BAR_DTYPE)
+    candles['timestamp'] = buckets[starts]
+    candles['open'] = bars['open'][starts]
+    candles['high'] = np.maximum.reduceat(bars['high'], starts)
+    candles['low'] = np.minimum.reduceat(bars['low'], starts)
+    candles['close'] = bars['close'][ends]
+    candles['volume'] = np.add.reduceat(bars['volume'], starts)
+
+    if drop_partial_head and bars['timestamp'][0] != candles['timestamp'][0]:
+        candles = candles[1:]
+    return candles
+
+
+class CandleResampler:
+    """
+    Keeps derived-timeframe partitions in the OHLCV store current from the base
+    partition. Each update re-aggregates only the base bars from the newest
+    derived candle onward (that candle may still be forming), so every base bar
+    that closes updates all higher timeframes without another exchange fetch.
+    A candle the base series only partly covers is left to the exchange.
+    """
+
+    def __init__(self, store: OHLCVStore = ohlcv_store, base_timeframe: str = BASE_TIMEFRAME):
+        self.store = store
+        self.base_timeframe = base_timeframe
+
+    def update(self, venue: str, symbol: str, timeframe: str) -> int:
+        """
+        Bring one derived timeframe up to date; returns the number of new candles.
+        """
+        last = self.store.last_timestamp(venue, symbol, timeframe)
+        bars = self.store.read(venue, symbol, self.base_timeframe, start=last)
+        # A candle is only rebuilt when the base series covers it from its first minute,
+        # so a complete candle seeded from the exchange is never replaced by a partial one
+        candles = resample(bars, timeframe, drop_partial_head=True)
+        return self.store.append(venue, symbol, timeframe, candles.tolist())
+
+    def update_all(self, venue: str, symbol: str, timeframes: Iterable[str] = DERIVED_TIMEFRAMES) -> Dict[str, int]:
+        return {timeframe: self.update(venue, symbol, timeframe) for timeframe in timeframes}
+
+    def sync(self, exchange, symbol: str, timeframes: Iterable[str] = DERIVED_TIMEFRAMES,
+             limit: int = 500, min_interval: float = 0) -> Dict[str, int]:
+        """
+        One base-series download from the exchange, then every derived timeframe updated from it.
+        Derived timeframes are seeded from the exchange, and their newest candle keeps being
+        re-fetched until the base series covers its whole bucket (a 1d candle needs 1440 1m bars).
+        """
+        venue = exchange.id
+        self.store.sync(exchange, symbol, self.base_timeframe, limit=limit, min_interval=min_interval)
+        base_start = self.store.first_timestamp(venue, symbol, self.base_timeframe)
+        for timeframe in timeframes:
+            last = self.store.last_timestamp(venue, symbol, timeframe)
+            if last is None or base_start is None or base_start > last:
+                self.store.sync(exchange, symbol, timeframe, limit=limit)
+        return self.update_all(venue, symbol, timeframes)
+
+
+# Process-wide resampler over the shared store
+candle_resampler = CandleResampler()
+
+# Example Usage:
+# candle_resampler.sync(ccxt.binance(), "BTC/USDT")                 # one 1m fetch, 5m..1d derived locally
+# ohlcv_store.frame("binance", "BTC/USDT", "4h", limit=200)
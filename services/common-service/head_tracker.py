@@ -0,0 +1,292 @@
+# services/common/head_tracker.py
+# Shared chain-head tracker: one poller per node watches new blocks and serves
+# latest block, timestamp and base fee lookups from a ring of recent headers.
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+HEAD_POLL_INTERVAL = float(os.getenv("HEAD_POLL_INTERVAL", "2"))  # seconds between block number checks
+HEAD_RING_SIZE = int(os.getenv("HEAD_RING_SIZE", "64"))
+HEAD_STALE_POLLS = 3  # missed polls after which readers check the node themselves
+
+# EIP-1559 base fee adjustment
+BASE_FEE_CHANGE_DENOMINATOR = 8
+ELASTICITY_MULTIPLIER = 2
+
+
+class HeadTracker:
+    """
+    Follows the chain head of one node. The poller asks for the block number
+    and fetches the blocks it has not seen, backfilling skipped heights so the
+    ring stays contiguous. When the number has not moved it re-reads the block
+    at that height, since the head may have been replaced by a sibling. On a
+    reorg it walks back to the fork point and replaces the stale blocks.
+    Readers never call the node while the head is fresh; once it is older than
+    a few poll intervals (node outage) they refresh it themselves, so a failing
+    node raises instead of serving an arbitrarily old block.
+
+    Works with a blocking Web3 (poller thread, start()) or an AsyncWeb3 (poller
+    task, run()); the node only needs eth.block_number and eth.get_block, so a
+    local stub node can stand in for it.
+    """
+
+    def __init__(self, web3, ring_size: int = HEAD_RING_SIZE, poll_interval: float = HEAD_POLL_INTERVAL,
+                 max_age: Optional[float] = None):
+        """
+        Args:
+            web3: Web3 or AsyncWeb3 instance (or any object with the same eth methods).
+            ring_size: Number of recent blocks kept.
+            poll_interval: Seconds between head checks.
+            max_age: Seconds after which latest() re-checks the node (default: HEAD_STALE_POLLS polls).
+        """
+        self.w3 = web3
+        self.ring: deque = deque(maxlen=ring_size)
+        self.poll_interval = poll_interval
+        self.max_age = max_age if max_age is not None else HEAD_STALE_POLLS * poll_interval
+        self.updated_at = 0.0
+        self.stats = {'polls': 0, 'blocks': 0, 'reorgs': 0, 'errors': 0}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._task: Optional[asyncio.Task] = None
+
+    # --- reads -----------------------------------------------------------
+
+    def head(self) -> Optional[Any]:
+        """
+        Newest known block, or None before the first poll. Never calls the node.
+        """
+        with self._lock:
+            return self.ring[-1] if self.ring else None
+
+    def latest(self) -> Any:
+        """
+        Newest block; starts the poller thread on first use and waits for the first head.
+        A head older than max_age is refreshed first, so node errors are raised.
+        """
+        if self.head() is None or self.age() > self.max_age:
+            self.start()
+            self.refresh()
+        return self.head()
+
+    async def alatest(self) -> Any:
+        """
+        Newest block for AsyncWeb3 callers; starts the poller task on first use.
+        A head older than max_age is refreshed first, so node errors are raised.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+        if self.head() is None or self.age() > self.max_age:
+            await self.arefresh()
+        return self.head()
+
+    def block(self, number: int) -> Optional[Any]:
+        with self._lock:
+            if not self.ring or not self.ring[0]['number'] <= number <= self.ring[-1]['number']:
+                return None
+            return self.ring[number - self.ring[0]['number']]
+
+    def blocks(self) -> List[Any]:
+        """
+        Recent blocks, oldest first.
+        """
+        with self._lock:
+            return list(self.ring)
+
+    def timestamp(self) -> Optional[int]:
+        head = self.head()
+        return head['timestamp'] if head is not None else None
+
+    def base_fee(self) -> Optional[int]:
+        head = self.head()
+        return head.get('baseFeePerGas') if head is not None else None
+
+    def next_base_fee(self) -> Optional[int]:
+        """
+        Base fee of the next block from the head's gas usage (EIP-1559).
+        """
+        head = self.head()
+        if head is None or head.get('baseFeePerGas') is None:
+            return None
+        base_fee, target = head['baseFeePerGas'], head['gasLimit'] // ELASTICITY_MULTIPLIER
+        delta = head['gasUsed'] - target
+        if delta > 0:
+            return base_fee + max(base_fee * delta // target // BASE_FEE_CHANGE_DENOMINATOR, 1)
+        return base_fee - base_fee * -delta // target // BASE_FEE_CHANGE_DENOMINATOR
+
+    def block_time(self, default: float = 12.0) -> float:
+        """
+        Average seconds between the blocks in the ring.
+        """
+        with self._lock:
+            if len(self.ring) < 2:
+                return default
+            first, last = self.ring[0], self.ring[-1]
+        return (last['timestamp'] - first['timestamp']) / (last['number'] - first['number'])
+
+    def age(self) -> float:
+        """
+        Seconds since the head was last confirmed by the node.
+        """
+        return time.monotonic() - self.updated_at if self.updated_at else float('inf')
+
+    # --- polling ---------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """
+        One blocking head check; returns True if the head moved.
+        """
+        self.stats['polls'] += 1
+        number = self.w3.eth.block_number
+        missing = self._missing(number)
+        if missing is None:
+            # Same height: the head may have been replaced by a sibling (one-block reorg)
+            blocks = [self.w3.eth.get_block(number)]
+            if self._is_head(blocks[0]):
+                return False
+        else:
+            blocks = [self.w3.eth.get_block(n) for n in missing]
+        while self._forked(blocks):
+            blocks.insert(0, self.w3.eth.get_block(blocks[0]['number'] - 1))
+        return self._ingest(blocks)
+
+    async def arefresh(self) -> bool:
+        """
+        One head check through an AsyncWeb3; returns True if the head moved.
+        """
+        self.stats['polls'] += 1
+        number = await self.w3.eth.block_number
+        missing = self._missing(number)
+        if missing is None:
+            # Same height: the head may have been replaced by a sibling (one-block reorg)
+            blocks = [await self.w3.eth.get_block(number)]
+            if self._is_head(blocks[0]):
+                return False
+        else:
+            blocks = list(await asyncio.gather(*(self.w3.eth.get_block(n) for n in missing)))
+        while self._forked(blocks):
+            blocks.insert(0, await self.w3.eth.get_block(blocks[0]['number'] - 1))
+        return self._ingest(blocks)
+
+    def start(self):
+        """
+        Start the poller thread (blocking Web3). Safe to call more than once.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._poll, name="head-tracker", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def run(self):
+        """
+        Poll through an AsyncWeb3 until stop() is called.
+        """
+        while not self._stop.is_set():
+            try:
+                await self.arefresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Head poll failed: {e}")
+            await asyncio.sleep(self.poll_interval)
+
+    def _poll(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(f"Head poll failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    def _missing(self, number: int) -> Optional[List[int]]:
+        """
+        Block numbers to fetch to bring the ring up to `number`, or None if it already is.
+        """
+        with self._lock:
+            self.updated_at = time.monotonic()
+            last = self.ring[-1]['number'] if self.ring else None
+        if last == number:
+            return None
+        if last is None or number < last:
+            return [number]
+        # Backfill skipped heights, but never more than the ring holds
+        return list(range(max(last + 1, number - self.ring.maxlen + 1), number + 1))
+
+    def _is_head(self, block: Any) -> bool:
+        with self._lock:
+            return bool(self.ring) and self.ring[-1]['hash'] == block['hash']
+
+    def _forked(self, blocks: List[Any]) -> bool:
+        """
+        True if the oldest fetched block's parent is a held block it does not match,
+        i.e. the fetch must walk back to the fork point.
+        """
+        with self._lock:
+            parent = self.ring[blocks[0]['number'] - 1 - self.ring[0]['number']] if self.ring \
+                and self.ring[0]['number'] < blocks[0]['number'] <= self.ring[-1]['number'] + 1 else None
+        return parent is not None and parent['hash'] != blocks[0]['parentHash']
+
+    def _ingest(self, blocks: List[Any]) -> bool:
+        moved = False
+        with self._lock:
+            for block in blocks:
+                if self.ring and self.ring[0]['number'] <= block['number'] <= self.ring[-1]['number'] \
+                        and self.ring[block['number'] - self.ring[0]['number']]['hash'] == block['hash']:
+                    continue  # already held (concurrent refresh)
+                reorg = False
+                # A block at or below the ring's head replaces those heights
+                while self.ring and self.ring[-1]['number'] >= block['number']:
+                    self.ring.pop()
+                    reorg = True
+                if self.ring and self.ring[-1]['number'] != block['number'] - 1:
+                    # Gap wider than the ring: nothing held is replaced, the ring just restarts
+                    self.ring.clear()
+                elif self.ring and self.ring[-1]['hash'] != block['parentHash']:
+                    # Parent is not the block we hold: the older blocks are stale too
+                    self.ring.clear()
+                    reorg = True
+                self.stats['reorgs'] += reorg
+                self.ring.append(block)
+                self.stats['blocks'] += 1
+                moved = True
+            self.updated_at = time.monotonic()
+        return moved
+
+
+_trackers: Dict[Any, HeadTracker] = {}
+_trackers_guard = threading.Lock()
+
+
+def get_head_tracker(web3, **kwargs) -> HeadTracker:
+    """
+    Process-wide tracker for the node behind `web3`; instances talking to the
+    same endpoint share one poller.
+    """
+    endpoint = getattr(web3.provider, 'endpoint_uri', None) or id(web3)
+    key = (endpoint, inspect.iscoroutinefunction(web3.eth.get_block))
+    with _trackers_guard:
+        if key not in _trackers:
+            _trackers[key] = HeadTracker(web3, **kwargs)
+        return _trackers[key]
+
+# Example Usage:
+# head = get_head_tracker(Web3(Web3.HTTPProvider("http://localhost:8545")))
+# block = head.latest()                     # first call polls, later calls are served from memory
+# head.timestamp(), head.base_fee(), head.next_base_fee(), head.block_time()
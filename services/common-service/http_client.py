@@ -0,0 +1,366 @@
+# services/common/http_client.py
+# Shared HTTP client: pooled keep-alive connections, per-host rate limits, bounded
+# retries with jitter, ETag / Cache-Control response caching and latency histograms.
+# One instance serves both blocking callers (get/post) and coroutines (aget/apost).
+
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from services.common.rate_budget import RateBudget
+
+logger = logging.getLogger(__name__)
+
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "10"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "3"))
+HTTP_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "20"))  # keep-alive connections per host
+HTTP_DEFAULT_RATE = float(os.getenv("HTTP_DEFAULT_RATE", "0"))  # requests/second per host, 0 disables
+HTTP_CACHE_ENTRIES = int(os.getenv("HTTP_CACHE_ENTRIES", "1024"))
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+@dataclass
+class HttpResponse:
+    """
+    Transport-independent response (same fields the callers used on requests.Response).
+    """
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    url: str
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.HTTPError(f"{self.status_code} for url: {self.url}")
+
+
+@dataclass
+class _CacheEntry:
+    response: HttpResponse
+    expires: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class LatencyHistogram:
+    counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    total_ms: float = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.total_ms += ms
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Upper bucket bound containing the q-th percentile (None above the last bucket or when empty).
+        """
+        n = sum(self.counts)
+        if not n:
+            return None
+        running = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS + (None,), self.counts):
+            running += count
+            if running >= q / 100 * n:
+                return bound
+        return None
+
+    def summary(self) -> Dict:
+        n = sum(self.counts)
+        return {
+            'count': n,
+            'mean_ms': round(self.total_ms / n, 2) if n else None,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'p99_ms': self.percentile(99),
+            'buckets': dict(zip([f"<={b}" for b in LATENCY_BUCKETS_MS] + ['>10000'], self.counts)),
+        }
+
+
+def _cache_policy(headers: Dict[str, str]) -> Tuple[bool, float]:
+    """
+    (storable, max_age seconds) from Cache-Control.
+    """
+    directives = headers.get('Cache-Control', '').lower()
+    if 'no-store' in directives or 'private' in directives:
+        return False, 0.0
+    if 'no-cache' in directives:
+        return True, 0.0
+    match = re.search(r's-maxage=(\d+)', directives) or re.search(r'max-age=(\d+)', directives)
+    return True, float(match.group(1)) if match else 0.0
+
+
+class HttpClient:
+    def __init__(self, timeout: float = HTTP_TIMEOUT, retries: int = HTTP_RETRIES, pool_size: int = HTTP_POOL_SIZE,
+                 default_rate: float = HTTP_DEFAULT_RATE, cache_entries: int = HTTP_CACHE_ENTRIES,
+                 backoff: float = 0.5, max_backoff: float = 10.0):
+        """
+        Args:
+            timeout: Default request timeout in seconds.
+            retries: Retries after the first attempt for connection errors and 429/5xx.
+            pool_size: Keep-alive connections kept per host.
+            default_rate: Requests per second per host unless set_rate_limit overrides it (0 disables).
+            cache_entries: Cached GET responses kept (LRU).
+            backoff: Base delay of the exponential backoff; each delay is drawn uniformly below it (full jitter).
+        """
+        self.timeout = timeout
+        self.retries = retries
+        self.default_rate = default_rate
+        self.cache_entries = cache_entries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.pool_size = pool_size
+        # aiohttp session per event loop, keyed by the loop itself (ids are reused after a loop is freed)
+        self._async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+        self.rate_limits: Dict[str, Tuple[float, int]] = {}
+        self.budgets: Dict[str, RateBudget] = {}
+        self.cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.stats = {'requests': 0, 'retries': 0, 'cache_hits': 0, 'revalidated': 0, 'errors': 0}
+        self._lock = threading.Lock()
+
+    # Configuration and metrics
+
+    def set_rate_limit(self, host: str, rate: float, burst: int = 1):
+        with self._lock:
+            self.rate_limits[host] = (rate, burst)
+            self.budgets.pop(host, None)
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {**self.stats, 'cached': len(self.cache),
+                    'latency': {host: histogram.summary() for host, histogram in self.latency.items()}}
+
+    # Sync face
+
+    def get(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, **kwargs) -> HttpResponse:
+        return self.request('GET', url, params=params, headers=headers, **kwargs)
+
+    def post(self, url: str, json: Any = None, data: Any = None, headers: Optional[Dict] = None, **kwargs) -> HttpResponse:
+        return self.request('POST', url, json=json, data=data, headers=headers, **kwargs)
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                timeout: Optional[float] = None, retries: Optional[int] = None, cache: bool = True,
+                **kwargs) -> HttpResponse:
+        method = method.upper()
+        host, key, headers, cached = self._prepare(method, url, params, headers, cache)
+        if cached is not None and cached.expires > time.monotonic():
+            return self._hit(cached)
+
+        retries = self.retries if retries is None else retries
+        for attempt in range(retries + 1):
+            self._wait_sync(host)
+            started = time.monotonic()
+            try:
+                raw = self.session.request(method, url, params=params, headers=headers,
+                                           timeout=timeout or self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._observe(host, started)
+                delay = self._retry_delay(method, attempt, retries, None)
+                if delay is None:
+                    self._count('errors')
+                    raise
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            self._observe(host, started)
+            response = HttpResponse(raw.status_code, dict(raw.headers), raw.content, raw.url)
+            delay = self._retry_delay(method, attempt, retries, response)
+            if delay is None:
+                return self._finish(key, cached, response)
+            time.sleep(delay)
+
+    # Async face
+
+    async def aget(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None, **kwargs) -> HttpResponse:
+        return await self.arequest('GET', url, params=params, headers=headers, **kwargs)
+
+    async def apost(self, url: str, json: Any = None, data: Any = None, headers: Optional[Dict] = None,
+                    **kwargs) -> HttpResponse:
+        return await self.arequest('POST', url, json=json, data=data, headers=headers, **kwargs)
+
+    async def arequest(self, method: str, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None,
+                       timeout: Optional[float] = None, retries: Optional[int] = None, cache: bool = True,
+                       **kwargs) -> HttpResponse:
+        import aiohttp
+
+        method = method.upper()
+        host, key, headers, cached = self._prepare(method, url, params, headers, cache)
+        if cached is not None and cached.expires > time.monotonic():
+            return self._hit(cached)
+
+        session = self._async_session()
+        retries = self.retries if retries is None else retries
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+        for attempt in range(retries + 1):
+            wait = self._budget(host).reserve(float('inf')) if self._has_budget(host) else 0
+            if wait:
+                await asyncio.sleep(wait)
+            started = time.monotonic()
+            try:
+                async with session.request(method, url, params=params, headers=headers,
+                                           timeout=client_timeout, **kwargs) as raw:
+                    response = HttpResponse(raw.status, dict(raw.headers), await raw.read(), str(raw.url))
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self._observe(host, started)
+                delay = self._retry_delay(method, attempt, retries, None)
+                if delay is None:
+                    self._count('errors')
+                    raise
+                logger.warning(f"{method} {url} failed ({e}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            self._observe(host, started)
+            delay = self._retry_delay(method, attempt, retries, response)
+            if delay is None:
+                return self._finish(key, cached, response)
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        for session in list(self._async_sessions.values()):
+            await session.close()
+        self._async_sessions.clear()
+
+    def _async_session(self):
+        # aiohttp sessions are bound to the loop that created them
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            # A session holds its loop, so entries of closed loops are dropped here rather than by GC
+            for closed in [other for other in self._async_sessions if other.is_closed()]:
+                del self._async_sessions[closed]
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_size, keepalive_timeout=60)
+            session = self._async_sessions[loop] = aiohttp.ClientSession(connector=connector)
+        return session
+
+    # Shared request plumbing
+
+    def _prepare(self, method, url, params, headers, cache):
+        host = urlsplit(url).netloc
+        headers = dict(headers or {})
+        if method != 'GET' or not cache:
+            return host, None, headers, None
+        key = url + ('?' + urlencode(sorted((params or {}).items()), doseq=True) if params else '')
+        if headers:
+            key += '|' + repr(sorted(headers.items()))
+        with self._lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+        if cached is not None and cached.expires <= time.monotonic():
+            # Stale: revalidate with the validators we have
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+        return host, key, headers, cached
+
+    def _hit(self, cached: _CacheEntry) -> HttpResponse:
+        self._count('cache_hits')
+        response = cached.response
+        return HttpResponse(response.status_code, response.headers, response.content, response.url, from_cache=True)
+
+    def _finish(self, key: Optional[str], cached: Optional[_CacheEntry], response: HttpResponse) -> HttpResponse:
+        self._count('requests')
+        if key is None:
+            return response
+        if response.status_code == 304 and cached is not None:
+            self._count('revalidated')
+            _, max_age = _cache_policy(response.headers)
+            cached.expires = time.monotonic() + max_age
+            return self._hit(cached)
+        if response.status_code == 200:
+            storable, max_age = _cache_policy(response.headers)
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if storable and (max_age or etag or last_modified):
+                with self._lock:
+                    self.cache[key] = _CacheEntry(response, time.monotonic() + max_age, etag, last_modified)
+                    self.cache.move_to_end(key)
+                    while len(self.cache) > self.cache_entries:
+                        self.cache.popitem(last=False)
+        return response
+
+    def _retry_delay(self, method: str, attempt: int, retries: int, response: Optional[HttpResponse]) -> Optional[float]:
+        """
+        Seconds to wait before retrying, or None if the result should be returned (or raised) as is.
+        """
+        if attempt >= retries or method not in IDEMPOTENT_METHODS:
+            return None
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            return None
+        self._count('retries')
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def _has_budget(self, host: str) -> bool:
+        return host in self.rate_limits or self.default_rate > 0
+
+    def _budget(self, host: str) -> RateBudget:
+        with self._lock:
+            if host not in self.budgets:
+                rate, burst = self.rate_limits.get(host, (self.default_rate, 1))
+                self.budgets[host] = RateBudget(rate, burst)
+            return self.budgets[host]
+
+    def _wait_sync(self, host: str):
+        if self._has_budget(host):
+            wait = self._budget(host).reserve(float('inf'))
+            if wait:
+                time.sleep(wait)
+
+    def _observe(self, host: str, started: float):
+        with self._lock:
+            self.latency.setdefault(host, LatencyHistogram()).observe((time.monotonic() - started) * 1000)
+
+    def _count(self, stat: str):
+        with self._lock:
+            self.stats[stat] += 1
+
+
+# Process-wide client
+http_client = HttpClient()
+
+# Example Usage:
+# http_client.set_rate_limit("api.etherscan.io", rate=5)
+# http_client.get("https://api.coingecko.com/api/v3/coins/markets", params={"vs_currency": "usd"}).json()
+# await http_client.aget("http://localhost:5002/crypto-data")
+# http_client.metrics()['latency']
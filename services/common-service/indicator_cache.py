@@ -0,0 +1,217 @@
+# services/common/indicator_cache.py
+# Process-wide memoized indicator cache shared by strategies, agents and services.
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+
+
+@dataclass
+class _CacheEntry:
+    length: int
+    last_bar: Tuple
+    kind: str
+    value: Any = None
+    columns: List[np.ndarray] = field(default_factory=list)
+    names: List[Hashable] = field(default_factory=list)
+    stream: Any = None
+    nbytes: int = 0
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results keyed by (series, timeframe, indicator, params).
+
+    An entry is reused while the candles are unchanged (same length and same
+    last bar). When bars were only appended and an incremental counterpart is
+    supplied (anything with seed(data) and update_bar(bar), e.g. the streaming
+    indicators), the new bars are fed to it instead of recomputing the history.
+    Anything else is recomputed. Entries are evicted least-recently-used once
+    either max_entries or max_bytes is exceeded.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: "OrderedDict[Tuple, _CacheEntry]" = OrderedDict()
+        self.total_bytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'extensions': 0, 'evictions': 0}
+        self._lock = threading.RLock()
+
+    def get(self,
+            data: pd.DataFrame,
+            indicator: str,
+            compute: Callable[[pd.DataFrame], Any],
+            params: Optional[Dict] = None,
+            symbol: Optional[Hashable] = None,
+            timeframe: Optional[str] = None,
+            incremental: Optional[Callable[[], Any]] = None):
+        """
+        Return the indicator for `data`, computing it only when needed.
+        Args:
+            data: OHLCV candles, oldest first.
+            indicator: Indicator name.
+            compute: Full computation, called with the whole frame on a miss.
+            params: Indicator parameters (part of the key, values must be hashable).
+            symbol: Series identity; when omitted the first bar identifies the series.
+            timeframe: Candle timeframe (part of the key).
+            incremental: Constructor of a streaming counterpart used to extend on append.
+        """
+        length = len(data)
+        if length == 0:
+            return compute(data)
+
+        series_id = symbol if symbol is not None else ('anonymous', _bar_id(data, 0))
+        key = (series_id, timeframe, indicator, tuple(sorted((params or {}).items())))
+        last_bar = _bar_id(data, length - 1)
+
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                if entry.length == length and entry.last_bar == last_bar:
+                    self.entries.move_to_end(key)
+                    self.stats['hits'] += 1
+                    return _materialize(entry, data)
+                if (incremental is not None and entry.kind != 'opaque' and entry.length < length
+                        and entry.last_bar == _bar_id(data, entry.length - 1)):
+                    if self._extend(entry, data, incremental):
+                        self.entries.move_to_end(key)
+                        self.stats['extensions'] += 1
+                        self._store(key, entry)
+                        return _materialize(entry, data)
+
+            self.stats['misses'] += 1
+            entry = _make_entry(compute(data), length, last_bar)
+            self._store(key, entry)
+            return _materialize(entry, data)
+
+    def invalidate(self, symbol: Optional[Hashable] = None):
+        """
+        Drop all entries for `symbol`, or everything when symbol is None.
+        """
+        with self._lock:
+            for key in [k for k in self.entries if symbol is None or k[0] == symbol]:
+                self.total_bytes -= self.entries.pop(key).nbytes
+
+    def clear(self):
+        self.invalidate()
+
+    def _extend(self, entry: _CacheEntry, data: pd.DataFrame, incremental: Callable[[], Any]) -> bool:
+        if entry.stream is None:
+            entry.stream = incremental()
+            entry.stream.seed(data.iloc[:entry.length])
+
+        present = [c for c in OHLCV_COLUMNS if c in data.columns]
+        new_bars = {c: data[c].to_numpy(dtype=np.float64)[entry.length:] for c in present}
+        rows = []
+        for i in range(len(data) - entry.length):
+            value = entry.stream.update_bar({c: new_bars[c][i] for c in present})
+            rows.append(list(value.values()) if isinstance(value, dict) else [value])
+
+        if any(len(row) != len(entry.columns) for row in rows):
+            # Streaming outputs don't line up with the cached result; fall back to recompute
+            return False
+
+        new_values = np.asarray(rows, dtype=np.float64).reshape(len(rows), len(entry.columns))
+        for n, column in enumerate(entry.columns):
+            entry.columns[n] = _append(column, entry.length, new_values[:, n])
+        entry.length = len(data)
+        entry.last_bar = _bar_id(data, entry.length - 1)
+        return True
+
+    def _store(self, key: Tuple, entry: _CacheEntry):
+        previous = self.entries.get(key)
+        if previous is not None:
+            self.total_bytes -= previous.nbytes
+        entry.nbytes = _entry_size(entry)
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        self.total_bytes += entry.nbytes
+
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.nbytes
+            self.stats['evictions'] += 1
+
+
+def _bar_id(data: pd.DataFrame, position: int) -> Tuple:
+    """
+    Identity of one bar: its timestamp (column or index label) and OHLCV values.
+    """
+    stamp = data['timestamp'].iat[position] if 'timestamp' in data.columns else data.index[position]
+    return (stamp,) + tuple(data[c].iat[position] for c in OHLCV_COLUMNS if c in data.columns)
+
+
+def _make_entry(result: Any, length: int, last_bar: Tuple) -> _CacheEntry:
+    """
+    Store Series/arrays (or tuples of them) as growable float columns so they
+    can be extended in place; anything else is kept as an opaque value.
+    """
+    parts = result if isinstance(result, tuple) else (result,)
+    if all(isinstance(p, (pd.Series, np.ndarray)) and np.ndim(p) == 1 and len(p) == length for p in parts):
+        columns = [np.array(p) for p in parts]
+        if all(column.dtype.kind in 'biuf' for column in columns):
+            kind = ('tuple_' if isinstance(result, tuple) else '') + \
+                   ('series' if isinstance(parts[0], pd.Series) else 'array')
+            names = [getattr(p, 'name', None) for p in parts]
+            return _CacheEntry(length, last_bar, kind, columns=columns, names=names)
+    return _CacheEntry(length, last_bar, 'opaque', value=result)
+
+
+def _materialize(entry: _CacheEntry, data: pd.DataFrame):
+    if entry.kind == 'opaque':
+        return entry.value
+    views = [column[:entry.length] for column in entry.columns]
+    for view in views:
+        # Callers share the cached buffers, so hand them out read-only
+        view.flags.writeable = False
+    if entry.kind.endswith('series'):
+        views = [pd.Series(view, index=data.index, name=name, copy=False) for view, name in zip(views, entry.names)]
+    return tuple(views) if entry.kind.startswith('tuple_') else views[0]
+
+
+def _append(column: np.ndarray, length: int, values: np.ndarray) -> np.ndarray:
+    """
+    Append into spare capacity, doubling the buffer when it is full.
+    """
+    needed = length + len(values)
+    if needed > len(column):
+        grown = np.empty(max(needed, 2 * len(column)), dtype=column.dtype)
+        grown[:length] = column[:length]
+        column = grown
+    column[length:needed] = values
+    return column
+
+
+def _entry_size(entry: _CacheEntry) -> int:
+    if entry.kind != 'opaque':
+        return sum(column.nbytes for column in entry.columns)
+    return _sizeof(entry.value)
+
+
+def _sizeof(value: Any) -> int:
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (pd.Series, pd.DataFrame)):
+        return int(np.sum(value.memory_usage(index=False)))
+    if isinstance(value, dict):
+        return sum(_sizeof(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_sizeof(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# Process-wide cache
+indicator_cache = IndicatorCache()
+
+# Example Usage:
+# rsi = indicator_cache.get(df, 'RSI', lambda d: talib.RSI(d['close'], timeperiod=14),
+#                           params={'timeperiod': 14}, symbol='BTC/USDT', timeframe='1h',
+#                           incremental=lambda: StreamingRSI(14))
@@ -0,0 +1,71 @@
+# services/common/inference_client.py
+# Thin client for the shared inference service. `pipeline(task, model=...)` mirrors
+# transformers.pipeline, but returns a proxy that forwards calls to the service
+# instead of loading the model in this process.
+
+import os
+import time
+import logging
+from typing import Any, Optional
+
+import requests
+
+INFERENCE_SERVICE_URL = os.getenv("INFERENCE_SERVICE_URL", "http://localhost:5020")
+INFERENCE_TIMEOUT = float(os.getenv("INFERENCE_TIMEOUT", "120"))
+INFERENCE_RETRIES = int(os.getenv("INFERENCE_RETRIES", "3"))
+
+logger = logging.getLogger(__name__)
+
+# One pooled session per process, shared by every proxy
+_session = requests.Session()
+
+
+class InferenceServiceError(Exception):
+    """Raised when the inference service cannot serve a request."""
+
+
+class RemotePipeline:
+    def __init__(self, task: str, model: Optional[str] = None, base_url: str = INFERENCE_SERVICE_URL,
+                 timeout: float = INFERENCE_TIMEOUT, retries: int = INFERENCE_RETRIES):
+        self.task = task
+        self.model = model
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+
+    def __call__(self, inputs: Any, **parameters) -> Any:
+        """
+        Run the pipeline remotely; accepts a single input or a list, like a local pipeline.
+        Retries with backoff while the service applies backpressure (HTTP 503).
+        """
+        payload = {"task": self.task, "model": self.model, "inputs": inputs, "parameters": parameters}
+        for attempt in range(self.retries + 1):
+            try:
+                response = _session.post(f"{self.base_url}/infer", json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                raise InferenceServiceError(f"Inference service unreachable: {e}") from e
+
+            if response.status_code == 503 and attempt < self.retries:
+                delay = float(response.headers.get("Retry-After", 2 ** attempt))
+                logger.warning(f"Inference service busy, retrying in {delay}s")
+                time.sleep(delay)
+                continue
+            if response.status_code != 200:
+                raise InferenceServiceError(f"Inference failed ({response.status_code}): {response.text}")
+            return response.json()["outputs"]
+
+    def __repr__(self):
+        return f"RemotePipeline(task={self.task!r}, model={self.model!r})"
+
+
+def pipeline(task: str, model: Optional[str] = None, **kwargs) -> RemotePipeline:
+    """
+    Drop-in replacement for transformers.pipeline backed by the shared inference service.
+    Construction is free: no model is loaded in the calling process. Model loading
+    options (device, dtype, ...) are decided by the service and ignored here.
+    """
+    return RemotePipeline(task, model)
+
+# Example Usage:
+# generator = pipeline("text-generation", model="EleutherAI/gpt-neo-2.7B")
+# generator("Summarize BTC market sentiment", max_length=50, num_return_sequences=1)[0]['generated_text']
@@ -0,0 +1,210 @@
+# services/common/market_data_gateway.py
+# Concurrent multi-exchange market data: one request per venue in flight at once,
+# each with its own timeout and rate budget, collected into a timestamped snapshot.
+
+import asyncio
+import inspect
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from services.common.rate_budget import RateBudget
+
+logger = logging.getLogger(__name__)
+
+GATEWAY_TIMEOUT = float(os.getenv("MARKET_DATA_TIMEOUT", "5"))  # seconds per venue
+GATEWAY_MAX_THREADS = int(os.getenv("MARKET_DATA_MAX_THREADS", "32"))
+# Sync calls per venue still running (including ones that timed out) before new ones are refused
+GATEWAY_MAX_PENDING = int(os.getenv("MARKET_DATA_MAX_PENDING", "4"))
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+@dataclass
+class Quote:
+    venue: str
+    symbol: str
+    data: Any = None
+    error: Optional[str] = None
+    timestamp: Optional[int] = None  # exchange time (ms), falls back to received_at
+    received_at: Optional[int] = None  # local time the response arrived (ms)
+    latency_ms: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class MarketSnapshot:
+    symbol: str
+    kind: str
+    requested_at: int
+    completed_at: int = 0
+    quotes: Dict[str, Quote] = field(default_factory=dict)
+
+    def ok(self) -> Dict[str, Any]:
+        """
+        Payloads of the venues that answered, by venue name.
+        """
+        return {venue: quote.data for venue, quote in self.quotes.items() if quote.ok}
+
+    def errors(self) -> Dict[str, str]:
+        return {venue: quote.error for venue, quote in self.quotes.items() if not quote.ok}
+
+    @property
+    def skew_ms(self) -> int:
+        """
+        Spread between the oldest and newest quote timestamps.
+        """
+        stamps = [quote.timestamp for quote in self.quotes.values() if quote.ok and quote.timestamp]
+        return max(stamps) - min(stamps) if stamps else 0
+
+
+class MarketDataGateway:
+    """
+    Fans a request out to several exchanges concurrently.
+
+    Exchanges are ccxt instances (sync or ccxt.async_support); sync clients run on
+    a shared thread pool. Each venue gets its own timeout and a rate budget derived
+    from the exchange's rateLimit (ms between calls) unless one is configured.
+    A sync call that times out keeps its thread until the client returns, so each
+    venue may only have max_pending of them running at once.
+
+    Synchronous callers go through run(), which submits to one long-lived event
+    loop thread; ccxt.async_support clients stay bound to that loop across calls.
+    """
+
+    def __init__(self, timeout: float = GATEWAY_TIMEOUT, max_threads: int = GATEWAY_MAX_THREADS,
+                 timeouts: Optional[Dict[str, float]] = None, rate_limits: Optional[Dict[str, float]] = None,
+                 max_pending: int = GATEWAY_MAX_PENDING):
+        """
+        Args:
+            timeout: Default per-venue timeout in seconds.
+            max_threads: Thread pool size for synchronous clients.
+            timeouts: Per-venue timeout overrides, by venue name.
+            rate_limits: Per-venue request rates (requests per second), by venue name.
+            max_pending: Sync calls per venue allowed to run at once, timed out ones included.
+        """
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+        self.rate_limits = rate_limits or {}
+        self.max_pending = max_pending
+        self.budgets: Dict[str, RateBudget] = {}
+        self.pending: Dict[str, int] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="market-data")
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def budget(self, exchange) -> RateBudget:
+        name = exchange.name
+        with self._lock:
+            if name not in self.budgets:
+                rate = self.rate_limits.get(name)
+                if rate is None:
+                    interval_ms = getattr(exchange, 'rateLimit', None) or 100
+                    rate = 1000.0 / interval_ms
+                self.budgets[name] = RateBudget(rate)
+            return self.budgets[name]
+
+    async def _call(self, exchange, method: str, symbol: str, *args) -> Quote:
+        venue = exchange.name
+        timeout = self.timeouts.get(venue, self.timeout)
+        started = time.monotonic()
+
+        wait = self.budget(exchange).reserve(timeout)
+        if wait is None:
+            return Quote(venue, symbol, error="Rate budget exhausted", received_at=_now_ms())
+        if wait:
+            await asyncio.sleep(wait)
+
+        fetch = getattr(exchange, method)
+        remaining = max(timeout - (time.monotonic() - started), 0.001)
+        try:
+            if inspect.iscoroutinefunction(fetch):
+                call = fetch(symbol, *args)
+            else:
+                call = self._submit(venue, lambda: fetch(symbol, *args))
+                if call is None:
+                    return Quote(venue, symbol, error="Too many calls still running", received_at=_now_ms())
+            data = await asyncio.wait_for(call, remaining)
+        except asyncio.TimeoutError:
+            return Quote(venue, symbol, error=f"Timed out after {timeout}s", received_at=_now_ms(),
+                         latency_ms=(time.monotonic() - started) * 1000)
+        except Exception as e:
+            logger.warning(f"{method} failed on {venue}: {e}")
+            return Quote(venue, symbol, error=str(e), received_at=_now_ms(),
+                         latency_ms=(time.monotonic() - started) * 1000)
+
+        received_at = _now_ms()
+        stamp = data.get('timestamp') if isinstance(data, dict) else None
+        return Quote(venue, symbol, data=data, timestamp=stamp or received_at, received_at=received_at,
+                     latency_ms=(time.monotonic() - started) * 1000)
+
+    def _submit(self, venue: str, fn) -> Optional[asyncio.Future]:
+        """
+        Run a sync client call on the pool, or return None if the venue has max_pending still running.
+        """
+        with self._lock:
+            if self.pending.get(venue, 0) >= self.max_pending:
+                return None
+            self.pending[venue] = self.pending.get(venue, 0) + 1
+        future = self.executor.submit(fn)
+        future.add_done_callback(lambda _: self._release(venue))
+        return asyncio.wrap_future(future)
+
+    def _release(self, venue: str):
+        with self._lock:
+            self.pending[venue] -= 1
+
+    async def gather(self, exchanges: List, method: str, symbol: str, *args) -> MarketSnapshot:
+        """
+        Call `method(symbol, *args)` on every exchange at once and collect a snapshot.
+        """
+        snapshot = MarketSnapshot(symbol=symbol, kind=method, requested_at=_now_ms())
+        quotes = await asyncio.gather(*(self._call(exchange, method, symbol, *args) for exchange in exchanges))
+        snapshot.quotes = {quote.venue: quote for quote in quotes}
+        snapshot.completed_at = _now_ms()
+        return snapshot
+
+    async def fetch_tickers(self, exchanges: List, symbol: str) -> MarketSnapshot:
+        return await self.gather(exchanges, 'fetch_ticker', symbol)
+
+    async def fetch_order_books(self, exchanges: List, symbol: str, limit: Optional[int] = None) -> MarketSnapshot:
+        return await self.gather(exchanges, 'fetch_order_book', symbol, limit)
+
+    def run(self, coroutine):
+        """
+        Run a gateway coroutine from synchronous code (including code called from another event loop)
+        on the gateway's own loop thread.
+        """
+        loop = self._get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coroutine.close()
+            raise RuntimeError("MarketDataGateway.run() called on the gateway loop; await the coroutine instead")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="market-data-loop", daemon=True).start()
+            return self._loop
+
+
+# Process-wide gateway, so rate budgets are shared by every caller
+market_data_gateway = MarketDataGateway()
+
+# Example Usage:
+# snapshot = market_data_gateway.run(market_data_gateway.fetch_tickers([ccxt.binance(), ccxt.kraken()], "BTC/USDT"))
+# {venue: quote.data['last'] for venue, quote in snapshot.quotes.items() if quote.ok}
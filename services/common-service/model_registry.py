@@ -0,0 +1,162 @@
+# services/common/model_registry.py
+# Process-wide registry of Hugging Face pipelines. Models are loaded on first use,
+# shared by every caller in the process and evicted when idle or over a memory ceiling.
+
+import os
+import threading
+import time
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MODEL_IDLE_TTL = float(os.getenv("MODEL_IDLE_TTL", "900"))  # seconds, 0 disables
+MODEL_MEMORY_LIMIT = int(os.getenv("MODEL_MEMORY_LIMIT", "0"))  # bytes, 0 disables
+
+ModelKey = Tuple[str, Optional[str]]
+
+
+def _default_loader(task: str, model: Optional[str], **kwargs):
+    from transformers import pipeline as hf_pipeline
+    return hf_pipeline(task, model=model, **kwargs)
+
+
+def _model_size(pipe: Any) -> int:
+    """
+    Parameter memory of a loaded pipeline in bytes (0 if it can't be determined).
+    """
+    model = getattr(pipe, "model", None)
+    try:
+        return sum(p.numel() * p.element_size() for p in model.parameters())
+    except Exception:
+        return 0
+
+
+class ModelRegistry:
+    def __init__(self,
+                 idle_ttl: float = MODEL_IDLE_TTL,
+                 memory_limit: int = MODEL_MEMORY_LIMIT,
+                 loader: Callable[..., Any] = _default_loader):
+        """
+        Args:
+            idle_ttl: Evict a model after this many seconds without use (0 disables).
+            memory_limit: Evict least-recently-used models above this many bytes (0 disables).
+            loader: Function (task, model, **kwargs) -> pipeline.
+        """
+        self.idle_ttl = idle_ttl
+        self.memory_limit = memory_limit
+        self.loader = loader
+        self.models: "OrderedDict[ModelKey, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._reaper: Optional[threading.Thread] = None
+
+    def get(self, task: str, model: Optional[str] = None, **kwargs) -> Any:
+        """
+        Return the shared pipeline for (task, model), loading it on first use.
+        Concurrent first calls load the model once.
+        """
+        key = (task, model)
+        with self._lock:
+            entry = self.models.get(key)
+            if entry is not None:
+                entry['last_used'] = time.monotonic()
+                self.models.move_to_end(key)
+                return entry['pipeline']
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            with self._lock:
+                entry = self.models.get(key)
+            if entry is None:
+                started = time.monotonic()
+                pipe = self.loader(task, model, **kwargs)
+                entry = {'pipeline': pipe, 'size': _model_size(pipe), 'last_used': time.monotonic()}
+                logger.info(f"Loaded {task} / {model} in {time.monotonic() - started:.1f}s")
+                with self._lock:
+                    self.models[key] = entry
+                    self._enforce_memory_limit(keep=key)
+                self._ensure_reaper()
+        return entry['pipeline']
+
+    def evict(self, task: str, model: Optional[str] = None) -> bool:
+        with self._lock:
+            return self.models.pop((task, model), None) is not None
+
+    def evict_idle(self) -> int:
+        """
+        Drop models unused for longer than idle_ttl; returns how many were evicted.
+        """
+        if not self.idle_ttl:
+            return 0
+        cutoff = time.monotonic() - self.idle_ttl
+        with self._lock:
+            idle = [key for key, entry in self.models.items() if entry['last_used'] < cutoff]
+            for key in idle:
+                del self.models[key]
+                logger.info(f"Evicted idle model {key[0]} / {key[1]}")
+        return len(idle)
+
+    def loaded(self) -> Dict[ModelKey, int]:
+        """
+        Currently loaded models and their parameter memory in bytes.
+        """
+        with self._lock:
+            return {key: entry['size'] for key, entry in self.models.items()}
+
+    def _enforce_memory_limit(self, keep: ModelKey):
+        if not self.memory_limit:
+            return
+        total = sum(entry['size'] for entry in self.models.values())
+        for key in list(self.models):
+            if total <= self.memory_limit:
+                break
+            if key == keep:
+                continue
+            total -= self.models.pop(key)['size']
+            logger.info(f"Evicted model {key[0]} / {key[1]} to stay under the memory limit")
+
+    def _ensure_reaper(self):
+        if not self.idle_ttl or (self._reaper is not None and self._reaper.is_alive()):
+            return
+        self._reaper = threading.Thread(target=self._reap, name="model-registry-reaper", daemon=True)
+        self._reaper.start()
+
+    def _reap(self):
+        while True:
+            time.sleep(max(self.idle_ttl / 4, 1))
+            self.evict_idle()
+
+
+class LazyPipeline:
+    """
+    Callable stand-in for a pipeline; the model is resolved through the registry on each call.
+    """
+
+    def __init__(self, registry: ModelRegistry, task: str, model: Optional[str] = None, **kwargs):
+        self.registry = registry
+        self.task = task
+        self.model = model
+        self.kwargs = kwargs
+
+    def __call__(self, *args, **kwargs):
+        return self.registry.get(self.task, self.model, **self.kwargs)(*args, **kwargs)
+
+    def __repr__(self):
+        return f"LazyPipeline(task={self.task!r}, model={self.model!r})"
+
+
+# Process-wide registry
+model_registry = ModelRegistry()
+
+
+def pipeline(task: str, model: Optional[str] = None, **kwargs) -> LazyPipeline:
+    """
+    Drop-in, lazy replacement for transformers.pipeline: nothing is loaded until the first call.
+    """
+    return LazyPipeline(model_registry, task, model, **kwargs)
+
+# Example Usage:
+# sentiment_model = pipeline("sentiment-analysis", model="vaishali/CryptoBERT")  # instant
+# sentiment_model("Bitcoin is surging to new highs!")                            # loads once, then shared
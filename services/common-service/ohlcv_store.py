@@ -0,0 +1,250 @@
+# services/common/ohlcv_store.py
+# On-disk candle store partitioned by venue / symbol / timeframe, synced incrementally
+# from the exchange and read back through memory maps.
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+OHLCV_STORE_PATH = os.getenv("OHLCV_STORE_PATH", "/data/ohlcv")
+
+BAR_DTYPE = np.dtype([('timestamp', '<i8'), ('open', '<f8'), ('high', '<f8'),
+                      ('low', '<f8'), ('close', '<f8'), ('volume', '<f8')])
+
+
+def _safe(name: str) -> str:
+    return re.sub(r'[^A-Za-z0-9._-]', '_', name)
+
+
+if os.name == 'nt':
+    import msvcrt
+
+    def _lock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(f):
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_file(f):
+        fcntl.flock(f, fcntl.LOCK_EX)
+
+    def _unlock_file(f):
+        fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class OHLCVStore:
+    """
+    Each partition is one append-only file of fixed-width little-endian records
+    (timestamp ms, open, high, low, close, volume), oldest first. Reads map the
+    file and slice it, so ranges come straight from the page cache without
+    copying. The newest stored bar may still be forming; sync re-fetches from it
+    and overwrites it in place. Older history is backfilled by rewriting the file
+    and swapping it in, so existing maps keep seeing the previous version.
+    """
+
+    def __init__(self, root: str = OHLCV_STORE_PATH):
+        self.root = root
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self._synced: Dict[str, float] = {}
+        self._history_start: Dict[str, int] = {}
+
+    def path(self, venue: str, symbol: str, timeframe: str) -> str:
+        return os.path.join(self.root, _safe(venue), _safe(symbol), f"{_safe(timeframe)}.bin")
+
+    def _lock(self, path: str) -> threading.Lock:
+        with self._guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    @contextmanager
+    def _writing(self, path: str):
+        """
+        Exclusive write access to a partition, across threads and across processes
+        sharing the volume (a sidecar lock file, since backfills replace the data file).
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock(path), open(path + '.lock', 'a+b') as lock:
+            _lock_file(lock)
+            try:
+                yield
+            finally:
+                _unlock_file(lock)
+
+    def count(self, venue: str, symbol: str, timeframe: str) -> int:
+        path = self.path(venue, symbol, timeframe)
+        return os.path.getsize(path) // BAR_DTYPE.itemsize if os.path.exists(path) else 0
+
+    def read(self, venue: str, symbol: str, timeframe: str,
+             start: Optional[int] = None, end: Optional[int] = None, limit: Optional[int] = None) -> np.ndarray:
+        """
+        Bars with start <= timestamp < end (epoch ms) as a read-only structured array backed by the file.
+        Args:
+            limit: Keep only the newest `limit` bars of the range.
+        """
+        count = self.count(venue, symbol, timeframe)
+        if not count:
+            return np.empty(0, dtype=BAR_DTYPE)
+        bars = np.memmap(self.path(venue, symbol, timeframe), dtype=BAR_DTYPE, mode='r', shape=(count,))
+        timestamps = bars['timestamp']
+        lo = int(np.searchsorted(timestamps, start)) if start is not None else 0
+        hi = int(np.searchsorted(timestamps, end)) if end is not None else count
+        if limit is not None:
+            lo = max(lo, hi - limit)
+        return bars[lo:hi]
+
+    def frame(self, venue: str, symbol: str, timeframe: str,
+              start: Optional[int] = None, end: Optional[int] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Same range as read(), as the DataFrame shape the services use (datetime timestamp column).
+        """
+        bars = self.read(venue, symbol, timeframe, start, end, limit)
+        df = pd.DataFrame({name: bars[name] for name in BAR_DTYPE.names})
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df
+
+    def first_timestamp(self, venue: str, symbol: str, timeframe: str) -> Optional[int]:
+        bars = self.read(venue, symbol, timeframe)
+        return int(bars['timestamp'][0]) if len(bars) else None
+
+    def last_timestamp(self, venue: str, symbol: str, timeframe: str) -> Optional[int]:
+        bars = self.read(venue, symbol, timeframe, limit=1)
+        return int(bars['timestamp'][0]) if len(bars) else None
+
+    def append(self, venue: str, symbol: str, timeframe: str, bars) -> int:
+        """
+        Merge [timestamp, open, high, low, close, volume] rows into the partition.
+        Rows older than the newest stored bar are ignored, a row for the newest stored
+        bar replaces it, and later rows are appended. Returns the number of new bars.
+        """
+        records = _records(bars)
+        if not len(records):
+            return 0
+
+        path = self.path(venue, symbol, timeframe)
+        with self._writing(path), os.fdopen(os.open(path, os.O_RDWR | os.O_CREAT, 0o644), 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            size -= size % BAR_DTYPE.itemsize  # drop a torn trailing record
+            last = None
+            if size:
+                f.seek(size - BAR_DTYPE.itemsize)
+                last = int(np.frombuffer(f.read(BAR_DTYPE.itemsize), dtype=BAR_DTYPE)['timestamp'][0])
+                records = records[records['timestamp'] >= last]
+            # Overwrite in place rather than truncating: readers may have the file mapped
+            if last is not None and len(records) and records['timestamp'][0] == last:
+                f.seek(size - BAR_DTYPE.itemsize)
+                new = len(records) - 1
+            else:
+                f.seek(size)
+                new = len(records)
+            f.write(records.tobytes())
+        return new
+
+    def prepend(self, venue: str, symbol: str, timeframe: str, bars) -> int:
+        """
+        Merge rows older than the oldest stored bar into the partition; other rows are ignored.
+        Returns the number of bars added.
+        """
+        records = _records(bars)
+        path = self.path(venue, symbol, timeframe)
+        with self._writing(path):
+            data = open(path, 'rb').read() if os.path.exists(path) else b''
+            stored = np.frombuffer(data[:len(data) - len(data) % BAR_DTYPE.itemsize], dtype=BAR_DTYPE)
+            if len(stored):
+                records = records[records['timestamp'] < stored['timestamp'][0]]
+            if not len(records):
+                return 0
+            # Write a new file and swap it in: mapped readers keep the old one until they remap
+            tmp = f"{path}.{os.getpid()}.tmp"
+            np.concatenate((records, stored)).tofile(tmp)
+            os.replace(tmp, path)
+        return len(records)
+
+    def sync(self, exchange, symbol: str, timeframe: str, limit: int = 500,
+             since: Optional[int] = None, max_pages: int = 100, min_interval: float = 0) -> int:
+        """
+        Download only bars newer than the stored ones (plus the still-forming last bar).
+        An empty partition starts with the latest `limit` bars, or from `since` if given;
+        a partition holding fewer than `limit` bars is backfilled with older ones.
+        Args:
+            min_interval: Skip the download if this partition was synced less than this many
+                seconds ago and already holds `limit` bars.
+        Returns the number of new bars stored.
+        """
+        venue = exchange.id
+        path = self.path(venue, symbol, timeframe)
+        now = time.monotonic()
+        with self._guard:
+            if (min_interval and now - self._synced.get(path, float('-inf')) < min_interval
+                    and self.count(venue, symbol, timeframe) >= limit):
+                return 0
+            self._synced[path] = now
+        last = self.last_timestamp(venue, symbol, timeframe)
+        if last is None and since is None:
+            return self.append(venue, symbol, timeframe, exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit))
+
+        cursor = last if last is not None else since
+        new = 0
+        for _ in range(max_pages):
+            page = exchange.fetch_ohlcv(symbol, timeframe=timeframe, since=cursor, limit=limit)
+            new += self.append(venue, symbol, timeframe, page)
+            if len(page) < limit or page[-1][0] <= cursor:
+                break
+            cursor = page[-1][0]
+        return new + self.backfill(exchange, symbol, timeframe, limit)
+
+    def backfill(self, exchange, symbol: str, timeframe: str, limit: int = 500) -> int:
+        """
+        Fetch bars older than the oldest stored one until the partition holds `limit` bars
+        or the exchange has no earlier history. Returns the number of bars added.
+        """
+        venue = exchange.id
+        path = self.path(venue, symbol, timeframe)
+        step = exchange.parse_timeframe(timeframe) * 1000
+        added = 0
+        while self.count(venue, symbol, timeframe) < limit:
+            oldest = self.first_timestamp(venue, symbol, timeframe)
+            if oldest is None or self._history_start.get(path) == oldest:
+                break
+            page = exchange.fetch_ohlcv(symbol, timeframe=timeframe, since=oldest - limit * step, limit=limit)
+            new = self.prepend(venue, symbol, timeframe, page)
+            if not new:
+                # Nothing before the oldest bar: don't ask again for this partition
+                self._history_start[path] = oldest
+                break
+            added += new
+        return added
+
+
+def _records(bars) -> np.ndarray:
+    """
+    [timestamp, open, high, low, close, volume] rows as BAR_DTYPE records, sorted, last duplicate wins.
+    """
+    rows = np.asarray(bars, dtype=np.float64).reshape(-1, 6)
+    records = np.empty(len(rows), dtype=BAR_DTYPE)
+    if not len(rows):
+        return records
+    records['timestamp'] = rows[:, 0].astype(np.int64)
+    for i, name in enumerate(BAR_DTYPE.names[1:], start=1):
+        records[name] = rows[:, i]
+    records = records[np.argsort(records['timestamp'], kind='stable')]
+    keep = np.append(records['timestamp'][1:] != records['timestamp'][:-1], True)
+    return records[keep]
+
+
+# Process-wide store
+ohlcv_store = OHLCVStore()
+
+# Example Usage:
+# ohlcv_store.sync(ccxt.binance(), "BTC/USDT", "1m")             # only the bars since the last sync
+# bars = ohlcv_store.read("binance", "BTC/USDT", "1m", limit=500)  # memory-mapped, no copy
+# df = ohlcv_store.frame("binance", "BTC/USDT", "1m", start=1700000000000)
@@ -0,0 +1,254 @@
+# services/common/order_book.py
+# Compact L2 order book on sorted NumPy arrays, shared by feeds, routers and impact estimators.
+
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+Level = Tuple[float, float]
+
+
+def _vwap(prices: np.ndarray, sizes: np.ndarray, size: float) -> Optional[float]:
+    """
+    Average fill price for `size` walking best-first levels; None if the levels are too thin.
+    """
+    if size <= 0:
+        return None
+    cumulative = np.cumsum(sizes)
+    k = int(np.searchsorted(cumulative, size))
+    if k >= len(prices):
+        return None
+    filled_before = cumulative[k - 1] if k else 0.0
+    cost = float(np.dot(prices[:k], sizes[:k])) + prices[k] * (size - filled_before)
+    return cost / size
+
+
+def _impact_price(prices: np.ndarray, sizes: np.ndarray, size: float) -> Optional[float]:
+    """
+    Worst price touched when filling `size`; None if the levels are too thin.
+    """
+    k = int(np.searchsorted(np.cumsum(sizes), size))
+    return float(prices[k]) if k < len(prices) else None
+
+
+class BookSide:
+    """
+    One side of a book. Levels are kept in ascending key order with the best
+    level last (key = price for bids, -price for asks), so a price is located by
+    binary search and the frequent changes near the top only shift a few slots.
+    """
+
+    def __init__(self, side: str, capacity: int = 256):
+        self.side = side
+        self.sign = 1.0 if side == 'bids' else -1.0
+        self.keys = np.empty(capacity)
+        self.sizes = np.empty(capacity)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def clear(self):
+        self.n = 0
+
+    def update(self, price: float, size: float):
+        """
+        Set the size at a price level; size 0 removes the level.
+        """
+        key = price * self.sign
+        n = self.n
+        i = int(np.searchsorted(self.keys[:n], key))
+        if i < n and self.keys[i] == key:
+            if size:
+                self.sizes[i] = size
+            else:
+                self.keys[i:n - 1] = self.keys[i + 1:n]
+                self.sizes[i:n - 1] = self.sizes[i + 1:n]
+                self.n = n - 1
+            return
+        if not size:
+            return
+        if n == len(self.keys):
+            self._grow()
+        self.keys[i + 1:n + 1] = self.keys[i:n]
+        self.sizes[i + 1:n + 1] = self.sizes[i:n]
+        self.keys[i] = key
+        self.sizes[i] = size
+        self.n = n + 1
+
+    def load(self, levels):
+        """
+        Replace the side with a list of (price, size) levels in any order.
+        """
+        levels = np.asarray(levels, dtype=float).reshape(-1, 2)
+        levels = levels[levels[:, 1] > 0]
+        keys = levels[:, 0] * self.sign
+        order = np.argsort(keys, kind='stable')
+        if len(order) > len(self.keys):
+            self.keys = np.empty(len(order) * 2)
+            self.sizes = np.empty(len(order) * 2)
+        self.n = len(order)
+        self.keys[:self.n] = keys[order]
+        self.sizes[:self.n] = levels[order, 1]
+
+    def best(self) -> Optional[Level]:
+        if not self.n:
+            return None
+        return float(self.keys[self.n - 1] * self.sign), float(self.sizes[self.n - 1])
+
+    def levels(self, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (prices, sizes) best-first, limited to the top `limit` levels.
+        """
+        start = 0 if limit is None else max(self.n - limit, 0)
+        return self.keys[start:self.n][::-1] * self.sign, self.sizes[start:self.n][::-1].copy()
+
+    def cumulative_depth(self, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (prices, cumulative size) best-first.
+        """
+        prices, sizes = self.levels(limit)
+        return prices, np.cumsum(sizes)
+
+    def vwap(self, size: float) -> Optional[float]:
+        return _vwap(*self.levels(), size)
+
+    def impact_price(self, size: float) -> Optional[float]:
+        return _impact_price(*self.levels(), size)
+
+    def _grow(self):
+        self.keys = np.concatenate([self.keys, np.empty(len(self.keys))])
+        self.sizes = np.concatenate([self.sizes, np.empty(len(self.sizes))])
+
+
+class OrderBook:
+    def __init__(self, symbol: Optional[str] = None, venue: Optional[str] = None, capacity: int = 256):
+        self.symbol = symbol
+        self.venue = venue
+        self.bids = BookSide('bids', capacity)
+        self.asks = BookSide('asks', capacity)
+        self.sequence: Optional[int] = None
+        self.timestamp: Optional[int] = None
+        self.received_at: Optional[int] = None
+
+    @classmethod
+    def from_ccxt(cls, book: dict, venue: Optional[str] = None) -> "OrderBook":
+        """
+        Build from a ccxt fetch_order_book result.
+        """
+        order_book = cls(book.get('symbol'), venue)
+        order_book.bids.load([level[:2] for level in book['bids']])
+        order_book.asks.load([level[:2] for level in book['asks']])
+        order_book.sequence = book.get('nonce')
+        order_book.timestamp = book.get('timestamp')
+        return order_book
+
+    def side(self, side: str) -> BookSide:
+        return self.bids if side == 'bids' else self.asks
+
+    def update(self, side: str, price: float, size: float):
+        self.side(side).update(price, size)
+
+    def clear(self):
+        self.bids.clear()
+        self.asks.clear()
+        self.sequence = None
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.best()
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        return (bid[0] + ask[0]) / 2 if bid and ask else None
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        return ask[0] - bid[0] if bid and ask else None
+
+    def top(self, limit: Optional[int] = None) -> Dict[str, List[Level]]:
+        """
+        Top levels per side as ccxt-style [price, size] lists.
+        """
+        return {side: np.column_stack(self.side(side).levels(limit)).tolist() for side in ('bids', 'asks')}
+
+    def vwap(self, size: float, action: str = 'buy') -> Optional[float]:
+        """
+        Average execution price for a market order of `size` (buy walks the asks, sell the bids).
+        """
+        return (self.asks if action == 'buy' else self.bids).vwap(size)
+
+    def impact_price(self, size: float, action: str = 'buy') -> Optional[float]:
+        return (self.asks if action == 'buy' else self.bids).impact_price(size)
+
+
+class MergedSide:
+    """
+    One side of a consolidated book: best-first levels with the venue of each level.
+    """
+
+    def __init__(self, prices: np.ndarray, sizes: np.ndarray, venues: np.ndarray, venue_names: List[str]):
+        self.prices = prices
+        self.sizes = sizes
+        self.venues = venues  # index into venue_names
+        self.venue_names = venue_names
+
+    def __len__(self):
+        return len(self.prices)
+
+    def cumulative_depth(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self.prices, np.cumsum(self.sizes)
+
+    def vwap(self, size: float) -> Optional[float]:
+        return _vwap(self.prices, self.sizes, size)
+
+    def impact_price(self, size: float) -> Optional[float]:
+        return _impact_price(self.prices, self.sizes, size)
+
+    def allocation(self, size: float) -> Dict[str, float]:
+        """
+        How much of `size` each venue fills when sweeping the consolidated levels.
+        """
+        filled = np.minimum(self.sizes, np.maximum(size - (np.cumsum(self.sizes) - self.sizes), 0))
+        totals = np.bincount(self.venues, weights=filled, minlength=len(self.venue_names))
+        return {name: float(total) for name, total in zip(self.venue_names, totals) if total > 0}
+
+
+def _merge_side(sides: List[BookSide], limit: Optional[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Each side is already sorted, so merge pairwise by insertion positions instead of re-sorting
+    keys, sizes, venues = np.empty(0), np.empty(0), np.empty(0, dtype=np.int64)
+    for index, side in enumerate(sides):
+        start = 0 if limit is None else max(side.n - limit, 0)
+        side_keys, side_sizes = side.keys[start:side.n], side.sizes[start:side.n]
+        positions = np.searchsorted(keys, side_keys, side='left') + np.arange(len(side_keys))
+        total = len(keys) + len(side_keys)
+        mask = np.ones(total, dtype=bool)
+        mask[positions] = False
+        merged_keys, merged_sizes, merged_venues = np.empty(total), np.empty(total), np.empty(total, dtype=np.int64)
+        merged_keys[positions], merged_sizes[positions], merged_venues[positions] = side_keys, side_sizes, index
+        merged_keys[mask], merged_sizes[mask], merged_venues[mask] = keys, sizes, venues
+        keys, sizes, venues = merged_keys, merged_sizes, merged_venues
+    return keys[::-1], sizes[::-1], venues[::-1]
+
+
+def merge_books(books: Dict[str, OrderBook], limit: Optional[int] = None) -> Dict[str, MergedSide]:
+    """
+    Consolidate per-venue books into one best-first book per side.
+    Args:
+        books: OrderBook per venue name.
+        limit: Levels taken from each venue per side (None takes all).
+    """
+    names = list(books)
+    merged = {}
+    for side, sign in (('bids', 1.0), ('asks', -1.0)):
+        keys, sizes, venues = _merge_side([books[name].side(side) for name in names], limit)
+        merged[side] = MergedSide(keys * sign, sizes, venues, names)
+    return merged
+
+# Example Usage:
+# book = OrderBook.from_ccxt(ccxt.binance().fetch_order_book("BTC/USDT"), venue="Binance")
+# book.vwap(2.5, "buy"), book.asks.cumulative_depth(20)
+# consolidated = merge_books({"Binance": book, "Kraken": other})
+# consolidated['asks'].allocation(10)
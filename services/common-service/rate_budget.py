@@ -0,0 +1,39 @@
+# services/common/rate_budget.py
+# Thread-safe token bucket shared by the market data gateway and the HTTP client.
+
+import threading
+import time
+from typing import Optional
+
+
+class RateBudget:
+    """
+    Token bucket for one venue or host. A request reserves a token, waiting for it if the
+    bucket is empty; reservations that would wait past the deadline are refused.
+    Uses a thread lock, so one budget is safe across event loops and threads.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate  # tokens per second
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: float) -> Optional[float]:
+        """
+        Reserve a token; returns the seconds to wait before using it, or None if over max_wait.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            wait = 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+            if wait > max_wait:
+                return None
+            self.tokens -= 1
+            return wait
+
+# Example Usage:
+# budget = RateBudget(rate=10, burst=5)     # 10 requests/second, bursts of 5
+# wait = budget.reserve(max_wait=1.0)       # None: over budget, else sleep `wait` seconds first
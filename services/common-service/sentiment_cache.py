@@ -0,0 +1,175 @@
+# services/common/sentiment_cache.py
+# Process-wide sentiment result cache keyed by a hash of (model, text), with an
+# optional SQLite tier so scores survive restarts.
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+SENTIMENT_CACHE_TTL = float(os.getenv("SENTIMENT_CACHE_TTL", "86400"))  # seconds, 0 never expires
+SENTIMENT_CACHE_MAX_ENTRIES = int(os.getenv("SENTIMENT_CACHE_MAX_ENTRIES", "100000"))
+SENTIMENT_CACHE_PATH = os.getenv("SENTIMENT_CACHE_PATH")  # SQLite file, unset keeps the cache in memory only
+
+
+def content_key(model: Optional[str], text: str) -> str:
+    """
+    Cache key for a text scored by a model. Whitespace differences don't change the key.
+    """
+    normalized = " ".join(text.split())
+    return hashlib.sha256(f"{model}\x00{normalized}".encode("utf-8")).hexdigest()
+
+
+class SentimentCache:
+    """
+    LRU cache of {'label', 'score'} results. Entries expire after ttl seconds
+    and the least-recently-used ones are dropped beyond max_entries. With a
+    disk_path, every new result is also written to SQLite and memory misses
+    fall back to it, so a restarted service starts warm. Results of models
+    without a stable name are passed with persist=False and stay in memory.
+    """
+
+    def __init__(self,
+                 ttl: float = SENTIMENT_CACHE_TTL,
+                 max_entries: int = SENTIMENT_CACHE_MAX_ENTRIES,
+                 disk_path: Optional[str] = SENTIMENT_CACHE_PATH):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self.stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0, 'expired': 0}
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if disk_path:
+            self._db = sqlite3.connect(disk_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sentiment "
+                "(key TEXT PRIMARY KEY, label TEXT, score REAL, created REAL)"
+            )
+            self._db.commit()
+
+    def get_many(self, model: Optional[str], texts: Sequence[str], persist: bool = True) -> Dict[str, Dict]:
+        """
+        Cached results for the given texts (text -> result); texts not cached are absent.
+        Args:
+            persist: Also look in the SQLite tier.
+        """
+        now = time.time()
+        found: Dict[str, Dict] = {}
+        disk_keys: Dict[str, List[str]] = {}
+        with self._lock:
+            for text in texts:
+                key = content_key(model, text)
+                entry = self.entries.get(key)
+                if entry is not None and self._fresh(entry[0], now):
+                    self.entries.move_to_end(key)
+                    found[text] = entry[1]
+                    self.stats['hits'] += 1
+                    continue
+                if entry is not None:
+                    del self.entries[key]
+                    self.stats['expired'] += 1
+                disk_keys.setdefault(key, []).append(text)
+
+            if disk_keys and self._db is not None and persist:
+                for key, (created, result) in self._load(list(disk_keys)).items():
+                    if not self._fresh(created, now):
+                        continue
+                    for text in disk_keys.pop(key):
+                        found[text] = result
+                    self._insert(key, created, result)
+                    self.stats['disk_hits'] += 1
+            self.stats['misses'] += len(disk_keys)
+        return found
+
+    def put_many(self, model: Optional[str], results: Dict[str, Dict], persist: bool = True):
+        """
+        Store text -> result pairs (in memory only unless persist).
+        """
+        now = time.time()
+        rows = []
+        with self._lock:
+            for text, result in results.items():
+                key = content_key(model, text)
+                result = {'label': result['label'], 'score': float(result['score'])}
+                self._insert(key, now, result)
+                rows.append((key, result['label'], result['score'], now))
+            if rows and self._db is not None and persist:
+                self._db.executemany("INSERT OR REPLACE INTO sentiment VALUES (?, ?, ?, ?)", rows)
+                self._db.commit()
+
+    def get_or_score(self, model: Optional[str], texts: Sequence[str],
+                     score: Callable[[List[str]], List[Dict]], persist: bool = True) -> Dict[str, Dict]:
+        """
+        Results for every text, calling score(missing_texts) only for the ones not cached.
+        """
+        found = self.get_many(model, texts, persist)
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            computed = dict(zip(missing, score(missing)))
+            self.put_many(model, computed, persist)
+            found.update(computed)
+        return found
+
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['disk_hits'] + self.stats['misses']
+        return (self.stats['hits'] + self.stats['disk_hits']) / lookups if lookups else 0.0
+
+    def metrics(self) -> Dict:
+        with self._lock:
+            return {**self.stats, 'entries': len(self.entries), 'hit_rate': round(self.hit_rate(), 4)}
+
+    def purge_expired(self) -> int:
+        """
+        Drop expired entries from memory and disk; returns how many memory entries were removed.
+        """
+        if not self.ttl:
+            return 0
+        now = time.time()
+        with self._lock:
+            expired = [key for key, (created, _) in self.entries.items() if not self._fresh(created, now)]
+            for key in expired:
+                del self.entries[key]
+            if self._db is not None:
+                self._db.execute("DELETE FROM sentiment WHERE created < ?", (now - self.ttl,))
+                self._db.commit()
+        return len(expired)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM sentiment")
+                self._db.commit()
+
+    def _fresh(self, created: float, now: float) -> bool:
+        return not self.ttl or now - created < self.ttl
+
+    def _insert(self, key: str, created: float, result: Dict):
+        self.entries[key] = (created, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats['evictions'] += 1
+
+    def _load(self, keys: List[str]) -> Dict[str, Tuple[float, Dict]]:
+        rows = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for key, label, score, created in self._db.execute(
+                    f"SELECT key, label, score, created FROM sentiment WHERE key IN ({placeholders})", chunk):
+                rows[key] = (created, {'label': label, 'score': score})
+        return rows
+
+
+# Process-wide cache
+sentiment_cache = SentimentCache()
+
+# Example Usage:
+# sentiment_cache.get_or_score("vaishali/CryptoBERT", headlines, lambda texts: sentiment_model(texts))
+# sentiment_cache.metrics()  # {'hits': ..., 'misses': ..., 'hit_rate': ...}
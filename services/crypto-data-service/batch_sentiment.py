@@ -0,0 +1,75 @@
+# File path: CryptIQ-Micro-Frontend/services/crypto-data-service/batch_sentiment.py
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from services.common.sentiment_cache import SentimentCache, sentiment_cache
+
+"""
+Batched Sentiment Scoring
+
+Shared batch path for the sentiment services. Identical texts are scored once,
+the unique texts are sorted by length so each chunk pads to a similar length,
+and every chunk is one padded forward pass through the pipeline (the pipeline
+pads each batch to its longest member). Texts already scored by the same model,
+here or in another service sharing the cache, are not scored again.
+"""
+
+DEFAULT_BATCH_SIZE = 32
+
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str) and bool(value.strip())
+
+
+def model_id(sentiment_model: Callable) -> Optional[str]:
+    """
+    Stable name of the model behind a pipeline, used to key cached scores; None if it has none.
+    """
+    model = getattr(sentiment_model, 'model', None)
+    if isinstance(model, str):
+        return model
+    config = getattr(model, 'config', None)
+    return getattr(config, 'name_or_path', None) or getattr(config, '_name_or_path', None) or None
+
+
+def score_texts(sentiment_model: Callable, texts: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE,
+                max_length: Optional[int] = 512,
+                cache: Optional[SentimentCache] = sentiment_cache) -> List[Optional[Dict]]:
+    """
+    Score many texts with a sentiment pipeline in length-bucketed, padded batches.
+    Args:
+        sentiment_model: Hugging Face sentiment pipeline (or any compatible callable).
+        texts: Texts to score; empty or non-string entries yield None.
+        batch_size: Texts per forward pass.
+        max_length: Truncate longer inputs to this many tokens (None disables truncation).
+        cache: Result cache consulted before scoring (None disables caching).
+    Returns:
+        One {'label', 'score'} dict per input text, in input order.
+    """
+    texts = list(texts)
+    unique = list(dict.fromkeys(text for text in texts if _is_text(text)))
+    if not unique:
+        return [None] * len(texts)
+
+    def run(pending: List[str]) -> List[Dict]:
+        # Length buckets: neighbours in this order have similar token counts, so padding stays small
+        ordered = sorted(pending, key=len)
+        options = {'truncation': True, 'max_length': max_length} if max_length else {}
+        scored: Dict[str, Dict] = {}
+        for start in range(0, len(ordered), batch_size):
+            chunk = ordered[start:start + batch_size]
+            outputs = sentiment_model(chunk, batch_size=len(chunk), **options)
+            for text, output in zip(chunk, outputs):
+                scored[text] = output[0] if isinstance(output, list) else output
+        return [scored[text] for text in pending]
+
+    name = model_id(sentiment_model)
+    if cache is None:
+        scores = dict(zip(unique, run(unique)))
+    elif name is None:
+        # No stable name: a key that changes on every restart would only fill the disk tier with dead rows
+        scores = cache.get_or_score(f"{type(sentiment_model).__name__}:{id(sentiment_model)}", unique, run,
+                                    persist=False)
+    else:
+        scores = cache.get_or_score(name, unique, run)
+
+    return [scores.get(text) if _is_text(text) else None for text in texts]
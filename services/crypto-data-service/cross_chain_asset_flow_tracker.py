@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/cross_chain_asset_flow_tracker.py
 
 import pandas as pd
-import requests
+from services.common.http_client import http_client
 
 """
 Cross-Chain Asset Flow Tracker
@@ -15,7 +15,7 @@ class CrossChainAssetFlowTracker:
         """
         Fetch cross-chain asset flows between different blockchains.
         """
-        response = requests.get(f"{self.api_url}/cross_chain_flows")
+        response = http_client.get(f"{self.api_url}/cross_chain_flows")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['flows'])
         else:
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/data_aggregator.py
 
-import requests
+from services.common.http_client import http_client
 import json
 
 COINMARKETCAP_API_KEY = "your_coinmarketcap_api_key"
@@ -9,13 +9,13 @@ LUNARCRUSH_API_KEY = "your_lunarcrush_api_key"
 def fetch_coinmarketcap_data():
     headers = {'X-CMC_PRO_API_KEY': COINMARKETCAP_API_KEY}
     url = "https://pro-api.coinmarketcap.com/v1/cryptocurrency/listings/latest"
-    response = requests.get(url, headers=headers)
+    response = http_client.get(url, headers=headers)
     return response.json() if response.status_code == 200 else None
 
 def fetch_lunarcrush_social_data():
     headers = {'Authorization': f'Bearer {LUNARCRUSH_API_KEY}'}
     url = "https://lunarcrush.com/api4/coins"
-    response = requests.get(url, headers=headers)
+    response = http_client.get(url, headers=headers)
     return response.json() if response.status_code == 200 else None
 
 def aggregate_market_data():
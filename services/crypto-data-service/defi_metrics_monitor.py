@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/defi_metrics_monitor.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -14,7 +14,7 @@ def fetch_defi_metrics():
     """
     Fetch DeFi metrics such as TVL (Total Value Locked) and lending rates.
     """
-    response = requests.get(f"{DEFI_PULSE_URL}?api-key={DEFI_PULSE_API_KEY}")
+    response = http_client.get(f"{DEFI_PULSE_URL}?api-key={DEFI_PULSE_API_KEY}")
     return pd.DataFrame(response.json()) if response.status_code == 200 else None
 
 def monitor_defi_trends():
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/defi_yield_optimizer.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -15,7 +15,7 @@ class DeFiYieldOptimizer:
         """
         Fetch data for all DeFi yield pools.
         """
-        response = requests.get(f"{self.api_url}/pools")
+        response = http_client.get(f"{self.api_url}/pools")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['data'])
         else:
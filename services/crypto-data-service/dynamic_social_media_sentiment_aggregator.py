@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/dynamic_social_media_sentiment_aggregator.py
 
 import pandas as pd
-import requests
+from services.common.http_client import http_client
 
 """
 Dynamic Social Media Sentiment Aggregator
@@ -17,7 +17,7 @@ class DynamicSocialMediaSentimentAggregator:
         Args:
             asset: Name of the crypto asset.
         """
-        response = requests.get(f"{self.api_url}/social_sentiment/{asset}")
+        response = http_client.get(f"{self.api_url}/social_sentiment/{asset}")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['sentiment_data'])
         else:
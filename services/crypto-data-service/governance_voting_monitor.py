@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/governance_voting_monitor.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -16,7 +16,7 @@ class GovernanceVotingMonitor:
         """
         Fetch active governance proposals for the specified protocol.
         """
-        response = requests.get(f"{self.api_url}/protocols/{self.protocol}/governance")
+        response = http_client.get(f"{self.api_url}/protocols/{self.protocol}/governance")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['proposals'])
         else:
@@ -27,7 +27,7 @@ class GovernanceVotingMonitor:
         """
         Monitor votes for a specific governance proposal.
         """
-        response = requests.get(f"{self.api_url}/proposals/{proposal_id}/votes")
+        response = http_client.get(f"{self.api_url}/proposals/{proposal_id}/votes")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['votes'])
         else:
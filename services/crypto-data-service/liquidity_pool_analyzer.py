@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/liquidity_pool_analyzer.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -16,7 +16,7 @@ class LiquidityPoolAnalyzer:
         """
         Fetch liquidity pool data from the API.
         """
-        response = requests.get(f"{self.api_url}/pool/{self.pool_id}")
+        response = http_client.get(f"{self.api_url}/pool/{self.pool_id}")
         if response.status_code == 200:
             return pd.DataFrame([response.json()])
         else:
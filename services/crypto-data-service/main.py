@@ -2,10 +2,15 @@ from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
 import aiohttp
+import asyncio
+import logging
 import os
+import time
+from itertools import islice
 from dotenv import load_dotenv
 import ccxt
-import pandas as pd
+from services.common.ohlcv_store import ohlcv_store
+from services.common.candle_resampler import BASE_TIMEFRAME, DERIVED_TIMEFRAMES, candle_resampler
 
 load_dotenv()
 
@@ -16,6 +21,17 @@ CRYPTOCOMPARE_API_BASE_URL = "https://min-api.cryptocompare.com/data"
 BLOFIN_API_KEY = os.getenv("BLOFIN_API_KEY")
 BLOFIN_PASSWORD = os.getenv("BLOFIN_PASSWORD")
 BLOFIN_SECRET = os.getenv("BLOFIN_SECRET")
+# Seconds between 1m base-series downloads per symbol; higher timeframes are derived from it
+OHLCV_SYNC_INTERVAL = float(os.getenv("OHLCV_SYNC_INTERVAL", "10"))
+# /top-coins snapshot: coins kept, refresh period and how stale a snapshot may be served (seconds)
+TOP_COINS_SNAPSHOT_SIZE = int(os.getenv("TOP_COINS_SNAPSHOT_SIZE", "100"))
+TOP_COINS_REFRESH_INTERVAL = float(os.getenv("TOP_COINS_REFRESH_INTERVAL", "60"))
+TOP_COINS_MAX_STALE = float(os.getenv("TOP_COINS_MAX_STALE", "600"))
+# Largest snapshot a request may ask for; CryptoCompare returns at most 100 coins per page
+CRYPTOCOMPARE_PAGE_LIMIT = 100
+TOP_COINS_MAX_SIZE = int(os.getenv("TOP_COINS_MAX_SIZE", str(CRYPTOCOMPARE_PAGE_LIMIT)))
+
+logger = logging.getLogger(__name__)
 
 # Set up exchange (replace with your exchange of choice)
 exchange = ccxt.blofin({
@@ -32,25 +48,115 @@ class Coin(BaseModel):
     price: float
     percent_change_24h: float
 
-async def fetch_top_coins(limit: int = 100):
-    async with aiohttp.ClientSession() as session:
-        url = f"{CRYPTOCOMPARE_API_BASE_URL}/top/mktcapfull?limit={limit}&tsym=USD"
+class TopCoinsCache:
+    """
+    In-memory top-N snapshot kept fresh by a background task.
+    Requests are served from the snapshot; a stale snapshot is still served while
+    a refresh runs in the background, and only a missing or expired one is awaited.
+    """
+
+    def __init__(self, size: int, refresh_interval: float, max_stale: float, max_size: int = TOP_COINS_MAX_SIZE):
+        self.max_size = max_size
+        self.size = min(size, max_size)
+        self.refresh_interval = refresh_interval
+        self.max_stale = max_stale
+        self.coins: List[Coin] = []
+        self.day_trading_index: List[int] = []  # positions in coins, by (volume, |change|) descending
+        self.updated_at = 0.0
+        self.etag: Optional[str] = None
+        self.last_modified: Optional[str] = None
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.refresh_task: Optional[asyncio.Task] = None
+        self.refresh_size = 0  # snapshot size requested by refresh_task
+        self.loop_task: Optional[asyncio.Task] = None
+        self.stats = {'served': 0, 'refreshes': 0, 'not_modified': 0, 'errors': 0}
+
+    async def start(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=15),
+        )
+        self.loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self.loop_task is not None:
+            self.loop_task.cancel()
+        if self.session is not None:
+            await self.session.close()
+
+    def age(self) -> float:
+        return time.monotonic() - self.updated_at if self.updated_at else float('inf')
+
+    async def get(self, limit: int) -> List[Coin]:
+        limit = min(limit, self.max_size)
+        if limit > self.size:
+            # Grow the snapshot once; later refreshes keep the larger size
+            self.size = limit
+            await self.refresh()
+        elif self.age() > self.max_stale:
+            await self.refresh()
+        elif self.age() > self.refresh_interval:
+            self._refresh_in_background()
+        self.stats['served'] += 1
+        return self.coins[:limit]
+
+    async def refresh(self):
+        """
+        Fetch the snapshot; concurrent callers share one upstream request.
+        """
+        if self.refresh_task is not None and not self.refresh_task.done() and self.refresh_size < self.size:
+            await asyncio.shield(self.refresh_task)  # in flight for a smaller snapshot, fetch again after it
+        if self.refresh_task is None or self.refresh_task.done():
+            self._start_fetch()
+        await asyncio.shield(self.refresh_task)
+
+    def _start_fetch(self):
+        self.refresh_size = self.size
+        self.refresh_task = asyncio.create_task(self._fetch(self.size))
+
+    def _refresh_in_background(self):
+        if self.refresh_task is None or self.refresh_task.done():
+            self._start_fetch()
+            self.refresh_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Top coins refresh failed: {e}")
+            await asyncio.sleep(self.refresh_interval)
+
+    async def _fetch(self, size: int):
+        url = f"{CRYPTOCOMPARE_API_BASE_URL}/top/mktcapfull?limit={size}&tsym=USD"
         headers = {"authorization": f"Apikey {CRYPTOCOMPARE_API_KEY}"}
-        
-        async with session.get(url, headers=headers) as response:
+        # Conditional request: an unchanged snapshot costs a 304 instead of a full payload
+        if self.coins and len(self.coins) >= min(size, CRYPTOCOMPARE_PAGE_LIMIT):
+            if self.etag:
+                headers["If-None-Match"] = self.etag
+            if self.last_modified:
+                headers["If-Modified-Since"] = self.last_modified
+
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304:
+                self.stats['not_modified'] += 1
+                self.updated_at = time.monotonic()
+                return
             if response.status != 200:
+                self.stats['errors'] += 1
                 raise HTTPException(status_code=response.status, detail="Failed to fetch data from CryptoCompare")
-            
+
             data = await response.json()
-            
+
             if data["Response"] != "Success":
+                self.stats['errors'] += 1
                 raise HTTPException(status_code=400, detail=data["Message"])
-            
+
             coins = []
             for coin in data["Data"]:
                 coin_info = coin["CoinInfo"]
                 raw_data = coin["RAW"]["USD"] if "RAW" in coin and "USD" in coin["RAW"] else {}
-                
+
                 coins.append(Coin(
                     symbol=coin_info["Name"],
                     name=coin_info["FullName"],
@@ -59,29 +165,58 @@ async def fetch_top_coins(limit: int = 100):
                     price=raw_data.get("PRICE", 0),
                     percent_change_24h=raw_data.get("CHANGEPCT24HOUR", 0)
                 ))
-            
-            return coins
 
-def filter_day_trading_coins(coins: List[Coin], limit: int) -> List[Coin]:
-    # Sort coins by volume and percent change to find interesting day trading opportunities
+            # Swap in the new snapshot and its presorted index together
+            self.day_trading_index = sorted(range(len(coins)), key=lambda i: (coins[i].volume_24h, abs(coins[i].percent_change_24h)), reverse=True)
+            self.coins = coins
+            self.etag = response.headers.get("ETag")
+            self.last_modified = response.headers.get("Last-Modified")
+            self.updated_at = time.monotonic()
+            self.stats['refreshes'] += 1
+
+
+top_coins_cache = TopCoinsCache(TOP_COINS_SNAPSHOT_SIZE, TOP_COINS_REFRESH_INTERVAL, TOP_COINS_MAX_STALE)
+
+
+async def fetch_top_coins(limit: int = 100):
+    return await top_coins_cache.get(limit)
+
+def filter_day_trading_coins(coins: List[Coin], limit: int, index: Optional[List[int]] = None) -> List[Coin]:
+    # Sort coins by volume and percent change to find interesting day trading opportunities.
+    # With a presorted index over the snapshot, coins is a prefix of it and nothing is re-sorted.
+    if index is not None:
+        return list(islice((coins[i] for i in index if i < len(coins)), limit))
     sorted_coins = sorted(coins, key=lambda x: (x.volume_24h, abs(x.percent_change_24h)), reverse=True)
     return sorted_coins[:limit]
 
+@app.on_event("startup")
+async def start_top_coins_refresher():
+    await top_coins_cache.start()
+
+@app.on_event("shutdown")
+async def stop_top_coins_refresher():
+    await top_coins_cache.stop()
+
 @app.get("/top-coins")
 async def get_top_coins(limit: Optional[int] = 100, day_trading_filter: Optional[int] = None):    
     coins = await fetch_top_coins(limit)
     
     if day_trading_filter:
-        coins = filter_day_trading_coins(coins, day_trading_filter)
+        coins = filter_day_trading_coins(coins, day_trading_filter, top_coins_cache.day_trading_index)
     
     return coins
 
 @app.get("/fetch_ohlcv")
 def fetch_ohlcv(symbol, timeframe='5m', limit=500):
-    bars = exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
-    df = pd.DataFrame(bars, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    return df
+    # Only bars newer than the stored ones are downloaded; the rest is served from disk.
+    # 5m..1d are derived from the 1m series, so every timeframe of a symbol shares one download.
+    limit = int(limit)
+    if timeframe in DERIVED_TIMEFRAMES:
+        candle_resampler.sync(exchange, symbol, [timeframe], limit=limit, min_interval=OHLCV_SYNC_INTERVAL)
+    else:
+        ohlcv_store.sync(exchange, symbol, timeframe, limit=limit,
+                         min_interval=OHLCV_SYNC_INTERVAL if timeframe == BASE_TIMEFRAME else 0)
+    return ohlcv_store.frame(exchange.id, symbol, timeframe, limit=limit)
 
 
 if __name__ == "__main__":
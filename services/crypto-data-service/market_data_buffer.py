@@ -0,0 +1,188 @@
+# File path: CryptIQ-Micro-Frontend/services/crypto-data-service/market_data_buffer.py
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib decoder is the fallback
+    _loads = json.loads
+
+"""
+Ring-Buffer Market Data Store
+
+Fixed-size, typed columns (price, size, side, timestamp, symbol) for streamed
+trades and ticks. Every row is written twice, at i and i + capacity, so the live
+window is always one contiguous slice and readers get read-only NumPy views
+without copying. Rows leave the window when it is full or older than the
+retention period; with a spill directory they are written to .npz files first.
+Rows are kept in arrival order. Time lookups search a running maximum of the
+timestamps, so a late row never breaks the search; it just stays in the window
+until a newer row follows it.
+"""
+
+logger = logging.getLogger(__name__)
+
+SIDES = {'buy': 1, 'bid': 1, 'b': 1, 'sell': -1, 'ask': -1, 'a': -1, 's': -1}
+COLUMNS = {'price': np.float64, 'size': np.float64, 'side': np.int8, 'timestamp': np.int64, 'symbol': np.int32}
+
+
+def _timestamp_ns(value) -> int:
+    """
+    Exchange timestamps arrive as epoch ms (Binance) or ISO-8601 strings (Coinbase).
+    """
+    if isinstance(value, (int, float)):
+        return int(value * 1_000_000)
+    return int(datetime.fromisoformat(value.replace('Z', '+00:00')[:32]).timestamp() * 1e9)
+
+
+class MarketDataBuffer:
+    def __init__(self, capacity: int = 1_000_000, retention: Optional[float] = None, spill_dir: Optional[str] = None,
+                 spill_chunk: Optional[int] = None):
+        """
+        Args:
+            capacity: Maximum rows kept in memory.
+            retention: Keep only rows newer than this many seconds before the latest row (None keeps all).
+            spill_dir: Write evicted rows to .npz files here (None discards them).
+            spill_chunk: Rows evicted at once when the buffer is full (default capacity / 8).
+        """
+        self.capacity = capacity
+        self.retention_ns = int(retention * 1e9) if retention else None
+        self.spill_dir = spill_dir
+        self.spill_chunk = spill_chunk or max(capacity // 8, 1)
+        self.data = {name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.watermark = np.zeros(2 * capacity, dtype=np.int64)  # max timestamp up to each row, non-decreasing
+        self.start = 0  # logical index of the oldest row
+        self.end = 0  # logical index one past the newest row
+        self.cutoff: Optional[int] = None  # rows older than this are outside the retention window
+        self.symbols: List[str] = []
+        self.symbol_ids: Dict[str, int] = {}
+        self.stats = {'messages': 0, 'rows': 0, 'skipped': 0, 'evicted': 0, 'spilled_files': 0}
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+
+    def __len__(self):
+        lo, hi = self._bounds()
+        return hi - lo
+
+    def symbol_id(self, symbol: Optional[str]) -> int:
+        if symbol is None:
+            return -1
+        if symbol not in self.symbol_ids:
+            self.symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return self.symbol_ids[symbol]
+
+    def append(self, price: float, size: float, side: int, timestamp: int, symbol: Optional[str] = None):
+        """
+        Append one row; timestamp in epoch nanoseconds.
+        """
+        if self.end - self.start == self.capacity:
+            self._evict(self.start + self.spill_chunk)
+        i = self.end % self.capacity
+        symbol = self.symbol_id(symbol)
+        if self.end > self.start:
+            watermark = max(timestamp, self.watermark[(self.end - 1) % self.capacity])
+        else:
+            watermark = timestamp
+        for offset in (i, i + self.capacity):
+            self.data['price'][offset] = price
+            self.data['size'][offset] = size
+            self.data['side'][offset] = side
+            self.data['timestamp'][offset] = timestamp
+            self.data['symbol'][offset] = symbol
+            self.watermark[offset] = watermark
+        self.end += 1
+        self.stats['rows'] += 1
+        if self.retention_ns is not None:
+            self.cutoff = watermark - self.retention_ns
+            self._expire()
+
+    def append_message(self, message: Union[str, bytes, dict]) -> Optional[dict]:
+        """
+        Decode a raw feed message and store it if it carries a trade or tick price.
+        Returns the decoded message.
+        """
+        data = _loads(message) if isinstance(message, (str, bytes)) else message
+        self.stats['messages'] += 1
+        if not isinstance(data, dict):
+            self.stats['skipped'] += 1
+            return data
+        if data.get('e') in ('24hrTicker', '24hrMiniTicker'):
+            price = data.get('c')  # Binance tickers: 'p' is the price change, 'c' the last price
+        else:
+            price = data.get('price', data.get('p'))
+        if price is None:
+            self.stats['skipped'] += 1
+            return data
+
+        size = data.get('last_size', data.get('size', data.get('q', data.get('Q', 0))))
+        if 'side' in data:
+            side = SIDES.get(str(data['side']).lower(), 0)
+        elif 'm' in data:
+            side = -1 if data['m'] else 1  # Binance: buyer is maker means the aggressor sold
+        else:
+            side = 0
+        stamp = data.get('time', data.get('T', data.get('E')))
+        timestamp = _timestamp_ns(stamp) if stamp is not None else time.time_ns()
+        self.append(float(price), float(size), side, timestamp, data.get('product_id', data.get('s')))
+        return data
+
+    def view(self, column: str, since: Optional[int] = None) -> np.ndarray:
+        """
+        Read-only, zero-copy view of a column over the live window (optionally from a timestamp in ns).
+        Valid until the next append.
+        """
+        lo, hi = self._bounds()
+        if since is not None:
+            lo += int(np.searchsorted(self.watermark[lo:hi], since))
+        view = self.data[column][lo:hi]
+        view.flags.writeable = False
+        return view
+
+    def columns(self, since: Optional[int] = None) -> Dict[str, np.ndarray]:
+        return {name: self.view(name, since) for name in COLUMNS}
+
+    def to_frame(self, since: Optional[int] = None):
+        import pandas as pd
+
+        frame = pd.DataFrame({name: column.copy() for name, column in self.columns(since).items()})
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'], unit='ns', utc=True)
+        frame['symbol'] = [self.symbols[i] if i >= 0 else None for i in frame['symbol']]
+        return frame
+
+    def _bounds(self):
+        lo = self.start % self.capacity
+        hi = lo + self.end - self.start
+        if self.cutoff is not None:
+            lo += int(np.searchsorted(self.watermark[lo:hi], self.cutoff))
+        return lo, hi
+
+    def _expire(self):
+        # Expired rows are hidden by _bounds right away but only evicted (and spilled) in chunks
+        expired = self._bounds()[0] - self.start % self.capacity
+        if expired >= self.spill_chunk:
+            self._evict(self.start + expired)
+
+    def _evict(self, new_start: int):
+        count = new_start - self.start
+        if self.spill_dir:
+            lo = self.start % self.capacity
+            chunk = {name: column[lo:lo + count] for name, column in self.data.items()}
+            path = os.path.join(self.spill_dir, f"market_data_{chunk['timestamp'][0]}_{chunk['timestamp'][-1]}.npz")
+            np.savez(path, symbols=np.array(self.symbols, dtype=str), **chunk)
+            self.stats['spilled_files'] += 1
+        self.start = new_start
+        self.stats['evicted'] += count
+
+# Example Usage:
+# buffer = MarketDataBuffer(capacity=500_000, retention=3600, spill_dir="/data/spill")
+# buffer.append_message('{"type": "ticker", "product_id": "BTC-USD", "price": "43000.1", "last_size": "0.01", "side": "buy", "time": "2024-01-01T00:00:00.000000Z"}')
+# prices = buffer.view('price')  # zero-copy, read-only
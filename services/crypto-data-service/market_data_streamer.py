@@ -1,26 +1,37 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/market_data_streamer.py
 
 import websocket
-import json
+import logging
 import pandas as pd
+from typing import Optional
+from market_data_buffer import MarketDataBuffer
 
 """
 WebSocket-Based Market Data Streamer
 """
 
+logger = logging.getLogger(__name__)
+
 class MarketDataStreamer:
-    def __init__(self, url: str):
+    def __init__(self, url: str, capacity: int = 1_000_000, retention: Optional[float] = None,
+                 spill_dir: Optional[str] = None):
+        """
+        Args:
+            url: WebSocket endpoint.
+            capacity: Maximum messages kept in memory.
+            retention: Seconds of data to keep (None keeps up to capacity).
+            spill_dir: Directory for evicted data (None discards it).
+        """
         self.url = url
         self.ws = None
-        self.market_data = []
+        self.market_data = MarketDataBuffer(capacity, retention, spill_dir)
 
     def on_open(self, ws):
         print("Connection opened")
 
     def on_message(self, ws, message):
-        data = json.loads(message)
-        self.market_data.append(data)
-        print(f"Received Data: {data}")
+        data = self.market_data.append_message(message)
+        logger.debug("Received Data: %s", data)
 
     def on_error(self, ws, error):
         print(f"Error: {error}")
@@ -1,7 +1,8 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/ml_sentiment_analyzer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 import pandas as pd
+from batch_sentiment import DEFAULT_BATCH_SIZE, score_texts
 
 """
 Machine Learning-Based Sentiment Analyzer
@@ -18,12 +19,18 @@ class MLSentimentAnalyzer:
         result = self.sentiment_model(text)
         return result[0]['label'], result[0]['score']
 
-    def bulk_analyze(self, texts: pd.Series):
+    def bulk_analyze(self, texts: pd.Series, batch_size: int = DEFAULT_BATCH_SIZE):
         """
         Analyze sentiment in bulk for a series of texts.
+        Duplicate texts are scored once and the rest run in length-bucketed batches.
+        Args:
+            texts: Series of texts.
+            batch_size: Number of texts per forward pass.
         """
-        return texts.apply(lambda text: self.analyze_sentiment(text))
+        results = score_texts(self.sentiment_model, texts, batch_size=batch_size)
+        return pd.Series([(r['label'], r['score']) if r else None for r in results], index=texts.index, dtype=object)
 
 # Example usage
-analyzer = MLSentimentAnalyzer()
-print(analyzer.analyze_sentiment("Bitcoin is surging to new highs!"))
+if __name__ == "__main__":
+    analyzer = MLSentimentAnalyzer()
+    print(analyzer.analyze_sentiment("Bitcoin is surging to new highs!"))
@@ -2,42 +2,64 @@
 
 import ccxt
 import pandas as pd
+from typing import Optional
+from services.common.market_data_gateway import MarketDataGateway, market_data_gateway
+from services.common.order_book import OrderBook, merge_books
+from order_book_feed import OrderBookFeed
 
 """
 Multi-Exchange Order Book Consolidator
 """
 
 class MultiExchangeOrderBookConsolidator:
-    def __init__(self, exchanges: list, trading_pair: str):
+    def __init__(self, exchanges: list, trading_pair: str, gateway: MarketDataGateway = market_data_gateway,
+                 feed: Optional[OrderBookFeed] = None):
+        """
+        Args:
+            feed: Streaming order book feed; venues it has a live book for are read locally instead of over REST.
+        """
         self.exchanges = exchanges
         self.trading_pair = trading_pair
+        self.gateway = gateway
+        self.feed = feed
+        if feed is not None:
+            for exchange in exchanges:
+                if exchange.id in feed.aliases:
+                    feed.subscribe(exchange.id, trading_pair)
+        self.last_snapshot = None
 
     def fetch_order_books(self):
         """
-        Fetch order books from all registered exchanges.
+        Fetch order books from all registered exchanges concurrently.
+        Venues with a live streamed book are read from the feed; the REST snapshot is kept in last_snapshot.
         """
-        order_books = {}
-        for exchange in self.exchanges:
-            try:
-                order_books[exchange.name] = exchange.fetch_order_book(self.trading_pair)
-            except Exception as e:
-                order_books[exchange.name] = f"Error: {e}"
+        streamed = {}
+        if self.feed is not None:
+            for exchange in self.exchanges:
+                book = self.feed.try_order_book(exchange.id, self.trading_pair)
+                if book is not None:
+                    streamed[exchange.name] = book
+        polled = [exchange for exchange in self.exchanges if exchange.name not in streamed]
+        self.last_snapshot = self.gateway.run(self.gateway.fetch_order_books(polled, self.trading_pair))
+        order_books = {venue: quote.data if quote.ok else f"Error: {quote.error}"
+                       for venue, quote in self.last_snapshot.quotes.items()}
+        order_books.update(streamed)
         return order_books
 
     def consolidate_order_books(self, order_books: dict):
         """
         Consolidate order books from multiple exchanges into a unified view.
         """
-        bid_data, ask_data = [], []
-        for exchange_name, book in order_books.items():
-            if isinstance(book, dict) and len(book['bids']) > 0 and len(book['asks']) > 0:
-                bid_data.extend([(exchange_name, bid[0], bid[1]) for bid in book['bids']])
-                ask_data.extend([(exchange_name, ask[0], ask[1]) for ask in book['asks']])
+        books = {exchange_name: OrderBook.from_ccxt(book, exchange_name)
+                 for exchange_name, book in order_books.items()
+                 if isinstance(book, dict) and len(book['bids']) > 0 and len(book['asks']) > 0}
+        merged = merge_books(books)
 
-        bid_df = pd.DataFrame(bid_data, columns=['Exchange', 'Price', 'Size']).sort_values(by='Price', ascending=False)
-        ask_df = pd.DataFrame(ask_data, columns=['Exchange', 'Price', 'Size']).sort_values(by='Price')
+        def to_frame(side):
+            return pd.DataFrame({'Exchange': [side.venue_names[i] for i in side.venues],
+                                 'Price': side.prices, 'Size': side.sizes})
 
-        return bid_df, ask_df
+        return to_frame(merged['bids']), to_frame(merged['asks'])
 
 # Example usage
 exchange1 = ccxt.binance()
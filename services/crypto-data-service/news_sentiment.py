@@ -1,7 +1,8 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/news_sentiment.py
 
-import requests
-from transformers import pipeline
+from services.common.http_client import http_client
+from services.common.model_registry import pipeline
+from batch_sentiment import score_texts
 
 """
  News Sentiment Analysis Service
@@ -18,7 +19,7 @@ def fetch_latest_news(keyword: str):
     Fetch the latest news articles for the specified keyword.
     """
     params = {'q': keyword, 'apiKey': NEWS_API_KEY, 'sortBy': 'publishedAt'}
-    response = requests.get(NEWS_API_URL, params=params)
+    response = http_client.get(NEWS_API_URL, params=params)
     return response.json().get("articles", [])
 
 def analyze_news_sentiment(keyword: str):
@@ -26,7 +27,8 @@ def analyze_news_sentiment(keyword: str):
     Analyze sentiment for the latest news articles on a specific keyword.
     """
     articles = fetch_latest_news(keyword)
-    sentiment_scores = [news_sentiment_model(article['description'])[0] for article in articles if article['description']]
+    descriptions = [article['description'] for article in articles if article.get('description')]
+    sentiment_scores = [s for s in score_texts(news_sentiment_model, descriptions) if s]
 
     sentiment_summary = {
         "positive": len([s for s in sentiment_scores if s['label'] == 'POSITIVE']),
@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/on_chain_whale_transaction_tracker.py
 
 import pandas as pd
-import requests
+from services.common.http_client import http_client
 
 """
 On-Chain Whale Transaction Tracker
@@ -15,7 +15,7 @@ class OnChainWhaleTransactionTracker:
         """
         Fetch on-chain whale transactions.
         """
-        response = requests.get(f"{self.provider_url}/whale_transactions")
+        response = http_client.get(f"{self.provider_url}/whale_transactions")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['transactions'])
         else:
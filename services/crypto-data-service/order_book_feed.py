@@ -0,0 +1,410 @@
+# File path: CryptIQ-Micro-Frontend/services/crypto-data-service/order_book_feed.py
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from services.common.http_client import http_client
+import websocket
+from services.common.order_book import OrderBook
+
+"""
+Streaming L2 Order Book Feeds
+
+Keeps one WebSocket connection per venue (the MarketDataStreamer approach) with
+any number of symbol subscriptions on it. Each venue adapter turns the raw
+messages into snapshot / delta events; the feed applies them to an in-memory L2
+book per (venue, symbol), checks sequence numbers, and resynchronises a book
+from a fresh snapshot whenever a gap is detected or the connection drops.
+Consumers read the local books instead of calling fetch_order_book over REST.
+"""
+
+logger = logging.getLogger(__name__)
+
+Level = Tuple[float, float]
+
+
+@dataclass
+class BookEvent:
+    symbol: str
+    kind: str  # 'snapshot' or 'delta'
+    bids: List[Level] = field(default_factory=list)
+    asks: List[Level] = field(default_factory=list)
+    first_seq: Optional[int] = None  # first update id covered by this event
+    last_seq: Optional[int] = None  # last update id covered by this event
+    timestamp: Optional[int] = None  # exchange time (ms)
+
+
+class VenueAdapter:
+    """
+    Venue-specific protocol: URL, subscription messages, message parsing and resync.
+    """
+    name = ''
+    aliases: Tuple[str, ...] = ()
+    url = ''
+    rest_snapshot = False  # True if resync needs a REST snapshot, False if the stream resends one
+
+    def venue_symbol(self, symbol: str) -> str:
+        raise NotImplementedError
+
+    def subscribe_message(self, symbols: List[str]) -> Optional[dict]:
+        raise NotImplementedError
+
+    def unsubscribe_message(self, symbols: List[str]) -> Optional[dict]:
+        return None
+
+    def parse(self, message: dict) -> List[BookEvent]:
+        raise NotImplementedError
+
+    def fetch_snapshot(self, symbol: str) -> BookEvent:
+        raise NotImplementedError
+
+
+class BinanceAdapter(VenueAdapter):
+    """
+    Binance diff-depth stream (U/u update ids) plus the REST depth snapshot.
+    """
+    name = 'binance'
+    url = 'wss://stream.binance.com:9443/ws'
+    rest_snapshot = True
+    depth_url = 'https://api.binance.com/api/v3/depth'
+
+    def __init__(self, snapshot_depth: int = 1000):
+        self.snapshot_depth = snapshot_depth
+        self.symbols: Dict[str, str] = {}
+
+    def venue_symbol(self, symbol: str) -> str:
+        venue_symbol = symbol.replace('/', '').upper()
+        self.symbols[venue_symbol] = symbol
+        return venue_symbol
+
+    def subscribe_message(self, symbols):
+        return {'method': 'SUBSCRIBE', 'params': [f"{self.venue_symbol(s).lower()}@depth@100ms" for s in symbols], 'id': 1}
+
+    def unsubscribe_message(self, symbols):
+        return {'method': 'UNSUBSCRIBE', 'params': [f"{self.venue_symbol(s).lower()}@depth@100ms" for s in symbols], 'id': 2}
+
+    def parse(self, message):
+        if message.get('e') != 'depthUpdate':
+            return []
+        return [BookEvent(symbol=self.symbols.get(message['s'], message['s']), kind='delta',
+                          bids=[(float(p), float(q)) for p, q in message['b']],
+                          asks=[(float(p), float(q)) for p, q in message['a']],
+                          first_seq=message['U'], last_seq=message['u'], timestamp=message.get('E'))]
+
+    def fetch_snapshot(self, symbol):
+        response = http_client.get(self.depth_url, params={'symbol': self.venue_symbol(symbol), 'limit': self.snapshot_depth},
+                                   timeout=10, cache=False)
+        response.raise_for_status()
+        data = response.json()
+        return BookEvent(symbol=symbol, kind='snapshot',
+                         bids=[(float(p), float(q)) for p, q in data['bids']],
+                         asks=[(float(p), float(q)) for p, q in data['asks']],
+                         last_seq=data['lastUpdateId'])
+
+
+class CoinbaseAdapter(VenueAdapter):
+    """
+    Coinbase Exchange level2_batch channel: a snapshot on subscribe, then l2update changes.
+    The channel carries no sequence numbers, so resync is a re-subscribe.
+    """
+    name = 'coinbase'
+    aliases = ('coinbasepro', 'coinbaseexchange')
+    url = 'wss://ws-feed.exchange.coinbase.com'
+
+    def venue_symbol(self, symbol: str) -> str:
+        return symbol.replace('/', '-').upper()
+
+    def subscribe_message(self, symbols):
+        return {'type': 'subscribe', 'product_ids': [self.venue_symbol(s) for s in symbols], 'channels': ['level2_batch']}
+
+    def unsubscribe_message(self, symbols):
+        return {'type': 'unsubscribe', 'product_ids': [self.venue_symbol(s) for s in symbols], 'channels': ['level2_batch']}
+
+    def parse(self, message):
+        kind = message.get('type')
+        if kind not in ('snapshot', 'l2update'):
+            return []
+        symbol = message['product_id'].replace('-', '/')
+        if kind == 'snapshot':
+            return [BookEvent(symbol=symbol, kind='snapshot',
+                              bids=[(float(p), float(q)) for p, q in message['bids']],
+                              asks=[(float(p), float(q)) for p, q in message['asks']])]
+        event = BookEvent(symbol=symbol, kind='delta')
+        for side, price, size in message['changes']:
+            (event.bids if side == 'buy' else event.asks).append((float(price), float(size)))
+        return [event]
+
+
+ADAPTERS = {adapter.name: adapter for adapter in (BinanceAdapter, CoinbaseAdapter)}
+
+
+class _BookState:
+    def __init__(self):
+        self.book = OrderBook()
+        self.lock = threading.Lock()
+        self.live = False
+        self.buffer: List[BookEvent] = []  # deltas received while a REST snapshot is in flight
+        self.generation = 0  # bumped on every resync so stale snapshot loads are dropped
+        self.resyncs = 0
+
+
+class _VenueConnection:
+    """
+    One WebSocket to a venue, reconnecting with backoff until stopped.
+    """
+
+    def __init__(self, feed: "OrderBookFeed", adapter: VenueAdapter):
+        self.feed = feed
+        self.adapter = adapter
+        self.symbols: List[str] = []
+        self.ws: Optional[websocket.WebSocketApp] = None
+        self.thread: Optional[threading.Thread] = None
+        self.running = False
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name=f"l2-feed-{self.adapter.name}", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.ws is not None:
+            self.ws.close()
+
+    def send(self, message: Optional[dict]):
+        if message is not None and self.ws is not None and self.ws.sock and self.ws.sock.connected:
+            self.ws.send(json.dumps(message))
+
+    def _run(self):
+        backoff = 1
+        while self.running:
+            started = time.monotonic()
+            self.ws = websocket.WebSocketApp(self.adapter.url,
+                                             on_open=self._on_open,
+                                             on_message=self._on_message,
+                                             on_error=self._on_error,
+                                             on_close=self._on_close)
+            self.ws.run_forever(ping_interval=20, ping_timeout=10)
+            if not self.running:
+                break
+            backoff = 1 if time.monotonic() - started > 60 else min(backoff * 2, 30)
+            logger.warning(f"{self.adapter.name} feed disconnected, reconnecting in {backoff}s")
+            time.sleep(backoff)
+
+    def _on_open(self, ws):
+        logger.info(f"{self.adapter.name} feed connected")
+        for symbol in self.symbols:
+            self.feed._begin_sync(self.adapter, symbol)
+        self.send(self.adapter.subscribe_message(self.symbols))
+
+    def _on_message(self, ws, message):
+        for event in self.adapter.parse(json.loads(message)):
+            self.feed._apply(self.adapter, event)
+
+    def _on_error(self, ws, error):
+        logger.error(f"{self.adapter.name} feed error: {error}")
+
+    def _on_close(self, ws, *args):
+        for symbol in self.symbols:
+            self.feed._mark_stale(self.adapter.name, symbol)
+
+
+class OrderBookFeed:
+    """
+    Local L2 books kept current from venue WebSocket streams.
+    """
+
+    def __init__(self, adapters: Optional[Dict[str, VenueAdapter]] = None):
+        self.adapters = adapters or {name: cls() for name, cls in ADAPTERS.items()}
+        self.aliases = {alias: name for name, adapter in self.adapters.items() for alias in (name, *adapter.aliases)}
+        self.connections: Dict[str, _VenueConnection] = {}
+        self.books: Dict[Tuple[str, str], _BookState] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, venue: str, symbol: str):
+        """
+        Start maintaining the book for symbol on venue (e.g. 'binance', 'BTC/USDT').
+        """
+        venue = self.aliases[venue]
+        with self._lock:
+            if (venue, symbol) in self.books:
+                return
+            self.books[(venue, symbol)] = _BookState()
+            connection = self.connections.get(venue)
+            if connection is None:
+                connection = self.connections[venue] = _VenueConnection(self, self.adapters[venue])
+                connection.symbols.append(symbol)
+                connection.start()
+                return
+            connection.symbols.append(symbol)
+        self._begin_sync(connection.adapter, symbol)
+        connection.send(connection.adapter.subscribe_message([symbol]))
+
+    def unsubscribe(self, venue: str, symbol: str):
+        venue = self.aliases[venue]
+        with self._lock:
+            self.books.pop((venue, symbol), None)
+            connection = self.connections.get(venue)
+            if connection is None or symbol not in connection.symbols:
+                return
+            connection.symbols.remove(symbol)
+        connection.send(connection.adapter.unsubscribe_message([symbol]))
+
+    def stop(self):
+        for connection in self.connections.values():
+            connection.stop()
+        self.connections.clear()
+
+    # Readers
+
+    def is_live(self, venue: str, symbol: str) -> bool:
+        state = self.books.get((self.aliases.get(venue, venue), symbol))
+        return state is not None and state.live
+
+    def best_bid_ask(self, venue: str, symbol: str) -> Tuple[Optional[Level], Optional[Level]]:
+        state = self._live_state(venue, symbol)
+        with state.lock:
+            return state.book.best_bid(), state.book.best_ask()
+
+    def order_book(self, venue: str, symbol: str, limit: Optional[int] = None) -> dict:
+        """
+        The local book in ccxt's fetch_order_book shape.
+        """
+        state = self._live_state(venue, symbol)
+        with state.lock:
+            book = state.book.top(limit)
+            book.update({'symbol': symbol, 'timestamp': state.book.timestamp or state.book.received_at,
+                         'nonce': state.book.sequence})
+        return book
+
+    def try_order_book(self, venue: str, symbol: str, limit: Optional[int] = None) -> Optional[dict]:
+        """
+        Same as order_book(), or None if the book is not live (callers then fall back to REST).
+        """
+        try:
+            return self.order_book(venue, symbol, limit)
+        except LookupError:
+            return None
+
+    def stats(self) -> Dict[str, Dict]:
+        return {f"{venue}:{symbol}": {'live': state.live, 'sequence': state.book.sequence, 'resyncs': state.resyncs}
+                for (venue, symbol), state in list(self.books.items())}
+
+    def _live_state(self, venue: str, symbol: str) -> _BookState:
+        state = self.books.get((self.aliases.get(venue, venue), symbol))
+        if state is None or not state.live:
+            raise LookupError(f"No live order book for {symbol} on {venue}")
+        return state
+
+    # Book maintenance (called from connection threads)
+
+    def _begin_sync(self, adapter: VenueAdapter, symbol: str):
+        state = self.books.get((adapter.name, symbol))
+        if state is None:
+            return
+        with state.lock:
+            state.live = False
+            state.buffer = []
+            state.book.clear()
+            state.generation += 1
+            generation = state.generation
+        if adapter.rest_snapshot:
+            threading.Thread(target=self._load_snapshot, args=(adapter, symbol, generation), daemon=True).start()
+
+    def _load_snapshot(self, adapter: VenueAdapter, symbol: str, generation: int):
+        try:
+            snapshot = adapter.fetch_snapshot(symbol)
+        except Exception as e:
+            logger.error(f"Snapshot for {symbol} on {adapter.name} failed: {e}")
+            time.sleep(1)
+            snapshot = None
+        state = self.books.get((adapter.name, symbol))
+        if state is None or state.generation != generation:
+            return
+        if snapshot is None:
+            return self._begin_sync(adapter, symbol)
+        with state.lock:
+            self._reset(state.book, snapshot)
+            buffered, state.buffer = state.buffer, []
+            state.live = True
+            for event in buffered:
+                if not self._apply_delta(state, event):
+                    break
+            else:
+                return
+        self._resync(adapter, symbol, state)
+
+    def _apply(self, adapter: VenueAdapter, event: BookEvent):
+        state = self.books.get((adapter.name, event.symbol))
+        if state is None:
+            return
+        with state.lock:
+            if event.kind == 'snapshot':
+                self._reset(state.book, event)
+                state.live = True
+                return
+            if not state.live:
+                if adapter.rest_snapshot:
+                    state.buffer.append(event)
+                return
+            if self._apply_delta(state, event):
+                return
+        self._resync(adapter, event.symbol, state)
+
+    def _apply_delta(self, state: _BookState, event: BookEvent) -> bool:
+        """
+        Apply a delta in sequence; returns False on a gap (the book needs a resync).
+        """
+        book = state.book
+        if event.last_seq is not None and book.sequence is not None:
+            if event.last_seq <= book.sequence:
+                return True  # already contained in the snapshot
+            if event.first_seq > book.sequence + 1:
+                state.live = False
+                return False
+        for price, size in event.bids:
+            book.update('bids', price, size)
+        for price, size in event.asks:
+            book.update('asks', price, size)
+        if event.last_seq is not None:
+            book.sequence = event.last_seq
+        book.timestamp = event.timestamp
+        book.received_at = int(time.time() * 1000)
+        return True
+
+    def _reset(self, book: OrderBook, snapshot: BookEvent):
+        book.bids.load(snapshot.bids)
+        book.asks.load(snapshot.asks)
+        book.sequence = snapshot.last_seq
+        book.timestamp = snapshot.timestamp
+        book.received_at = int(time.time() * 1000)
+
+    def _resync(self, adapter: VenueAdapter, symbol: str, state: _BookState):
+        state.resyncs += 1
+        logger.warning(f"Sequence gap on {adapter.name} {symbol}, resyncing")
+        self._begin_sync(adapter, symbol)
+        if not adapter.rest_snapshot:
+            connection = self.connections.get(adapter.name)
+            if connection is not None:
+                connection.send(adapter.unsubscribe_message([symbol]))
+                connection.send(adapter.subscribe_message([symbol]))
+
+    def _mark_stale(self, venue: str, symbol: str):
+        state = self.books.get((venue, symbol))
+        if state is not None:
+            with state.lock:
+                state.live = False
+
+
+# Process-wide feed
+order_book_feed = OrderBookFeed()
+
+# Example Usage:
+# order_book_feed.subscribe('binance', 'BTC/USDT')
+# order_book_feed.subscribe('coinbase', 'BTC/USDT')
+# order_book_feed.best_bid_ask('binance', 'BTC/USDT')   # once is_live(...) is True
+# order_book_feed.order_book('coinbase', 'BTC/USDT', limit=20)
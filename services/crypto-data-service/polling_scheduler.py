@@ -0,0 +1,155 @@
+# File path: CryptIQ-Micro-Frontend/services/crypto-data-service/polling_scheduler.py
+
+import asyncio
+import inspect
+import logging
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+"""
+Concurrent Polling Scheduler
+
+Runs registered data sources on one event loop, each on its own cadence. Ticks
+are scheduled on a fixed grid from the start time, so upstream latency does not
+make the interval drift. A small random jitter spreads requests. A tick is
+skipped, not queued, while the previous fetch of that source is still running,
+including a blocking fetch whose timeout abandoned it but whose thread has not
+returned yet, so one hung source cannot fill the thread pool.
+Every completed fetch publishes the merged snapshot of all sources to the
+subscribers.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PollingSource:
+    name: str
+    fetch: Callable[[], Any]
+    interval: float
+    jitter: float
+    timeout: Optional[float]
+    stats: Dict[str, Any] = field(default_factory=lambda: {'runs': 0, 'skipped': 0, 'errors': 0, 'last_latency': None})
+    inflight: Optional[asyncio.Task] = None
+    thread_call: Optional[Future] = None
+
+
+class PollingScheduler:
+    def __init__(self, jitter: float = 0.1, max_threads: int = 8):
+        """
+        Args:
+            jitter: Default jitter as a fraction of each source's interval.
+            max_threads: Threads for blocking (non-async) fetch functions.
+        """
+        self.jitter = jitter
+        self.sources: Dict[str, PollingSource] = {}
+        self.subscribers: List[Callable[[Dict], Any]] = []
+        self.data: Dict[str, Any] = {}
+        self.fetched_at: Dict[str, float] = {}
+        self.executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="polling")
+        self.tasks: List[asyncio.Task] = []
+
+    def register(self, name: str, fetch: Callable[[], Any], interval: float,
+                 jitter: Optional[float] = None, timeout: Optional[float] = None):
+        """
+        Add a data source.
+        Args:
+            name: Key of the source's data in published snapshots.
+            fetch: Function or coroutine function returning the source's data.
+            interval: Seconds between ticks.
+            jitter: Jitter fraction for this source (defaults to the scheduler's).
+            timeout: Abandon a fetch after this many seconds (None waits).
+        """
+        self.sources[name] = PollingSource(name, fetch, interval, self.jitter if jitter is None else jitter, timeout)
+
+    def subscribe(self, callback: Callable[[Dict], Any]) -> Callable[[], None]:
+        """
+        Receive every merged snapshot; callback may be a function or a coroutine function.
+        Returns a function that unsubscribes.
+        """
+        self.subscribers.append(callback)
+        return lambda: self.subscribers.remove(callback)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {**self.data, 'timestamps': dict(self.fetched_at)}
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: dict(source.stats) for name, source in self.sources.items()}
+
+    async def run(self):
+        """
+        Poll every source until stop() is called.
+        """
+        started = time.monotonic()
+        self.tasks = [asyncio.create_task(self._poll(source, started)) for source in self.sources.values()]
+        try:
+            await asyncio.gather(*self.tasks)
+        except asyncio.CancelledError:
+            pass
+
+    def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        for source in self.sources.values():
+            if source.inflight is not None:
+                source.inflight.cancel()
+
+    async def _poll(self, source: PollingSource, started: float):
+        tick = 0
+        while True:
+            if self._busy(source):
+                source.stats['skipped'] += 1
+            else:
+                source.inflight = asyncio.create_task(self._run_once(source))
+
+            # Next grid point after now (catches up by skipping missed ticks rather than bunching them)
+            tick = max(tick + 1, int((time.monotonic() - started) / source.interval) + 1)
+            delay = started + tick * source.interval - time.monotonic()
+            await asyncio.sleep(max(delay, 0) + random.uniform(0, source.jitter * source.interval))
+
+    @staticmethod
+    def _busy(source: PollingSource) -> bool:
+        # A timed out blocking fetch keeps its thread until it returns
+        return ((source.inflight is not None and not source.inflight.done()) or
+                (source.thread_call is not None and not source.thread_call.done()))
+
+    async def _run_once(self, source: PollingSource):
+        begun = time.monotonic()
+        try:
+            if inspect.iscoroutinefunction(source.fetch):
+                call = source.fetch()
+            else:
+                source.thread_call = self.executor.submit(source.fetch)
+                call = asyncio.wrap_future(source.thread_call)
+            data = await asyncio.wait_for(call, source.timeout) if source.timeout else await call
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            source.stats['errors'] += 1
+            logger.error(f"Polling {source.name} failed: {e}")
+            return
+        source.stats['runs'] += 1
+        source.stats['last_latency'] = time.monotonic() - begun
+        self.data[source.name] = data
+        self.fetched_at[source.name] = time.time()
+        await self._publish()
+
+    async def _publish(self):
+        snapshot = self.snapshot()
+        for callback in list(self.subscribers):
+            try:
+                result = callback(snapshot)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Snapshot subscriber failed: {e}")
+
+# Example Usage:
+# scheduler = PollingScheduler()
+# scheduler.register('market_data', fetch_exchange_data, interval=5)
+# scheduler.register('social_data', fetch_social_data, interval=30)
+# scheduler.subscribe(lambda snapshot: publish_to_dashboard(snapshot))
+# asyncio.run(scheduler.run())
@@ -1,6 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/real_time_onchain_data_fetcher.py
 
 from web3 import Web3
+from services.common.head_tracker import get_head_tracker
 
 """
 Real-Time On-Chain Data Fetcher
@@ -9,12 +10,14 @@ Real-Time On-Chain Data Fetcher
 class RealTimeOnChainDataFetcher:
     def __init__(self, provider_url: str):
         self.w3 = Web3(Web3.HTTPProvider(provider_url))
+        self.head = get_head_tracker(self.w3)
 
     def fetch_latest_block(self):
         """
         Fetch the latest block data from the blockchain.
+        Served from the shared head tracker, which polls the node once for all callers.
         """
-        latest_block = self.w3.eth.get_block('latest')
+        latest_block = self.head.latest()
         return latest_block
 
     def fetch_address_balance(self, address: str):
@@ -1,19 +1,55 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/real_time_sentiment.py
 
+import queue
+import threading
 import time
-from transformers import pipeline
+from services.common.model_registry import pipeline
+from batch_sentiment import score_texts
 
 # Load pre-trained sentiment model
 sentiment_analyzer = pipeline("sentiment-analysis", model="vaishali/CryptoBERT")
 
-def monitor_sentiment(streaming_data_source):
+def monitor_sentiment(streaming_data_source, batch_size: int = 32):
     """
     Monitors sentiment in real-time using a streaming data source.
     Args:
         streaming_data_source: Function or API to stream data in real-time.
+        batch_size: Maximum number of pending messages scored together per cycle.
     """
+    # A reader thread pulls from the (possibly blocking) source, so each cycle can wait for
+    # the first message and then take only what is already pending without blocking again
+    pending = queue.Queue(maxsize=batch_size * 4)
+    threading.Thread(target=_read_messages, args=(streaming_data_source, pending), daemon=True).start()
+
     while True:
-        message = streaming_data_source.get_next_message()
-        sentiment = sentiment_analyzer(message)
-        print(f"Sentiment Analysis: {message} -> {sentiment[0]['label']} ({sentiment[0]['score']})")
+        messages = [pending.get()]
+        while len(messages) < batch_size:
+            try:
+                messages.append(pending.get_nowait())
+            except queue.Empty:
+                break
+        # The reader queues its exception and stops; score what came before it, then re-raise
+        failures = [message for message in messages if isinstance(message, _ReaderError)]
+        messages = [message for message in messages if not isinstance(message, _ReaderError)]
+
+        for message, sentiment in zip(messages, score_texts(sentiment_analyzer, messages, batch_size=batch_size)):
+            if sentiment:
+                print(f"Sentiment Analysis: {message} -> {sentiment['label']} ({sentiment['score']})")
+        if failures:
+            raise failures[0].error
         time.sleep(1)  # Add a delay for demonstration purposes
+
+class _ReaderError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+def _read_messages(streaming_data_source, pending: queue.Queue):
+    try:
+        while True:
+            message = streaming_data_source.get_next_message()
+            if message is None:
+                time.sleep(0.1)  # Nothing available from a non-blocking source
+                continue
+            pending.put(message)
+    except BaseException as e:
+        pending.put(_ReaderError(e))
@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/real_time_whale_tracker.py
 
 import pandas as pd
-import requests
+from services.common.http_client import http_client
 
 """
 Real-Time Whale Tracker
@@ -17,7 +17,7 @@ class RealTimeWhaleTracker:
         Args:
             min_value: Minimum transaction value to be considered a whale transaction.
         """
-        response = requests.get(f"{self.api_url}/whale_transactions")
+        response = http_client.get(f"{self.api_url}/whale_transactions")
         if response.status_code == 200:
             data = pd.DataFrame(response.json()['transactions'])
             return data[data['value'] >= min_value]
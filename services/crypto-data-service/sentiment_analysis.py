@@ -1,6 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/sentiment_analysis.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
+from services.common.sentiment_cache import sentiment_cache
 
 # Load a pre-trained sentiment analysis model (e.g., CryptoBERT)
 sentiment_model = pipeline("sentiment-analysis", model="vaishali/CryptoBERT")
@@ -10,5 +11,5 @@ def analyze_sentiment(text: str):
     Analyzes the sentiment of the given text.
     Returns a score between -1 (negative) and 1 (positive).
     """
-    result = sentiment_model(text)
-    return result[0]["label"], result[0]["score"]
+    result = sentiment_cache.get_or_score(sentiment_model.model, [text], sentiment_model)[text]
+    return result["label"], result["score"]
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/smart_liquidity_pool_monitor.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -18,7 +18,7 @@ class SmartLiquidityPoolMonitor:
         """
         pool_data = []
         for pool_id in self.pool_ids:
-            response = requests.get(f"{self.api_url}/pools/{pool_id}")
+            response = http_client.get(f"{self.api_url}/pools/{pool_id}")
             if response.status_code == 200:
                 pool_data.append(response.json())
             else:
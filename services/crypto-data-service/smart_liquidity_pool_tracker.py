@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/smart_liquidity_pool_tracker.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -15,7 +15,7 @@ class SmartLiquidityPoolTracker:
         """
         Fetch current liquidity pools from a DeFi protocol API.
         """
-        response = requests.get(f"{self.api_url}/liquidity_pools")
+        response = http_client.get(f"{self.api_url}/liquidity_pools")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['data'])
         else:
@@ -1,7 +1,9 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/social_sentiment_aggregator.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
+from batch_sentiment import score_texts
+from sentiment_analysis import sentiment_model
 
 """
 Social Media Sentiment Aggregator
@@ -24,7 +26,7 @@ class SocialSentimentAggregator:
             return pd.DataFrame()
 
         params = {'q': keyword}
-        response = requests.get(url, params=params)
+        response = http_client.get(url, params=params)
         if response.status_code == 200:
             return pd.DataFrame(response.json()['data'])
         else:
@@ -43,6 +45,22 @@ class SocialSentimentAggregator:
 
         return pd.concat(all_sentiment, ignore_index=True) if all_sentiment else pd.DataFrame()
 
+    def score_sentiment(self, social_data: pd.DataFrame, text_column: str = 'text'):
+        """
+        Posts with sentiment label and score columns added (the input frame is not modified).
+        Posts already scored (here or by another sentiment service) come from the shared cache.
+        Args:
+            social_data: Posts as returned by aggregate_sentiment.
+            text_column: Column holding the post text.
+        """
+        if social_data.empty or text_column not in social_data:
+            return social_data
+        results = score_texts(sentiment_model, social_data[text_column])
+        social_data = social_data.copy()
+        social_data['sentiment_label'] = [r['label'] if r else None for r in results]
+        social_data['sentiment_score'] = [r['score'] if r else None for r in results]
+        return social_data
+
 # Example usage
 api_urls = {
     'twitter': 'https://api.twitter.com/2/tweets/search/recent',
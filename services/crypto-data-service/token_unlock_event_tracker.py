@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/token_unlock_event_tracker.py
 
 import pandas as pd
-import requests
+from services.common.http_client import http_client
 
 """
 Token Unlock Event Tracker
@@ -15,7 +15,7 @@ class TokenUnlockEventTracker:
         """
         Fetch upcoming token unlock events.
         """
-        response = requests.get(f"{self.api_url}/token_unlocks")
+        response = http_client.get(f"{self.api_url}/token_unlocks")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['unlocks'])
         else:
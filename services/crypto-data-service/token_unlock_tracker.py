@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/token_unlock_tracker.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 """
@@ -15,7 +15,7 @@ class TokenUnlockTracker:
         """
         Fetch upcoming token unlocks from the API.
         """
-        response = requests.get(f"{self.api_url}/upcoming-unlocks")
+        response = http_client.get(f"{self.api_url}/upcoming-unlocks")
         if response.status_code == 200:
             return pd.DataFrame(response.json()['data'])
         else:
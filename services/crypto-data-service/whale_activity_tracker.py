@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/whale_activity_tracker.py
 
-import requests
+from services.common.http_client import http_client
 import pandas as pd
 
 ETHERSCAN_API_URL = "https://api.etherscan.io/api"
@@ -28,7 +28,7 @@ class WhaleActivityTracker:
             "sort": "desc",
             "apikey": ETHERSCAN_API_KEY
         }
-        response = requests.get(ETHERSCAN_API_URL, params=params)
+        response = http_client.get(ETHERSCAN_API_URL, params=params)
         if response.status_code == 200:
             return pd.DataFrame(response.json().get("result", []))
         else:
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/whale_alert.py
 
-import requests
+from services.common.http_client import http_client
 
 """
 Whale Wallet Analysis with Alert System
@@ -15,7 +15,7 @@ def fetch_whale_transactions(wallet_address: str, token_address: str = ""):
     url = f"https://api.etherscan.io/api?module=account&action=tokentx&address={wallet_address}&sort=desc&apikey={ETHERSCAN_API_KEY}"
     if token_address:
         url += f"&contractaddress={token_address}"
-    response = requests.get(url)
+    response = http_client.get(url)
     return response.json().get("result", []) if response.status_code == 200 else []
 
 def analyze_whale_activity(wallet_address: str, token_address: str = ""):
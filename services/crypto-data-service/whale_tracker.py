@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/crypto-data-service/whale_tracker.py
 
-import requests
+from services.common.http_client import http_client
 
 ETHERSCAN_API_KEY = "your_etherscan_api_key"
 
@@ -8,7 +8,7 @@ def fetch_whale_transactions(wallet_address: str, token_address: str = ""):
     url = f"https://api.etherscan.io/api?module=account&action=tokentx&address={wallet_address}&sort=desc&apikey={ETHERSCAN_API_KEY}"
     if token_address:
         url += f"&contractaddress={token_address}"
-    response = requests.get(url)
+    response = http_client.get(url)
     if response.status_code == 200:
         return response.json().get("result", [])
     return []
@@ -0,0 +1,115 @@
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import logging
+import os
+
+from dynamic_batcher import DynamicBatcher, QueueFullError
+
+"""
+Shared NLP Inference Service
+
+Hosts one Hugging Face pipeline per (task, model) for every service in the
+platform and serves them through dynamic micro-batching on CPU. Services call
+it through services/common/inference_client.py instead of loading models
+themselves.
+"""
+
+app = FastAPI()
+
+MAX_BATCH_SIZE = int(os.getenv("INFERENCE_MAX_BATCH_SIZE", "8"))
+MAX_WAIT_MS = float(os.getenv("INFERENCE_MAX_WAIT_MS", "25"))
+MAX_QUEUE = int(os.getenv("INFERENCE_MAX_QUEUE", "256"))
+# Comma-separated "task:model" pairs loaded at startup, e.g. "text-generation:EleutherAI/gpt-neo-2.7B"
+PRELOAD = [item for item in os.getenv("INFERENCE_PRELOAD", "").split(",") if item]
+# Optional comma-separated allowlist of model names
+ALLOWED_MODELS = {item for item in os.getenv("INFERENCE_ALLOWED_MODELS", "").split(",") if item}
+
+logger = logging.getLogger(__name__)
+
+batchers: Dict[Tuple[str, Optional[str]], DynamicBatcher] = {}
+load_locks: Dict[Tuple[str, Optional[str]], asyncio.Lock] = {}
+
+
+class InferenceRequest(BaseModel):
+    task: str
+    model: Optional[str] = None
+    inputs: Any
+    parameters: Dict[str, Any] = {}
+
+
+def load_pipeline(task: str, model: Optional[str]):
+    from transformers import pipeline
+
+    pipe = pipeline(task, model=model, device=-1)
+    tokenizer = getattr(pipe, "tokenizer", None)
+    if tokenizer is not None and tokenizer.pad_token_id is None:
+        # GPT-style tokenizers have no pad token; batching needs one
+        tokenizer.pad_token_id = pipe.model.config.eos_token_id
+        if task == "text-generation":
+            tokenizer.padding_side = "left"
+    return pipe
+
+
+async def get_batcher(task: str, model: Optional[str]) -> DynamicBatcher:
+    key = (task, model)
+    if key in batchers:
+        return batchers[key]
+    if ALLOWED_MODELS and model not in ALLOWED_MODELS:
+        raise HTTPException(status_code=403, detail=f"Model '{model}' is not served here")
+
+    lock = load_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        if key not in batchers:
+            logger.info(f"Loading pipeline {task} / {model}")
+            pipe = await asyncio.get_running_loop().run_in_executor(None, load_pipeline, task, model)
+            batcher = DynamicBatcher(pipe, MAX_BATCH_SIZE, MAX_WAIT_MS, MAX_QUEUE)
+            batcher.start()
+            batchers[key] = batcher
+    return batchers[key]
+
+
+@app.on_event("startup")
+async def preload_models():
+    for item in PRELOAD:
+        task, _, model = item.partition(":")
+        await get_batcher(task, model or None)
+
+
+@app.on_event("shutdown")
+async def stop_batchers():
+    for batcher in batchers.values():
+        await batcher.stop()
+
+
+@app.post("/infer")
+async def infer(request: InferenceRequest):
+    batcher = await get_batcher(request.task, request.model)
+    single = not isinstance(request.inputs, list)
+    inputs = [request.inputs] if single else request.inputs
+
+    tasks = [asyncio.ensure_future(batcher.submit(text, request.parameters)) for text in inputs]
+    try:
+        outputs = await asyncio.gather(*tasks)
+    except QueueFullError:
+        for task in tasks:
+            task.cancel()
+        raise HTTPException(status_code=503, detail="Inference queue is full", headers={"Retry-After": "1"})
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {"outputs": outputs[0] if single else outputs}
+
+
+@app.get("/stats")
+async def stats():
+    return {
+        f"{task}:{model}": {**batcher.stats, 'queued': batcher.queue.qsize()}
+        for (task, model), batcher in batchers.items()
+    }
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=5020)
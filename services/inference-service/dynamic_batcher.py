@@ -0,0 +1,122 @@
+# services/inference-service/dynamic_batcher.py
+# Groups concurrent inference requests for one model into micro-batches.
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QueueFullError(Exception):
+    """Raised when a batcher's queue is at capacity (backpressure)."""
+
+
+class DynamicBatcher:
+    """
+    Collects requests for a single pipeline and runs them as micro-batches.
+
+    A batch is dispatched when it reaches max_batch_size or when the oldest
+    request has waited max_wait_ms, whichever comes first. Requests with
+    different generation parameters are batched separately. Inference runs on
+    a dedicated thread so the event loop keeps accepting requests meanwhile.
+    """
+
+    def __init__(self,
+                 pipe: Callable,
+                 max_batch_size: int = 8,
+                 max_wait_ms: float = 20.0,
+                 max_queue: int = 256):
+        self.pipe = pipe
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.worker: Optional[asyncio.Task] = None
+        self.stats = {'requests': 0, 'batches': 0, 'rejected': 0, 'avg_batch_size': 0.0}
+
+    def start(self):
+        if self.worker is None:
+            self.worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            try:
+                await self.worker
+            except asyncio.CancelledError:
+                pass
+            self.worker = None
+        self.executor.shutdown(wait=False)
+
+    async def submit(self, text: Any, parameters: Optional[Dict] = None) -> Any:
+        """
+        Queue one input and wait for its result.
+        Raises QueueFullError instead of waiting when the queue is full.
+        """
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((text, parameters or {}, future))
+        except asyncio.QueueFull:
+            self.stats['rejected'] += 1
+            raise QueueFullError("Inference queue is full")
+        self.stats['requests'] += 1
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, Dict, asyncio.Future]]:
+        batch = [await self.queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # asyncio.wait (unlike wait_for before 3.12) never swallows a cancellation of this task
+            getter = asyncio.ensure_future(self.queue.get())
+            try:
+                done, _ = await asyncio.wait({getter}, timeout=remaining)
+            finally:
+                if not getter.done():
+                    getter.cancel()
+            if getter not in done:
+                break
+            batch.append(getter.result())
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+
+            groups: Dict[str, List[Tuple[Any, Dict, asyncio.Future]]] = {}
+            for item in batch:
+                groups.setdefault(json.dumps(item[1], sort_keys=True), []).append(item)
+
+            for items in groups.values():
+                items = [item for item in items if not item[2].cancelled()]
+                if not items:
+                    continue
+                texts = [item[0] for item in items]
+                parameters = items[0][1]
+                try:
+                    outputs = await loop.run_in_executor(
+                        self.executor, lambda: self.pipe(texts, batch_size=len(texts), **parameters)
+                    )
+                except Exception as e:
+                    logger.error(f"Batch inference failed: {e}")
+                    for _, _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, _, future), output in zip(items, outputs):
+                    if not future.done():
+                        future.set_result(output)
+                self._record_batch(len(items))
+
+    def _record_batch(self, size: int):
+        batches = self.stats['batches'] + 1
+        self.stats['avg_batch_size'] += (size - self.stats['avg_batch_size']) / batches
+        self.stats['batches'] = batches
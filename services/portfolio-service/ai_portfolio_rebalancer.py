@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/portfolio-service/ai_portfolio_rebalancer.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Portfolio Rebalancing Advisor
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 import ccxt
 import ta
 import pandas as pd
+from services.common.indicator_cache import indicator_cache
 
 load_dotenv()
 
@@ -23,9 +24,15 @@ exchange = ccxt.blofin({
 })
 
 # Identify trend or range conditions
-def identify_market_conditions(df):
-    macd, macdsignal, _ = ta.MACD(df['close'], fastperiod=12, slowperiod=26, signalperiod=9)
-    atr = ta.ATR(df['high'], df['low'], df['close'], timeperiod=14)
+def identify_market_conditions(df, symbol=None, timeframe=None):
+    macd, macdsignal, _ = indicator_cache.get(
+        df, 'MACD', lambda d: ta.MACD(d['close'], fastperiod=12, slowperiod=26, signalperiod=9),
+        params={'fastperiod': 12, 'slowperiod': 26, 'signalperiod': 9}, symbol=symbol, timeframe=timeframe
+    )
+    atr = indicator_cache.get(
+        df, 'ATR', lambda d: ta.ATR(d['high'], d['low'], d['close'], timeperiod=14),
+        params={'timeperiod': 14}, symbol=symbol, timeframe=timeframe
+    )
     is_trending = (abs(macd - macdsignal) > atr)
     return is_trending
 
@@ -2,39 +2,37 @@
 """
  Backtesting Module with Expanded Metrics
 """
+import numpy as np
 import pandas as pd
+from backtest_core import BUY, generate_signals
 
-def run_backtest(strategy_function, data: pd.DataFrame):
+def run_backtest(strategy_function, data: pd.DataFrame, vectorized: bool = False):
     """
     Runs a backtest on historical data using the provided strategy.
     Args:
         strategy_function: The trading strategy to backtest.
         data: Historical OHLCV data.
+        vectorized: True if strategy_function returns one signal per bar for the whole frame.
     """
     initial_balance = 10000
-    current_balance = initial_balance
-    trades = 0
-    max_drawdown = 0
-    peak_balance = initial_balance
+    signals = generate_signals(strategy_function, data, vectorized=vectorized)
 
-    for i in range(1, len(data)):
-        signal = strategy_function(data.iloc[:i])  # Run strategy on slice of data
+    # A 'buy' decided on bar i - 1 earns the close-to-close return of bar i
+    close = data['close'].to_numpy(dtype=np.float64)
+    exposed = np.zeros(len(close), dtype=bool)
+    exposed[1:] = signals[:-1] == BUY
+    growth = np.ones(len(close))
+    growth[1:] = np.where(exposed[1:], close[1:] / close[:-1], 1.0)
+    balance = initial_balance * np.cumprod(growth)
 
-        # Example trade execution logic
-        if signal == 'buy':
-            trades += 1
-            current_balance *= 1 + (data['close'].iloc[i] - data['close'].iloc[i - 1]) / data['close'].iloc[i - 1]
-
-        # Track peak balance to compute drawdown
-        if current_balance > peak_balance:
-            peak_balance = current_balance
-
-        drawdown = (peak_balance - current_balance) / peak_balance
-        max_drawdown = max(max_drawdown, drawdown)
+    # Track peak balance to compute drawdown
+    peak_balance = np.maximum.accumulate(np.maximum(balance, initial_balance))
+    drawdown = (peak_balance - balance) / peak_balance
+    current_balance = float(balance[-1]) if len(balance) else initial_balance
 
     return {
         'final_balance': current_balance,
-        'trades': trades,
+        'trades': int(np.count_nonzero(exposed)),
         'profit': current_balance - initial_balance,
-        'max_drawdown': max_drawdown * 100
+        'max_drawdown': float(drawdown.max(initial=0)) * 100
     }
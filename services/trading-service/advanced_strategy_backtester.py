@@ -1,6 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/advanced_strategy_backtester.py
 
 import pandas as pd
+from backtest_core import backtest
 
 """
 Advanced Trading Strategy Backtester
@@ -11,16 +12,23 @@ class AdvancedStrategyBacktester:
         self.data = data
         self.trades = []
 
-    def backtest_strategy(self, strategy_function):
+    def backtest_strategy(self, strategy_function, vectorized: bool = False):
         """
         Backtest the given trading strategy on the provided data.
+        Args:
+            strategy_function: Per-bar strategy (stepped through a zero-copy cursor) or,
+                with vectorized=True, a function returning one signal per bar.
+            vectorized: Whether strategy_function emits the full signal array at once.
         """
-        for i in range(1, len(self.data)):
-            signal = strategy_function(self.data.iloc[:i])
-            if signal == 'buy' and not self.has_open_position():
-                self.open_trade(i, 'buy')
-            elif signal == 'sell' and self.has_open_position():
-                self.close_trade(i, 'sell')
+        result = backtest(strategy_function, self.data, vectorized=vectorized)
+        close = self.data['close'].to_numpy()
+        self.trades = []
+        for n, entry in enumerate(result.entries):
+            trade = {'entry_index': int(entry), 'entry_price': close[entry], 'action': 'buy', 'status': 'open'}
+            if n < len(result.exits):
+                exit_index = result.exits[n]
+                trade.update({'exit_index': int(exit_index), 'exit_price': close[exit_index], 'status': 'closed'})
+            self.trades.append(trade)
 
         return self.calculate_performance()
 
@@ -61,6 +69,8 @@ data = pd.DataFrame({'close': [100, 102, 105, 103, 107, 110, 108]})
 
 # Dummy strategy: Buy if price increases, Sell if price decreases
 def dummy_strategy(data):
+    if len(data) < 2:
+        return 'hold'
     if data['close'].iloc[-1] > data['close'].iloc[-2]:
         return 'buy'
     else:
@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/ai_pattern_recognition.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Based Trading Pattern Recognition
@@ -22,6 +22,7 @@ class AIPatternRecognition:
         return result
 
 # Example usage
-pattern_recognizer = AIPatternRecognition()
-patterns = ["head and shoulders", "double top", "ascending triangle", "descending triangle"]
-print(pattern_recognizer.detect_trading_patterns([100, 105, 110, 107, 103, 101, 99, 95], patterns))
+if __name__ == "__main__":
+    pattern_recognizer = AIPatternRecognition()
+    patterns = ["head and shoulders", "double top", "ascending triangle", "descending triangle"]
+    print(pattern_recognizer.detect_trading_patterns([100, 105, 110, 107, 103, 101, 99, 95], patterns))
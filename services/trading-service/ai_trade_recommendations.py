@@ -1,6 +1,6 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/ai_trade_recommendations.py
 
-from transformers import pipeline
+from services.common.model_registry import pipeline
 import pandas as pd
 
 """
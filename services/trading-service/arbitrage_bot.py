@@ -8,17 +8,27 @@ Cross-Exchange Arbitrage Bot
 """
 
 class CrossExchangeArbitrageBot:
-    def __init__(self, exchange1: ccxt.Exchange, exchange2: ccxt.Exchange, symbol: str):
+    def __init__(self, exchange1: ccxt.Exchange, exchange2: ccxt.Exchange, symbol: str, feed=None):
+        """
+        Args:
+            feed: Optional streaming order book feed (try_order_book, e.g. crypto-data-service's
+                  OrderBookFeed); live books are read from it instead of fetched over REST.
+        """
         self.exchange1 = exchange1
         self.exchange2 = exchange2
         self.symbol = symbol
+        self.feed = feed
+
+    def _order_book(self, exchange: ccxt.Exchange):
+        book = self.feed.try_order_book(exchange.id, self.symbol, limit=1) if self.feed is not None else None
+        return book if book is not None else exchange.fetch_order_book(self.symbol)
 
     def fetch_prices(self):
         """
         Fetch bid/ask prices from both exchanges for the specified trading pair.
         """
-        order_book1 = self.exchange1.fetch_order_book(self.symbol)
-        order_book2 = self.exchange2.fetch_order_book(self.symbol)
+        order_book1 = self._order_book(self.exchange1)
+        order_book2 = self._order_book(self.exchange2)
 
         exchange1_ask = order_book1['asks'][0][0] if len(order_book1['asks']) > 0 else None
         exchange2_bid = order_book2['bids'][0][0] if len(order_book2['bids']) > 0 else None
@@ -0,0 +1,276 @@
+# File path: CryptIQ-Micro-Frontend/services/trading-service/backtest_core.py
+
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Sequence
+
+"""
+Vectorized Event-Driven Backtest Core
+
+Shared by AdvancedStrategyBacktester, backtest_engine and advanced_backtesting.
+Strategies either emit a full signal array once (vectorized) or are stepped
+bar-by-bar through a BarCursor, which exposes zero-copy NumPy views instead of
+copying `data.iloc[:i]` on every bar. A per-bar strategy that needs pandas
+(`.rolling`, `.diff`, non-numeric columns) is given `data.iloc[:i]` slices
+instead. Fills, position state and PnL are then computed in a single
+vectorized pass.
+
+Signal convention: signals[j] is the decision taken after observing bar j and
+is filled at the close of bar j + 1 (no look-ahead). 'buy' opens a long when
+flat, 'sell' closes it when long, anything else holds.
+"""
+
+BUY = 1
+SELL = -1
+HOLD = 0
+
+
+class CursorColumn(np.ndarray):
+    """
+    Read-only NumPy view of a column up to the cursor position.
+    Exposes `.iloc` so legacy strategies written against pandas
+    (e.g. `data['close'].iloc[-1]`) keep working without a copy.
+    """
+
+    @property
+    def iloc(self):
+        return self.view(np.ndarray)
+
+    @property
+    def values(self):
+        return self.view(np.ndarray)
+
+
+class BarCursor:
+    """
+    Zero-copy cursor over preallocated, contiguous NumPy columns.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = {}
+        for name, values in columns.items():
+            array = np.ascontiguousarray(values)
+            array.flags.writeable = False
+            self.columns[name] = array
+        self.length = len(next(iter(self.columns.values()))) if self.columns else 0
+        self.position = 0
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, columns: Optional[Sequence[str]] = None):
+        """
+        Build a cursor from a DataFrame, extracting each column once.
+        Args:
+            data: Historical OHLCV data.
+            columns: Columns to expose (defaults to every numeric column).
+        """
+        if columns is None:
+            columns = [c for c in data.columns if data[c].dtype.kind in 'biuf']
+        return cls({c: data[c].to_numpy(dtype=np.float64) for c in columns})
+
+    def advance(self, position: int):
+        """
+        Move the cursor so that it exposes bars [0, position).
+        """
+        self.position = max(0, min(position, self.length))
+        return self
+
+    def __len__(self):
+        return self.position
+
+    def __getitem__(self, column: str) -> CursorColumn:
+        return self.columns[column][:self.position].view(CursorColumn)
+
+    def __contains__(self, column: str):
+        return column in self.columns
+
+    def last(self, column: str = 'close') -> float:
+        """
+        Most recent visible value of a column.
+        """
+        return self.columns[column][self.position - 1]
+
+
+@dataclass
+class BacktestResult:
+    equity: np.ndarray
+    position: np.ndarray
+    entries: np.ndarray
+    exits: np.ndarray
+    trade_returns: np.ndarray
+    trade_pnl: np.ndarray
+    initial_balance: float
+    stats: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def final_balance(self) -> float:
+        return float(self.equity[-1]) if len(self.equity) else self.initial_balance
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.stats)
+
+
+def encode_signals(signals) -> np.ndarray:
+    """
+    Normalize a signal sequence to an int8 array of BUY/SELL/HOLD.
+    Accepts 'buy'/'sell' strings (other values hold) or numeric arrays (+1/-1/0).
+    """
+    if isinstance(signals, pd.Series):
+        signals = signals.to_numpy()
+    array = np.asarray(signals)
+    if array.dtype.kind in 'biuf':
+        return np.sign(np.nan_to_num(array.astype(np.float64))).astype(np.int8)
+
+    encoded = np.zeros(len(array), dtype=np.int8)
+    lowered = np.char.lower(array.astype(str))
+    encoded[lowered == 'buy'] = BUY
+    encoded[lowered == 'sell'] = SELL
+    return encoded
+
+
+def generate_signals(strategy_function: Callable, data: pd.DataFrame, vectorized: bool = False,
+                     frames: Optional[bool] = None) -> np.ndarray:
+    """
+    Produce one signal per bar.
+    Args:
+        strategy_function: Either a vectorized function returning a signal array for
+            the whole frame, or a per-bar function stepped through a BarCursor.
+        data: Historical OHLCV data.
+        vectorized: True if strategy_function emits the full signal array in one call.
+        frames: Per-bar input: False steps a BarCursor, True passes `data.iloc[:i]` slices,
+            None (default) uses the cursor and switches to slices for the rest of the run
+            if the strategy fails on it (e.g. it calls pandas methods).
+    """
+    n = len(data)
+    if vectorized:
+        signals = encode_signals(strategy_function(data))
+        if len(signals) != n:
+            raise ValueError(f"Strategy returned {len(signals)} signals for {n} bars.")
+        return signals
+
+    cursor = BarCursor.from_frame(data) if not frames else None
+    raw = np.empty(n, dtype=object)
+    raw[:] = None
+    for j in range(n - 1):
+        if cursor is not None:
+            try:
+                raw[j] = strategy_function(cursor.advance(j + 1))
+                continue
+            except Exception:
+                if frames is False:
+                    raise
+                cursor = None  # not cursor-compatible; errors of its own re-raise below
+        raw[j] = strategy_function(data.iloc[:j + 1])
+    return encode_signals(raw)
+
+
+def positions_from_signals(signals: np.ndarray) -> np.ndarray:
+    """
+    Derive the long/flat position held at the close of each bar.
+    A fill at bar i uses the signal from bar i - 1; the state is the last
+    non-hold signal seen so far, forward-filled in one pass.
+    """
+    n = len(signals)
+    executed = np.zeros(n, dtype=np.int8)
+    executed[1:] = signals[:-1]
+    last_event = np.where(executed != HOLD, np.arange(n), 0)
+    np.maximum.accumulate(last_event, out=last_event)
+    return (executed[last_event] == BUY).astype(np.int8)
+
+
+def run_backtest(
+    close,
+    signals,
+    initial_balance: float = 10000,
+    fee_rate: float = 0.0,
+) -> BacktestResult:
+    """
+    Compute fills, position state and PnL in a single vectorized pass.
+    Args:
+        close: Close prices, one per bar.
+        signals: Encoded or raw signals, one per bar (see encode_signals).
+        initial_balance: Starting balance.
+        fee_rate: Proportional fee charged on every entry and exit.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    signals = encode_signals(signals)
+    n = len(close)
+    if len(signals) != n:
+        raise ValueError("close and signals must have the same length.")
+    if n == 0:
+        empty = np.empty(0)
+        return BacktestResult(empty, empty.astype(np.int8), empty.astype(np.intp), empty.astype(np.intp),
+                              empty, empty, initial_balance, _summarize(empty, empty, empty, initial_balance))
+
+    position = positions_from_signals(signals)
+    change = np.diff(position, prepend=np.int8(0))
+    entries = np.flatnonzero(change == 1)
+    exits = np.flatnonzero(change == -1)
+
+    bar_returns = np.zeros(n)
+    bar_returns[1:] = close[1:] / close[:-1] - 1.0
+    growth = 1.0 + position[:-1] * bar_returns[1:]
+    growth = np.concatenate(([1.0], growth))
+    if fee_rate:
+        growth *= np.where(change != 0, 1.0 - fee_rate, 1.0)
+    equity = initial_balance * np.cumprod(growth)
+
+    closed = len(exits)
+    entry_prices = close[entries[:closed]]
+    exit_prices = close[exits]
+    trade_returns = exit_prices / entry_prices * (1.0 - fee_rate) ** 2 - 1.0
+    trade_pnl = exit_prices - entry_prices
+
+    stats = _summarize(equity, trade_returns, entries, initial_balance)
+    return BacktestResult(equity, position, entries, exits, trade_returns, trade_pnl, initial_balance, stats)
+
+
+def backtest(
+    strategy_function: Callable,
+    data: pd.DataFrame,
+    initial_balance: float = 10000,
+    vectorized: bool = False,
+    fee_rate: float = 0.0,
+) -> BacktestResult:
+    """
+    Generate signals for `data` and run the vectorized backtest on its close prices.
+    """
+    signals = generate_signals(strategy_function, data, vectorized=vectorized)
+    return run_backtest(data['close'].to_numpy(dtype=np.float64), signals, initial_balance, fee_rate)
+
+
+def load_bars(venue: str, symbol: str, timeframe: str, start: Optional[int] = None, end: Optional[int] = None,
+              store=None) -> pd.DataFrame:
+    """
+    Historical candles for a backtest from the shared on-disk OHLCV store (start/end in epoch ms).
+    """
+    if store is None:
+        # Imported here so the backtest core itself has no dependency on the common service
+        from services.common.ohlcv_store import ohlcv_store as store
+    return store.frame(venue, symbol, timeframe, start=start, end=end)
+
+
+def _summarize(equity: np.ndarray, trade_returns: np.ndarray, entries: np.ndarray, initial_balance: float) -> Dict[str, float]:
+    """
+    Headline statistics for a run.
+    """
+    if len(equity) == 0:
+        final_balance, max_drawdown = initial_balance, 0.0
+    else:
+        final_balance = float(equity[-1])
+        peaks = np.maximum.accumulate(equity)
+        max_drawdown = float(np.max((peaks - equity) / peaks))
+    return {
+        'final_balance': final_balance,
+        'total_profit': final_balance - initial_balance,
+        'total_trades': int(len(entries)),
+        'closed_trades': int(len(trade_returns)),
+        'win_rate': float(np.mean(trade_returns > 0)) if len(trade_returns) else 0.0,
+        'max_drawdown': max_drawdown * 100,
+    }
+
+# Example Usage:
+# data = pd.DataFrame({'close': [100, 102, 105, 103, 107, 110, 108]})
+# momentum = lambda df: np.where(df['close'].diff() > 0, 'buy', 'sell')
+# result = backtest(momentum, data, vectorized=True)
+# print(result.stats)
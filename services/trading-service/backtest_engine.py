@@ -1,33 +1,42 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/backtest_engine.py
 
+import numpy as np
 import pandas as pd
+from backtest_core import BUY, SELL, generate_signals
 
 """
 Trade Execution Backtest Engine
 """
 
-def backtest_trade_execution(strategy_function, data: pd.DataFrame, initial_balance: float = 10000):
+def backtest_trade_execution(strategy_function, data: pd.DataFrame, initial_balance: float = 10000, vectorized: bool = False):
     """
     Runs a trade execution backtest with a specified strategy.
     Args:
         strategy_function: Trading strategy function.
         data: Historical OHLCV data.
         initial_balance: Starting balance for the backtest.
+        vectorized: True if strategy_function returns one signal per bar for the whole frame.
     """
+    signals = generate_signals(strategy_function, data, vectorized=vectorized)
+    close = data['close'].to_numpy(dtype=np.float64)
+
+    # Only bars with a buy/sell decision can trade; the decision on bar j fills at close j + 1
     balance = initial_balance
     position = 0
-    for i in range(1, len(data)):
-        signal = strategy_function(data.iloc[:i])
-        
-        if signal == 'buy' and balance > data['close'].iloc[i]:  # Buy signal
-            position = balance / data['close'].iloc[i]
+    trades = 0
+    for j in np.flatnonzero(signals[:-1]):
+        price = close[j + 1]
+        if signals[j] == BUY and balance > price:  # Buy signal
+            position = balance / price
             balance = 0
-        elif signal == 'sell' and position > 0:  # Sell signal
-            balance = position * data['close'].iloc[i]
+            trades += 1
+        elif signals[j] == SELL and position > 0:  # Sell signal
+            balance = position * price
             position = 0
+            trades += 1
 
     return {
         "final_balance": balance,
         "total_profit": balance - initial_balance,
-        "total_trades": len([s for s in strategy_function(data) if s in ['buy', 'sell']])
+        "total_trades": trades
     }
@@ -0,0 +1,189 @@
+# File path: CryptIQ-Micro-Frontend/services/trading-service/batch_indicators.py
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+"""
+Batch Multi-Symbol Indicator Engine
+
+Computes RSI, EMA, MACD, Bollinger Bands and ATR for many symbols in one call on
+a (symbols x bars) matrix, oldest bar first. Recursive indicators step through
+the bars once with every operation vectorized across symbols; windowed ones are
+fully vectorized. Outputs have the same shape as the input, NaN during warm-up,
+and match TA-Lib's defaults row by row. A NaN in a row propagates through that
+row's recursive indicators, so rows should cover the same fully populated bars.
+"""
+
+
+def _as_matrix(values) -> np.ndarray:
+    matrix = np.asarray(values, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    if matrix.ndim != 2:
+        raise ValueError("Expected a (symbols x bars) matrix.")
+    return matrix
+
+
+def _recurse(inputs: np.ndarray, decay: float, seed: np.ndarray) -> np.ndarray:
+    """
+    First-order recursion y[t] = decay * y[t - 1] + inputs[t], y[0] = seed, stepped
+    once per bar over a bar-major (bars x symbols) buffer so each step is one
+    contiguous vector operation across all symbols.
+    """
+    out = np.empty((inputs.shape[1], inputs.shape[0]))
+    out[0] = seed
+    steps = np.ascontiguousarray(inputs.T)
+    for t in range(1, len(out)):
+        np.multiply(out[t - 1], decay, out=out[t])
+        out[t] += steps[t]
+    return out.T
+
+
+def _ema_from(matrix: np.ndarray, period: int, start: int, seed: np.ndarray) -> np.ndarray:
+    """
+    EMA seeded with `seed` at column `start` and stepped forward across all rows at once.
+    """
+    alpha = 2.0 / (period + 1)
+    out = np.full(matrix.shape, np.nan)
+    out[:, start:] = _recurse(alpha * matrix[:, start:], 1.0 - alpha, seed)
+    return out
+
+
+def batch_ema(prices, timeperiod: int = 20) -> np.ndarray:
+    """
+    Exponential moving average for every row.
+    """
+    prices = _as_matrix(prices)
+    if prices.shape[1] < timeperiod:
+        return np.full(prices.shape, np.nan)
+    return _ema_from(prices, timeperiod, timeperiod - 1, prices[:, :timeperiod].mean(axis=1))
+
+
+def batch_rsi(prices, timeperiod: int = 14) -> np.ndarray:
+    """
+    Wilder's RSI for every row.
+    """
+    prices = _as_matrix(prices)
+    out = np.full(prices.shape, np.nan)
+    if prices.shape[1] <= timeperiod:
+        return out
+
+    change = np.diff(prices, axis=1)
+    gains = np.clip(change, 0, None)
+    losses = np.clip(-change, 0, None)
+    decay = (timeperiod - 1) / timeperiod
+    avg_gain = _recurse(gains[:, timeperiod - 1:] / timeperiod, decay, gains[:, :timeperiod].mean(axis=1))
+    avg_loss = _recurse(losses[:, timeperiod - 1:] / timeperiod, decay, losses[:, :timeperiod].mean(axis=1))
+
+    total = avg_gain + avg_loss
+    with np.errstate(invalid='ignore', divide='ignore'):
+        out[:, timeperiod:] = np.where(total != 0, 100.0 * avg_gain / total, 0.0)
+    return out
+
+
+def batch_macd(prices, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram for every row.
+    Both EMAs start on bar slowperiod - 1, as in TA-Lib.
+    """
+    prices = _as_matrix(prices)
+    nan = np.full(prices.shape, np.nan)
+    start = slowperiod - 1
+    if prices.shape[1] < slowperiod + signalperiod - 1:
+        return nan, nan.copy(), nan.copy()
+
+    fast = _ema_from(prices, fastperiod, start, prices[:, slowperiod - fastperiod:slowperiod].mean(axis=1))
+    slow = _ema_from(prices, slowperiod, start, prices[:, :slowperiod].mean(axis=1))
+    macd = fast - slow
+
+    signal = np.full(prices.shape, np.nan)
+    signal[:, start:] = batch_ema(macd[:, start:], signalperiod)
+    # TA-Lib reports all three lines from the first bar where the signal is defined
+    first = start + signalperiod - 1
+    macd[:, :first] = np.nan
+    return macd, signal, macd - signal
+
+
+def batch_bbands(prices, timeperiod: int = 20, nbdevup: float = 2.0, nbdevdn: float = 2.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Upper, middle and lower Bollinger Bands (SMA +/- population std) for every row.
+    """
+    prices = _as_matrix(prices)
+    upper, middle, lower = (np.full(prices.shape, np.nan) for _ in range(3))
+    if prices.shape[1] < timeperiod:
+        return upper, middle, lower
+
+    # Rolling sums from cumulative sums; centring each row on its mean keeps the
+    # E[x^2] - E[x]^2 variance well conditioned
+    offset = prices.mean(axis=1, keepdims=True)
+    centred = prices - offset
+    sums = np.cumsum(np.pad(centred, ((0, 0), (1, 0))), axis=1)
+    sums_sq = np.cumsum(np.pad(centred * centred, ((0, 0), (1, 0))), axis=1)
+    window_sum = sums[:, timeperiod:] - sums[:, :-timeperiod]
+    window_sum_sq = sums_sq[:, timeperiod:] - sums_sq[:, :-timeperiod]
+    centred_mean = window_sum / timeperiod
+    std = np.sqrt(np.clip(window_sum_sq / timeperiod - centred_mean * centred_mean, 0, None))
+    mean = centred_mean + offset
+    middle[:, timeperiod - 1:] = mean
+    upper[:, timeperiod - 1:] = mean + nbdevup * std
+    lower[:, timeperiod - 1:] = mean - nbdevdn * std
+    return upper, middle, lower
+
+
+def batch_atr(high, low, close, timeperiod: int = 14) -> np.ndarray:
+    """
+    Wilder's Average True Range for every row.
+    """
+    high, low, close = _as_matrix(high), _as_matrix(low), _as_matrix(close)
+    out = np.full(close.shape, np.nan)
+    if close.shape[1] <= timeperiod:
+        return out
+
+    prev_close = close[:, :-1]
+    true_range = np.maximum.reduce([
+        high[:, 1:] - low[:, 1:],
+        np.abs(high[:, 1:] - prev_close),
+        np.abs(low[:, 1:] - prev_close),
+    ])
+    decay = (timeperiod - 1) / timeperiod
+    out[:, timeperiod:] = _recurse(true_range[:, timeperiod - 1:] / timeperiod, decay,
+                                   true_range[:, :timeperiod].mean(axis=1))
+    return out
+
+
+def stack_ohlcv(frames: Dict[str, pd.DataFrame], column: str = 'close', bars: Optional[int] = None) -> Tuple[List[str], np.ndarray]:
+    """
+    Stack one column of several symbols' candles into a (symbols x bars) matrix.
+    Rows are right-aligned on the most recent bar and trimmed to the shortest
+    history (or to `bars` if given).
+    Args:
+        frames: OHLCV DataFrame per symbol.
+        column: Column to stack.
+        bars: Number of most recent bars to keep.
+    """
+    symbols = list(frames)
+    if not symbols:
+        return symbols, np.empty((0, 0))
+    length = min(len(frames[s]) for s in symbols)
+    if bars is not None:
+        length = min(length, bars)
+    matrix = np.empty((len(symbols), length))
+    for row, symbol in enumerate(symbols):
+        matrix[row] = frames[symbol][column].to_numpy(dtype=np.float64)[len(frames[symbol]) - length:]
+    return symbols, matrix
+
+
+# Batch counterparts of the single-series indicators, keyed by the names used in the registries
+batch_indicator_registry = {
+    'RSI': lambda m: batch_rsi(m['close'], timeperiod=14),
+    'EMA': lambda m: batch_ema(m['close'], timeperiod=20),
+    'MACD': lambda m: batch_macd(m['close'], fastperiod=12, slowperiod=26, signalperiod=9),
+    'BollingerBands': lambda m: batch_bbands(m['close'], timeperiod=20),
+    'ATR': lambda m: batch_atr(m['high'], m['low'], m['close'], timeperiod=14),
+}
+
+# Example Usage:
+# symbols, closes = stack_ohlcv(candles_by_symbol, 'close', bars=500)
+# rsi = batch_rsi(closes)          # shape (len(symbols), 500)
+# latest_rsi = dict(zip(symbols, rsi[:, -1]))
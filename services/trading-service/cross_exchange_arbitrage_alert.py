@@ -2,13 +2,15 @@
 
 import ccxt
 import smtplib
+from services.common.market_data_gateway import MarketDataGateway, market_data_gateway
 
 """
 Cross-Exchange Arbitrage Alert System
 """
 
 class CrossExchangeArbitrageAlert:
-    def __init__(self, exchanges: list, trading_pair: str, email: str, smtp_server: str, smtp_port: int, smtp_user: str, smtp_pass: str):
+    def __init__(self, exchanges: list, trading_pair: str, email: str, smtp_server: str, smtp_port: int, smtp_user: str, smtp_pass: str,
+                 gateway: MarketDataGateway = market_data_gateway):
         self.exchanges = exchanges
         self.trading_pair = trading_pair
         self.email = email
@@ -16,19 +18,18 @@ class CrossExchangeArbitrageAlert:
         self.smtp_port = smtp_port
         self.smtp_user = smtp_user
         self.smtp_pass = smtp_pass
+        self.gateway = gateway
+        self.last_snapshot = None
 
     def fetch_prices(self):
         """
-        Fetch prices from all specified exchanges.
+        Fetch prices from all specified exchanges concurrently.
+        The timestamped quotes are kept in last_snapshot.
         """
-        prices = {}
-        for exchange in self.exchanges:
-            try:
-                ticker = exchange.fetch_ticker(self.trading_pair)
-                prices[exchange.name] = ticker['last']
-            except Exception as e:
-                print(f"Error fetching price from {exchange.name}: {e}")
-        return prices
+        self.last_snapshot = self.gateway.run(self.gateway.fetch_tickers(self.exchanges, self.trading_pair))
+        for venue, error in self.last_snapshot.errors().items():
+            print(f"Error fetching price from {venue}: {error}")
+        return {venue: ticker['last'] for venue, ticker in self.last_snapshot.ok().items()}
 
     def detect_arbitrage_opportunity(self):
         """
@@ -2,11 +2,14 @@
 
 import talib
 import pandas as pd
-from typing import Callable, Dict
+from typing import Callable, Dict, Hashable, Mapping, Tuple, Union
+from streaming_indicators import StreamingATR, StreamingBollingerBands, StreamingEMA, StreamingIndicator, StreamingMACD, StreamingRSI
 
 class IndicatorFactory:
     def __init__(self):
         self.indicators: Dict[str, Callable] = {}
+        self.streaming_indicators: Dict[str, Callable[[], StreamingIndicator]] = {}
+        self.streams: Dict[Tuple[Hashable, str], StreamingIndicator] = {}
 
     def register_indicator(self, name: str, function: Callable):
         """
@@ -14,6 +17,12 @@ class IndicatorFactory:
         """
         self.indicators[name] = function
 
+    def register_streaming_indicator(self, name: str, constructor: Callable[[], StreamingIndicator]):
+        """
+        Registers the incremental counterpart of an indicator.
+        """
+        self.streaming_indicators[name] = constructor
+
     def calculate(self, indicator_name: str, data: pd.DataFrame):
         """
         Calculate the specified indicator.
@@ -23,9 +32,36 @@ class IndicatorFactory:
         else:
             raise ValueError(f"Indicator '{indicator_name}' not found!")
 
+    def seed(self, indicator_name: str, key: Hashable, data: pd.DataFrame):
+        """
+        Start (or restart) a streaming indicator for `key` (e.g. a symbol) from history.
+        Returns the latest value.
+        """
+        if indicator_name not in self.streaming_indicators:
+            raise ValueError(f"Streaming indicator '{indicator_name}' not found!")
+        stream = self.streaming_indicators[indicator_name]()
+        self.streams[(key, indicator_name)] = stream
+        return stream.seed(data)
+
+    def update(self, indicator_name: str, key: Hashable, bar: Union[float, Mapping[str, float]]):
+        """
+        Feed one new bar to a seeded streaming indicator in O(1) and return its value.
+        """
+        stream = self.streams.get((key, indicator_name))
+        if stream is None:
+            raise ValueError(f"Streaming indicator '{indicator_name}' has not been seeded for {key!r}!")
+        return stream.update_bar(bar)
+
 # Initialize indicator factory
 factory = IndicatorFactory()
 
 # Register common indicators
 factory.register_indicator('RSI', lambda data: talib.RSI(data['close'], timeperiod=14))
 factory.register_indicator('EMA', lambda data: talib.EMA(data['close'], timeperiod=20))
+
+# Register incremental counterparts for live updates
+factory.register_streaming_indicator('RSI', lambda: StreamingRSI(14))
+factory.register_streaming_indicator('EMA', lambda: StreamingEMA(20))
+factory.register_streaming_indicator('MACD', lambda: StreamingMACD(12, 26, 9))
+factory.register_streaming_indicator('BollingerBands', lambda: StreamingBollingerBands(20))
+factory.register_streaming_indicator('ATR', lambda: StreamingATR(14))
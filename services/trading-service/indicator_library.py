@@ -2,6 +2,9 @@
 
 import talib
 import pandas as pd
+from streaming_indicators import streaming_registry
+from batch_indicators import batch_indicator_registry
+from services.common.indicator_cache import indicator_cache
 
 # Indicator function registry
 indicator_registry = {
@@ -10,12 +13,41 @@ indicator_registry = {
     'BollingerBands': lambda data: talib.BBANDS(data['close'], timeperiod=20),
 }
 
-def calculate_indicator(data: pd.DataFrame, indicator_name: str):
+def calculate_indicator(data: pd.DataFrame, indicator_name: str, symbol: str = None, timeframe: str = None):
     """
     Dynamically calculates the requested indicator.
+    Results are memoized in the shared indicator cache and, when only new candles
+    were appended, extended through the indicator's streaming counterpart.
     """
     indicator_function = indicator_registry.get(indicator_name)
     if indicator_function:
-        return indicator_function(data)
+        return indicator_cache.get(data, indicator_name, indicator_function, symbol=symbol, timeframe=timeframe,
+                                   incremental=streaming_registry.get(indicator_name))
     else:
         raise ValueError(f"Indicator {indicator_name} not found in the registry.")
+
+def create_streaming_indicator(indicator_name: str, data: pd.DataFrame = None):
+    """
+    Creates an incremental indicator, optionally seeded from history.
+    Feed new candles with `indicator.update_bar(candle)`.
+    """
+    constructor = streaming_registry.get(indicator_name)
+    if constructor is None:
+        raise ValueError(f"Streaming indicator {indicator_name} not found in the registry.")
+    indicator = constructor()
+    if data is not None:
+        indicator.seed(data)
+    return indicator
+
+def calculate_batch_indicator(matrices: dict, indicator_name: str):
+    """
+    Calculates the requested indicator for many symbols in one vectorized call.
+    Args:
+        matrices: (symbols x bars) arrays keyed by column name ('close', and 'high'/'low' for ATR).
+        indicator_name: Name of the indicator.
+    """
+    indicator_function = batch_indicator_registry.get(indicator_name)
+    if indicator_function:
+        return indicator_function(matrices)
+    else:
+        raise ValueError(f"Batch indicator {indicator_name} not found in the registry.")
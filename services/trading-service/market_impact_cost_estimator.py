@@ -1,6 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/market_impact_cost_estimator.py
 
 import pandas as pd
+from services.common.order_book import OrderBook
 
 """
 Market Impact Cost Estimator
@@ -15,8 +16,14 @@ class MarketImpactCostEstimator:
         Estimate market impact cost based on order volume and market depth.
         Args:
             volume: Volume of the order to execute.
-            market_depth: DataFrame containing 'price' and 'volume' columns.
+            market_depth: DataFrame containing 'price' and 'volume' columns, or an OrderBook (buy side).
         """
+        if isinstance(market_depth, OrderBook):
+            impact_price = market_depth.impact_price(volume, 'buy')
+            if impact_price is None:
+                return "Insufficient liquidity for this volume"
+            return (impact_price - market_depth.best_ask()[0]) * self.impact_coefficient
+
         cumulative_volume = market_depth['volume'].cumsum()
         price_impact_index = cumulative_volume.searchsorted(volume)
         
@@ -2,28 +2,27 @@
 
 import ccxt
 import pandas as pd
+from services.common.market_data_gateway import MarketDataGateway, market_data_gateway
 
 """
 Multi-Exchange Market Scanner
 """
 
 class MultiExchangeMarketScanner:
-    def __init__(self, exchanges: list, trading_pair: str):
+    def __init__(self, exchanges: list, trading_pair: str, gateway: MarketDataGateway = market_data_gateway):
         self.exchanges = exchanges
         self.trading_pair = trading_pair
+        self.gateway = gateway
+        self.last_snapshot = None
 
     def fetch_prices(self):
         """
-        Fetch prices from all specified exchanges for a given trading pair.
+        Fetch prices from all specified exchanges for a given trading pair, concurrently.
+        The timestamped quotes are kept in last_snapshot.
         """
-        prices = {}
-        for exchange in self.exchanges:
-            try:
-                ticker = exchange.fetch_ticker(self.trading_pair)
-                prices[exchange.name] = ticker['last']
-            except Exception as e:
-                prices[exchange.name] = f"Error: {e}"
-        return prices
+        self.last_snapshot = self.gateway.run(self.gateway.fetch_tickers(self.exchanges, self.trading_pair))
+        return {venue: quote.data['last'] if quote.ok else f"Error: {quote.error}"
+                for venue, quote in self.last_snapshot.quotes.items()}
 
     def scan_for_arbitrage(self):
         """
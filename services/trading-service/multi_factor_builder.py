@@ -2,6 +2,7 @@
 
 import pandas as pd
 import talib
+from services.common.indicator_cache import indicator_cache
 
 """
 Multi-Factor Strategy Builder
@@ -17,13 +18,16 @@ class MultiFactorStrategy:
         """
         self.indicators.append((indicator_name, indicator_function))
 
-    def evaluate_strategy(self, data: pd.DataFrame):
+    def evaluate_strategy(self, data: pd.DataFrame, symbol: str = None, timeframe: str = None):
         """
         Evaluate the strategy using all defined indicators.
+        Indicator results are memoized in the shared indicator cache, so candles
+        that haven't changed since the last call are not recomputed.
         """
         signals = []
         for name, func in self.indicators:
-            signals.append(func(data))
+            signals.append(indicator_cache.get(data, name, func, params={'function': func},
+                                               symbol=symbol, timeframe=timeframe))
         return signals
 
 # Indicator functions
@@ -1,11 +1,70 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/multi_strategy_backtesting_framework.py
 
+import os
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from parameter_sweep import SharedOHLCV
 
 """
 Multi-Strategy Backtesting Framework
 """
 
+# Per-worker state for batch mode, populated by the pool initializer
+_worker_state: Dict = {}
+
+
+def walk_forward_windows(length: int, window_size: Optional[int] = None, step: Optional[int] = None,
+                         anchored: bool = False) -> List[Tuple[int, int]]:
+    """
+    Split a history of `length` bars into walk-forward (start, end) windows.
+    Args:
+        length: Number of bars in the history.
+        window_size: Bars per window (None for a single window over the full history).
+        step: Bars between consecutive window ends (defaults to window_size).
+        anchored: Grow every window from bar 0 instead of rolling a fixed-size window.
+    """
+    if not window_size or window_size >= length:
+        return [(0, length)]
+    step = step or window_size
+    return [(0 if anchored else end - window_size, end) for end in range(window_size, length + 1, step)]
+
+
+def _init_batch_worker(strategies: Dict[str, Callable], descriptors: Dict[str, Dict]):
+    """
+    descriptors holds a SharedOHLCV descriptor per symbol, or the DataFrame itself when it could not be shared.
+    """
+    frames = {symbol: data for symbol, data in descriptors.items() if isinstance(data, pd.DataFrame)}
+    _worker_state.update(strategies=strategies, descriptors=descriptors, frames=frames, segments=[])
+
+
+def _run_cell(cell: Tuple[str, str, int, int, int], initial_capital: float):
+    strategy_name, symbol, window, start, end = cell
+    frames = _worker_state['frames']
+    if symbol not in frames:
+        frames[symbol], segments = SharedOHLCV.attach(_worker_state['descriptors'][symbol])
+        _worker_state['segments'].extend(segments)
+    return _evaluate_cell(_worker_state['strategies'][strategy_name], frames[symbol], cell, initial_capital)
+
+
+def _evaluate_cell(strategy_function: Callable, data: pd.DataFrame, cell: Tuple[str, str, int, int, int],
+                   initial_capital: float) -> Dict:
+    strategy_name, symbol, window, start, end = cell
+    row = {'strategy': strategy_name, 'symbol': symbol, 'window': window, 'start': start, 'end': end}
+    if end > start and not isinstance(data.index, pd.RangeIndex):
+        row.update(start_time=data.index[start], end_time=data.index[end - 1])
+    try:
+        result = strategy_function(data.iloc[start:end], initial_capital)
+    except Exception as e:
+        row['error'] = str(e)
+        return row
+    if isinstance(result, dict):
+        row.update(result)
+    else:
+        row['result'] = result
+    return row
+
+
 class MultiStrategyBacktestingFramework:
     def __init__(self):
         self.strategies = {}
@@ -31,6 +90,74 @@ class MultiStrategyBacktestingFramework:
             results[strategy_name] = strategy_function(price_data, initial_capital)
         return results
 
+    def iter_batch(self, datasets: Dict[str, pd.DataFrame], initial_capital: float = 10000,
+                   window_size: Optional[int] = None, step: Optional[int] = None, anchored: bool = False,
+                   workers: Optional[int] = 1) -> Iterator[Dict]:
+        """
+        Backtest every strategy x symbol x walk-forward window cell, yielding each
+        result row as soon as its cell finishes (completion order, not submission order).
+        Args:
+            datasets: Historical price data per symbol.
+            initial_capital: Initial capital for every cell.
+            window_size: Bars per walk-forward window (None for the full history).
+            step: Bars between consecutive windows (defaults to window_size).
+            anchored: Grow windows from the first bar instead of rolling them.
+            workers: Worker processes; 1 (default) runs in-process, None uses the CPU count.
+                A process pool is opt-in, and strategies must be picklable when workers > 1.
+        """
+        cells = [
+            (strategy_name, symbol, window, start, end)
+            for symbol, data in datasets.items()
+            for window, (start, end) in enumerate(walk_forward_windows(len(data), window_size, step, anchored))
+            for strategy_name in self.strategies
+        ]
+        workers = workers if workers is not None else os.cpu_count() or 1
+
+        if workers == 1 or len(cells) <= 1:
+            for cell in cells:
+                yield _evaluate_cell(self.strategies[cell[0]], datasets[cell[1]], cell, initial_capital)
+            return
+
+        shared = {}
+        pool = None
+        try:
+            descriptors = {}
+            for symbol, data in datasets.items():
+                try:
+                    shared[symbol] = SharedOHLCV(data)
+                    descriptors[symbol] = shared[symbol].descriptor
+                except TypeError:
+                    # Object or timezone-aware columns: pickle the frame to each worker once instead
+                    descriptors[symbol] = data
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                       initargs=(self.strategies, descriptors))
+            futures = [pool.submit(_run_cell, cell, initial_capital) for cell in cells]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            if pool is not None:
+                # An abandoned generator drops the queued cells; only running ones are waited for
+                pool.shutdown(wait=True, cancel_futures=True)
+            for block in shared.values():
+                block.close()
+
+    def backtest_batch(self, datasets: Dict[str, pd.DataFrame], initial_capital: float = 10000,
+                       window_size: Optional[int] = None, step: Optional[int] = None, anchored: bool = False,
+                       workers: Optional[int] = 1, on_result: Optional[Callable[[Dict], None]] = None) -> pd.DataFrame:
+        """
+        Run the full strategies x symbols x windows matrix and return a tidy results table,
+        one row per cell. `on_result` is called with each row as it streams in.
+        """
+        rows = []
+        for row in self.iter_batch(datasets, initial_capital, window_size, step, anchored, workers):
+            if on_result:
+                on_result(row)
+            rows.append(row)
+        table = pd.DataFrame(rows)
+        if rows:
+            table = table.sort_values(['strategy', 'symbol', 'window'], ignore_index=True)
+        return table
+
 # Example usage
 def dummy_strategy(data, capital):
     return f"Dummy strategy result with {capital}"
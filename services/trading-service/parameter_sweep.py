@@ -0,0 +1,261 @@
+# File path: CryptIQ-Micro-Frontend/services/trading-service/parameter_sweep.py
+
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+"""
+Parallel Parameter-Sweep Engine
+
+Evaluates strategy configurations in grid, random or successive-halving mode.
+Configs are deduplicated and their results cached; evaluations fan out over a
+process pool (opt-in, workers > 1) whose workers attach to the OHLCV columns
+through shared memory instead of receiving a pickled DataFrame per task.
+Frames with columns that cannot be shared (object or timezone-aware) are
+pickled to each worker once instead.
+"""
+
+
+class SharedOHLCV:
+    """
+    Places each column (and the index) of a DataFrame in its own shared-memory
+    segment. The descriptor is small and picklable; workers rebuild a DataFrame
+    over the shared buffers without copying.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.segments: List[shared_memory.SharedMemory] = []
+        try:
+            columns = []
+            for name in data.columns:
+                columns.append((name,) + self._share(data[name].to_numpy()))
+            index = None
+            if not isinstance(data.index, pd.RangeIndex):
+                index = (data.index.name,) + self._share(data.index.to_numpy())
+        except TypeError:
+            self.close()
+            raise
+        self.descriptor = {'length': len(data), 'columns': columns, 'index': index}
+
+    def _share(self, values: np.ndarray) -> Tuple[str, str]:
+        if values.dtype.kind not in 'biufmM':
+            raise TypeError(f"Column of dtype {values.dtype} cannot be placed in shared memory.")
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        np.ndarray(values.shape, dtype=values.dtype, buffer=segment.buf)[:] = values
+        self.segments.append(segment)
+        return segment.name, values.dtype.str
+
+    @staticmethod
+    def attach(descriptor: Dict) -> Tuple[pd.DataFrame, List[shared_memory.SharedMemory]]:
+        """
+        Rebuild a read-only DataFrame over the shared buffers.
+        The returned segments must be kept alive as long as the DataFrame is used.
+        """
+        length = descriptor['length']
+        segments = []
+
+        def view(segment_name, dtype):
+            segment = shared_memory.SharedMemory(name=segment_name)
+            segments.append(segment)
+            array = np.ndarray((length,), dtype=np.dtype(dtype), buffer=segment.buf)
+            array.flags.writeable = False
+            return array
+
+        frame = pd.DataFrame({name: view(seg, dtype) for name, seg, dtype in descriptor['columns']}, copy=False)
+        if descriptor['index'] is not None:
+            name, seg, dtype = descriptor['index']
+            frame.index = pd.Index(view(seg, dtype), name=name, copy=False)
+        return frame, segments
+
+    def close(self):
+        """
+        Release and unlink all segments.
+        """
+        for segment in self.segments:
+            segment.close()
+            segment.unlink()
+        self.segments = []
+
+
+# Per-worker state, populated once by the pool initializer
+_worker_state: Dict = {}
+
+
+def _init_worker(shared_data, strategy_function: Callable):
+    """
+    shared_data is a SharedOHLCV descriptor, or the DataFrame itself when it could not be shared.
+    """
+    if isinstance(shared_data, pd.DataFrame):
+        data, segments = shared_data, []
+    else:
+        data, segments = SharedOHLCV.attach(shared_data)
+    _worker_state.update(data=data, segments=segments, strategy=strategy_function)
+
+
+def _evaluate_in_worker(task: Tuple[Tuple, Optional[int]]) -> float:
+    config_key, n_bars = task
+    data = _worker_state['data']
+    if n_bars is not None:
+        data = data.iloc[-n_bars:]
+    return _worker_state['strategy'](data, dict(config_key))
+
+
+def config_key(config: Dict) -> Tuple:
+    """
+    Hashable, order-independent identity of a parameter configuration.
+    """
+    return tuple(sorted(config.items()))
+
+
+class ParameterSweep:
+    def __init__(self, strategy_function: Callable, data: pd.DataFrame, param_ranges: Dict[str, list],
+                 workers: Optional[int] = 1):
+        """
+        Args:
+            strategy_function: Function (data, config) -> performance; must be picklable
+                (module-level) when workers > 1.
+            data: Historical OHLCV data.
+            param_ranges: Candidate values per parameter.
+            workers: Worker processes; 1 (default) evaluates in-process, None uses the CPU count.
+        """
+        self.strategy_function = strategy_function
+        self.data = data
+        self.param_ranges = {param: list(dict.fromkeys(values)) for param, values in param_ranges.items()}
+        self.workers = workers if workers is not None else os.cpu_count() or 1
+        self.cache: Dict[Tuple[Tuple, Optional[int]], float] = {}
+        self._shared: Optional[SharedOHLCV] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """
+        Shut down the worker pool and release shared memory.
+        """
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            try:
+                self._shared = SharedOHLCV(self.data)
+                shared_data = self._shared.descriptor
+            except TypeError:
+                shared_data = self.data
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(shared_data, self.strategy_function),
+            )
+        return self._pool
+
+    @property
+    def grid_size(self) -> int:
+        return math.prod(len(values) for values in self.param_ranges.values())
+
+    def grid_configs(self) -> List[Dict]:
+        """
+        Every combination of the parameter ranges.
+        """
+        params = list(self.param_ranges)
+        return [dict(zip(params, values)) for values in itertools.product(*self.param_ranges.values())]
+
+    def random_configs(self, iterations: int, seed: Optional[int] = None) -> List[Dict]:
+        """
+        Up to `iterations` distinct configurations drawn without replacement.
+        """
+        rng = random.Random(seed)
+        params = list(self.param_ranges)
+        sizes = [len(self.param_ranges[p]) for p in params]
+        picks = rng.sample(range(self.grid_size), min(iterations, self.grid_size))
+        configs = []
+        for flat in picks:
+            config = {}
+            for param, size in zip(reversed(params), reversed(sizes)):
+                flat, position = divmod(flat, size)
+                config[param] = self.param_ranges[param][position]
+            configs.append({param: config[param] for param in params})
+        return configs
+
+    def evaluate(self, configs: List[Dict], n_bars: Optional[int] = None) -> List[Tuple[Dict, float]]:
+        """
+        Evaluate configurations, skipping duplicates and cached results.
+        Args:
+            configs: Configurations to evaluate.
+            n_bars: Evaluate on the most recent n bars only (None for the full history).
+        """
+        keys = list(dict.fromkeys(config_key(config) for config in configs))
+        pending = [(key, n_bars) for key in keys if (key, n_bars) not in self.cache]
+
+        if pending:
+            if self.workers == 1 or len(pending) == 1:
+                data = self.data if n_bars is None else self.data.iloc[-n_bars:]
+                scores = [self.strategy_function(data, dict(key)) for key, _ in pending]
+            else:
+                chunksize = max(1, len(pending) // (self.workers * 4))
+                scores = list(self._get_pool().map(_evaluate_in_worker, pending, chunksize=chunksize))
+            self.cache.update(zip(pending, scores))
+
+        return [(dict(key), self.cache[(key, n_bars)]) for key in keys]
+
+    def successive_halving(self, configs: List[Dict], min_bars: Optional[int] = None, eta: int = 3) -> List[Tuple[Dict, float]]:
+        """
+        Evaluate all configs on a short trailing window, keep the best 1/eta and
+        grow the window by eta until the survivors are scored on the full history.
+        Args:
+            configs: Starting configurations.
+            min_bars: Bars used in the first rung (defaults to len(data) / eta ** rungs).
+            eta: Reduction factor between rungs.
+        """
+        total = len(self.data)
+        survivors = list({config_key(c): c for c in configs}.values())
+        rungs = max(0, math.floor(math.log(max(len(survivors), 1), eta)))
+        n_bars = min_bars or max(1, total // eta ** rungs)
+
+        while True:
+            window = None if n_bars >= total else n_bars
+            results = sorted(self.evaluate(survivors, window), key=lambda r: r[1], reverse=True)
+            if window is None:
+                return results
+            survivors = [config for config, _ in results[:max(1, len(results) // eta)]]
+            n_bars = total if len(survivors) == 1 else n_bars * eta
+
+    def run(self, mode: str = 'grid', iterations: int = 100, seed: Optional[int] = None, **kwargs) -> Tuple[Dict, float]:
+        """
+        Run a sweep and return the best configuration and its performance.
+        Args:
+            mode: 'grid', 'random' or 'halving'.
+            iterations: Number of configurations for random mode (starting pool for halving).
+            seed: Random seed for random and halving modes.
+        """
+        if mode == 'grid':
+            results = self.evaluate(self.grid_configs())
+        elif mode == 'random':
+            results = self.evaluate(self.random_configs(iterations, seed))
+        elif mode == 'halving':
+            results = self.successive_halving(self.random_configs(iterations, seed), **kwargs)
+        else:
+            raise ValueError(f"Unknown sweep mode '{mode}'")
+
+        if not results:
+            return None, -float('inf')
+        return max(results, key=lambda r: r[1])
+
+# Example Usage:
+# with ParameterSweep(my_strategy, data, {"rsi_period": [10, 14, 20], "ema_short": [5, 10]}) as sweep:
+#     best_config, best_performance = sweep.run(mode='halving', iterations=200)
@@ -2,21 +2,31 @@
 
 import pandas as pd
 import talib
+from services.common.indicator_cache import indicator_cache
 
 """
 Pattern Recognition Engine
 """
 
-def detect_candlestick_patterns(data: pd.DataFrame):
+def detect_candlestick_patterns(data: pd.DataFrame, symbol: str = None, timeframe: str = None):
     """
     Detects common candlestick patterns in OHLCV data.
     Args:
         data: DataFrame with 'open', 'high', 'low', 'close' columns.
+        symbol: Series identity for the shared indicator cache.
+        timeframe: Candle timeframe for the shared indicator cache.
     """
+    pattern_functions = {
+        "Doji": talib.CDLDOJI,
+        "Hammer": talib.CDLHAMMER,
+        "Engulfing": talib.CDLENGULFING,
+    }
     patterns = {
-        "Doji": talib.CDLDOJI(data['open'], data['high'], data['low'], data['close']),
-        "Hammer": talib.CDLHAMMER(data['open'], data['high'], data['low'], data['close']),
-        "Engulfing": talib.CDLENGULFING(data['open'], data['high'], data['low'], data['close']),
+        pattern: indicator_cache.get(
+            data, pattern, lambda d, f=function: f(d['open'], d['high'], d['low'], d['close']),
+            symbol=symbol, timeframe=timeframe
+        )
+        for pattern, function in pattern_functions.items()
     }
 
     detected_patterns = {pattern: values[values != 0] for pattern, values in patterns.items()}
@@ -1,7 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/risk_management_advisor.py
 
 import pandas as pd
-from transformers import pipeline
+from services.common.model_registry import pipeline
 
 """
 AI-Powered Risk Management Advisor
@@ -1,6 +1,7 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/smart_order_routing.py
 
 import ccxt
+from services.common.order_book import OrderBook
 
 """
 Smart Order Routing for Best Execution
@@ -27,20 +28,30 @@ class SmartOrderRouter:
     def get_best_execution(self, amount: float, action: str):
         """
         Get the best exchange for executing a trade (either buy or sell).
+        Venues are compared on the average fill price for the full amount, so thin top levels don't win.
+        If no venue can fill the full amount, the deepest one is returned, priced over the depth it has.
         """
         order_books = self.fetch_all_order_books()
         best_exchange = None
         best_price = float('inf') if action == 'buy' else -float('inf')
+        deepest = None  # (depth, average price, exchange) of the deepest venue too thin for the amount
 
         for exchange_name, book in order_books.items():
             if isinstance(book, dict) and len(book['bids']) > 0 and len(book['asks']) > 0:
-                if action == 'buy' and book['asks'][0][0] < best_price:
-                    best_price = book['asks'][0][0]
-                    best_exchange = exchange_name
-                elif action == 'sell' and book['bids'][0][0] > best_price:
-                    best_price = book['bids'][0][0]
+                side = OrderBook.from_ccxt(book, exchange_name).side('asks' if action == 'buy' else 'bids')
+                price = side.vwap(amount)
+                if price is None:
+                    prices, sizes = side.levels()
+                    depth = float(sizes.sum())
+                    if deepest is None or depth > deepest[0]:
+                        deepest = (depth, float((prices * sizes).sum()) / depth, exchange_name)
+                    continue
+                if (action == 'buy' and price < best_price) or (action == 'sell' and price > best_price):
+                    best_price = price
                     best_exchange = exchange_name
 
+        if best_exchange is None and deepest is not None:
+            _, best_price, best_exchange = deepest
         return best_exchange, best_price
 
 # Example usage
@@ -1,34 +1,30 @@
 # File path: CryptIQ-Micro-Frontend/services/trading-service/strategy_optimizer.py
 
 import pandas as pd
-import random
+from typing import Dict, Optional
+from parameter_sweep import ParameterSweep
+
+# Default parameter ranges
+DEFAULT_PARAM_RANGES = {
+    "rsi_period": [10, 14, 20],
+    "ema_short": [5, 10, 15],
+    "ema_long": [20, 30, 50]
+}
 
 # Define a basic optimizer for strategy parameters
-def optimize_strategy(strategy_function, data: pd.DataFrame, iterations: int = 100):
+def optimize_strategy(strategy_function, data: pd.DataFrame, iterations: int = 100, mode: str = 'random',
+                      param_ranges: Optional[Dict[str, list]] = None, workers: Optional[int] = 1,
+                      seed: Optional[int] = None):
     """
-    Optimizes strategy parameters using a brute-force search.
+    Optimizes strategy parameters with the parallel parameter-sweep engine.
     Args:
-        strategy_function: Function to evaluate a trading strategy.
+        strategy_function: Function to evaluate a trading strategy (must be picklable for workers > 1).
         data: Historical OHLCV data.
-        iterations: Number of random configurations to test.
+        iterations: Number of distinct configurations to test in random/halving mode.
+        mode: 'grid', 'random' or 'halving' (successive halving).
+        param_ranges: Candidate values per parameter (defaults to DEFAULT_PARAM_RANGES).
+        workers: Worker processes (1 runs in-process; None uses the CPU count).
+        seed: Random seed for reproducible sampling.
     """
-    best_config = None
-    best_performance = -float('inf')
-    
-    # Define parameter ranges
-    param_ranges = {
-        "rsi_period": [10, 14, 20],
-        "ema_short": [5, 10, 15],
-        "ema_long": [20, 30, 50]
-    }
-
-    # Run optimization
-    for _ in range(iterations):
-        config = {param: random.choice(values) for param, values in param_ranges.items()}
-        performance = strategy_function(data, config)
-
-        if performance > best_performance:
-            best_performance = performance
-            best_config = config
-
-    return best_config, best_performance
+    with ParameterSweep(strategy_function, data, param_ranges or DEFAULT_PARAM_RANGES, workers=workers) as sweep:
+        return sweep.run(mode=mode, iterations=iterations, seed=seed)
@@ -0,0 +1,211 @@
+# File path: CryptIQ-Micro-Frontend/services/trading-service/streaming_indicators.py
+
+import math
+from collections import deque
+from typing import Dict, Mapping, Union
+
+import numpy as np
+import pandas as pd
+
+"""
+Incremental Streaming Indicator Engine
+
+Stateful, resumable RSI, EMA, MACD, Bollinger Bands and ATR. Each indicator
+is seeded once from history and then fed one bar at a time in O(1). After the
+warm-up period the values match TA-Lib's defaults for the same parameters;
+during warm-up `value` is NaN (or a dict of NaNs).
+"""
+
+Bar = Union[float, Mapping[str, float]]
+
+
+class StreamingIndicator:
+    """
+    Base class: subclasses implement update() for a single close price.
+    """
+
+    def update_bar(self, bar: Bar):
+        """
+        Feed one bar (a close price or a mapping with a 'close' key).
+        """
+        close = bar['close'] if isinstance(bar, Mapping) else bar
+        return self.update(float(close))
+
+    def seed(self, data: Union[pd.DataFrame, pd.Series, np.ndarray]):
+        """
+        Replay a history to warm up the indicator; returns the latest value.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = data['close']
+        for close in np.asarray(data, dtype=np.float64):
+            self.update(close)
+        return self.value
+
+
+class StreamingEMA(StreamingIndicator):
+    def __init__(self, period: int = 20):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.count = 0
+        self._seed_sum = 0.0
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        self.count += 1
+        if self.count < self.period:
+            self._seed_sum += close
+        elif self.count == self.period:
+            self.value = (self._seed_sum + close) / self.period
+        else:
+            self.value += self.alpha * (close - self.value)
+        return self.value
+
+
+class StreamingRSI(StreamingIndicator):
+    def __init__(self, period: int = 14):
+        self.period = period
+        self.count = 0
+        self.prev_close = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        self.value = math.nan
+
+    def update(self, close: float) -> float:
+        if self.prev_close is None:
+            self.prev_close = close
+            return self.value
+        change = close - self.prev_close
+        self.prev_close = close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self.count += 1
+
+        if self.count < self.period:
+            self.avg_gain += gain
+            self.avg_loss += loss
+            return self.value
+        if self.count == self.period:
+            self.avg_gain = (self.avg_gain + gain) / self.period
+            self.avg_loss = (self.avg_loss + loss) / self.period
+        else:
+            self.avg_gain = (self.avg_gain * (self.period - 1) + gain) / self.period
+            self.avg_loss = (self.avg_loss * (self.period - 1) + loss) / self.period
+
+        total = self.avg_gain + self.avg_loss
+        self.value = 100.0 * self.avg_gain / total if total else 0.0
+        return self.value
+
+
+class StreamingMACD(StreamingIndicator):
+    def __init__(self, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9):
+        self.fastperiod = fastperiod
+        self.slowperiod = slowperiod
+        # Both EMAs start on the same bar (as in TA-Lib), seeded from the trailing closes
+        self.warmup = deque(maxlen=slowperiod)
+        self.fast_alpha = 2.0 / (fastperiod + 1)
+        self.slow_alpha = 2.0 / (slowperiod + 1)
+        self.fast_ema = None
+        self.slow_ema = None
+        self.signal = StreamingEMA(signalperiod)
+        self.value = {'macd': math.nan, 'signal': math.nan, 'histogram': math.nan}
+
+    def update(self, close: float) -> Dict[str, float]:
+        if self.slow_ema is None:
+            self.warmup.append(close)
+            if len(self.warmup) < self.slowperiod:
+                return self.value
+            closes = list(self.warmup)
+            self.fast_ema = sum(closes[-self.fastperiod:]) / self.fastperiod
+            self.slow_ema = sum(closes) / self.slowperiod
+            self.warmup = None
+        else:
+            self.fast_ema += self.fast_alpha * (close - self.fast_ema)
+            self.slow_ema += self.slow_alpha * (close - self.slow_ema)
+
+        macd = self.fast_ema - self.slow_ema
+        signal = self.signal.update(macd)
+        if math.isnan(signal):
+            return self.value  # like TA-Lib, all three stay NaN until the signal EMA is seeded
+        self.value = {'macd': macd, 'signal': signal, 'histogram': macd - signal}
+        return self.value
+
+
+class StreamingBollingerBands(StreamingIndicator):
+    def __init__(self, timeperiod: int = 20, nbdevup: float = 2.0, nbdevdn: float = 2.0):
+        self.period = timeperiod
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self.window = deque(maxlen=timeperiod)
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.updates = 0
+        self.value = {'upper': math.nan, 'middle': math.nan, 'lower': math.nan}
+
+    def update(self, close: float) -> Dict[str, float]:
+        if len(self.window) == self.period:
+            oldest = self.window[0]
+            self.total -= oldest
+            self.total_sq -= oldest * oldest
+        self.window.append(close)
+        self.total += close
+        self.total_sq += close * close
+        self.updates += 1
+
+        # Re-sum once per window length so rounding drift in the running sums stays bounded
+        if self.updates % self.period == 0:
+            self.total = math.fsum(self.window)
+            self.total_sq = math.fsum(x * x for x in self.window)
+
+        if len(self.window) < self.period:
+            return self.value
+        mean = self.total / self.period
+        std = math.sqrt(max(self.total_sq / self.period - mean * mean, 0.0))
+        self.value = {'upper': mean + self.nbdevup * std, 'middle': mean, 'lower': mean - self.nbdevdn * std}
+        return self.value
+
+
+class StreamingATR(StreamingIndicator):
+    def __init__(self, timeperiod: int = 14):
+        self.period = timeperiod
+        self.count = 0
+        self.prev_close = None
+        self.tr_sum = 0.0
+        self.value = math.nan
+
+    def update_bar(self, bar: Mapping[str, float]) -> float:
+        return self.update(float(bar['high']), float(bar['low']), float(bar['close']))
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if self.prev_close is None:
+            self.prev_close = close
+            return self.value
+        true_range = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+        self.count += 1
+
+        if self.count < self.period:
+            self.tr_sum += true_range
+        elif self.count == self.period:
+            self.value = (self.tr_sum + true_range) / self.period
+        else:
+            self.value = (self.value * (self.period - 1) + true_range) / self.period
+        return self.value
+
+    def seed(self, data: pd.DataFrame) -> float:
+        for high, low, close in zip(*(data[c].to_numpy(dtype=np.float64) for c in ('high', 'low', 'close'))):
+            self.update(high, low, close)
+        return self.value
+
+
+# Streaming counterparts of the batch indicators, keyed by the names used in the registries
+streaming_registry = {
+    'RSI': lambda: StreamingRSI(14),
+    'EMA': lambda: StreamingEMA(20),
+    'MACD': lambda: StreamingMACD(12, 26, 9),
+    'BollingerBands': lambda: StreamingBollingerBands(20),
+    'ATR': lambda: StreamingATR(14),
+}
+
+# Example Usage:
+# rsi = StreamingRSI(14)
+# rsi.seed(history['close'])
+# latest = rsi.update(new_candle['close'])
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-import requests
+from services.common.http_client import http_client
 
 app = FastAPI()
 
@@ -16,13 +16,13 @@ async def get_wallet_balance(request: WalletRequest):
         balance = 42.0  # Replace this with actual Web3 logic
         
         # Fetch real-time crypto data from crypto-data-service
-        market_response = requests.get("http://localhost:5002/crypto-data")
+        market_response = await http_client.aget("http://localhost:5002/crypto-data")
         if market_response.status_code != 200:
             raise HTTPException(status_code=500, detail="Error fetching market data")
         market_data = market_response.json()
 
         # Get trade recommendations from market-analysis-service
-        analysis_response = requests.post("http://localhost:5003/analyze", json={"wallet_balance": balance})
+        analysis_response = await http_client.apost("http://localhost:5003/analyze", json={"wallet_balance": balance})
         if analysis_response.status_code != 200:
             raise HTTPException(status_code=500, detail="Error analyzing market trends")
         trade_recommendations = analysis_response.json()